@@ -7,8 +7,12 @@ import re
 import aiohttp
 from dotenv import load_dotenv
 
+from daily_ai_insight.collectors.coalesce import RequestCoalescer, post_page, request_key
+
 load_dotenv()
 
+FOLO_API = "https://api.follow.is/entries"
+
 
 def get_headers() -> dict:
     """Get Folo API headers."""
@@ -26,37 +30,36 @@ def get_headers() -> dict:
 
 
 async def extract_accounts_from_list(list_id: str) -> dict:
-    """Extract all Twitter accounts from a Folo list by fetching entries."""
+    """Extract all Twitter accounts from a Folo list by fetching entries.
+
+    Pages fetched by scripts/fetch_folo_list.py or the pipeline within
+    FOLO_PAGE_CACHE_TTL are reused instead of requested again.
+    """
     print(f"\n🔍 Extracting accounts from list: {list_id}")
     print("=" * 60)
 
     all_feeds = {}
     published_after = None
-
-    async with aiohttp.ClientSession() as session:
-        for page in range(15):  # Fetch more pages to get all feeds
-            body = {
-                "view": 1,
-                "withContent": True,
-                "listId": list_id,
-            }
-            if published_after:
-                body["publishedAfter"] = published_after
-
-            print(f"📥 Fetching page {page + 1}...", end=" ")
-
-            try:
-                async with session.post(
-                    "https://api.follow.is/entries",
-                    headers=get_headers(),
-                    json=body,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as resp:
-                    if resp.status != 200:
-                        print(f"❌ HTTP {resp.status}")
-                        break
-
-                    data = await resp.json()
+    coalescer = RequestCoalescer()
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            for page in range(15):  # Fetch more pages to get all feeds
+                body = {
+                    "view": 1,
+                    "withContent": True,
+                    "listId": list_id,
+                }
+                if published_after:
+                    body["publishedAfter"] = published_after
+
+                print(f"📥 Fetching page {page + 1}...", end=" ")
+
+                try:
+                    data = await coalescer.run(
+                        request_key(FOLO_API, body),
+                        lambda: post_page(session, body, get_headers(), FOLO_API)
+                    )
                     if not data or not data.get("data"):
                         print("No more data")
                         break
@@ -85,11 +88,15 @@ async def extract_accounts_from_list(list_id: str) -> dict:
                     if len(data["data"]) < 20:  # Less than full page
                         break
 
-                    await asyncio.sleep(0.5)  # Rate limit
-
-            except Exception as e:
-                print(f"❌ Error: {e}")
-                break
+                except aiohttp.ClientResponseError as e:
+                    print(f"❌ HTTP {e.status}")
+                    # post_page already retried throttled requests on the same cursor
+                    break
+                except Exception as e:
+                    print(f"❌ Error: {e}")
+                    break
+    finally:
+        coalescer.close()
 
     return all_feeds
 
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark the LLM stages offline with the replay provider.
+
+Runs ContentAnalyzer relevance filtering, analysis and report generation,
+then the classification loop of generate_daily_report.py, against a
+ReplayProvider with synthetic latency. Use a recorded cassette for real
+responses, or fake mode (default) for deterministic synthetic ones.
+Compare against the old sequential behaviour with
+``--batch-size 1 --concurrency 1``.
+
+Usage:
+    python scripts/benchmark_llm.py [--items 300] [--latency 0.5] [--jitter 0.2]
+        [--failure-rate 0.0] [--cassette path.jsonl.gz] [--batch-size 20] [--concurrency 4]
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import importlib.util
+from pathlib import Path
+
+
+def build_items(count: int, seed: int = 3) -> list:
+    """Generate items, half of which need the LLM relevance check."""
+    rng = random.Random(seed)
+    subjects = [
+        "New LLM benchmark", "GPU roadmap", "Startup funding", "Robotics demo", "Chip export rules"
+    ]
+    return [
+        {
+            "title": f"{rng.choice(subjects)} #{i}",
+            "content": " ".join(
+                rng.choice(["model", "release", "team", "paper", "data"]) for _ in range(80)
+            ),
+            "url": f"https://example.com/{i}",
+            "source": rng.choice(["twitter", "reddit", "blog"]),
+        }
+        for i in range(count)
+    ]
+
+
+async def timed(label: str, provider, coro):
+    calls = provider.stats["calls"]
+    started = time.perf_counter()
+    result = await coro
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed:7.2f}s  {provider.stats['calls'] - calls:4d} calls")
+    return result
+
+
+async def run(args) -> int:
+    os.environ.update({
+        "LLM_REPLAY_MODE": "replay" if args.cassette else "fake",
+        "LLM_REPLAY_CASSETTE": args.cassette or "",
+        "LLM_REPLAY_LATENCY": str(args.latency),
+        "LLM_REPLAY_JITTER": str(args.jitter),
+        "LLM_REPLAY_FAILURE_RATE": str(args.failure_rate),
+        # Measure the provider, not the response cache
+        "LLM_CACHE_ENABLED": "false",
+    })
+
+    from daily_ai_insight.llm import ContentAnalyzer
+    from daily_ai_insight.llm.providers.replay import ReplayProvider
+
+    analyzer = ContentAnalyzer(
+        provider="replay",
+        filter_batch_size=args.batch_size,
+        filter_concurrency=args.concurrency,
+        analysis_concurrency=args.concurrency
+    )
+    provider = analyzer.provider
+    items = build_items(args.items)
+    print(f"Items: {len(items)}, latency {args.latency}s + up to {args.jitter}s jitter\n")
+
+    total = time.perf_counter()
+    relevant = await timed(
+        "filter_relevant_content", provider, analyzer.filter_relevant_content(items)
+    )
+    analysis = await timed("analyze_content", provider, analyzer.analyze_content(relevant))
+    await timed("generate_report", provider, analyzer.generate_report(analysis, relevant))
+
+    spec = importlib.util.spec_from_file_location(
+        "generate_daily_report", Path(__file__).with_name("generate_daily_report.py")
+    )
+    report_script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(report_script)
+    script_provider = ReplayProvider.from_env()
+    await timed(
+        "classify_and_score_items",
+        script_provider,
+        report_script.classify_and_score_items(
+            build_items(args.items), report_script.get_default_profile(), {}, script_provider
+        )
+    )
+
+    print(f"\nTotal: {time.perf_counter() - total:.2f}s, kept {len(relevant)}/{len(items)} items")
+    analyzer.close()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=300)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--jitter", type=float, default=0.2)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--cassette", default=None)
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
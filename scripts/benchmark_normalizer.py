@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Benchmark DataCleaner text normalization and spam matching.
+
+Compares the previous multi-pass regex cleaning and keyword loop with
+TextNormalizer and KeywordMatcher on a synthetic batch, and checks that
+ascii mode reproduces the previous output exactly.
+
+Usage:
+    python scripts/benchmark_normalizer.py [--items 10000] [--repeat 3]
+"""
+
+import re
+import sys
+import time
+import random
+import argparse
+
+from daily_ai_insight.processors import DataCleaner
+from daily_ai_insight.processors.normalizer import (
+    TextNormalizer,
+    KeywordMatcher,
+    HAS_AHOCORASICK,
+)
+
+
+def legacy_clean_text(text: str) -> str:
+    """The multi-pass cleaning DataCleaner used before."""
+    if not text:
+        return ""
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'https?://\S+', '', text)
+    text = re.sub(r'[^\w\s\.\,\!\?\-\:\;\(\)\'\"]+', ' ', text)
+    text = text.encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def legacy_is_spam(text: str, keywords: list) -> bool:
+    """The keyword loop DataCleaner used before."""
+    text = text.lower()
+    for keyword in keywords:
+        if keyword in text:
+            return True
+    return False
+
+
+def build_batch(count: int, seed: int = 7) -> list:
+    """Generate mixed English/Chinese item contents."""
+    rng = random.Random(seed)
+    words = [
+        "LLM", "agent", "benchmark", "release", "open-source", "模型", "推理",
+        "发布", "开源", "论文", "GPU", "(beta)", "v2.1", "—", "😀", "#AI", "@user",
+        "<b>", "</b>", "https://t.co/abc123", "&amp;", "，", "。", "\n",
+    ]
+    return [
+        " ".join(rng.choice(words) for _ in range(rng.randint(20, 300)))
+        for _ in range(count)
+    ]
+
+
+def timed(func, batch: list, repeat: int) -> float:
+    """Return the best time per item in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in batch:
+            func(text)
+        best = min(best, time.perf_counter() - started)
+    return best / len(batch) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    batch = build_batch(args.items)
+    ascii_normalizer = TextNormalizer("ascii")
+    unicode_normalizer = TextNormalizer("unicode")
+
+    mismatches = sum(legacy_clean_text(t) != ascii_normalizer.normalize(t) for t in batch)
+    print(f"Items: {len(batch)}, ascii mode mismatches vs previous output: {mismatches}")
+
+    legacy_us = timed(legacy_clean_text, batch, args.repeat)
+    ascii_us = timed(ascii_normalizer.normalize, batch, args.repeat)
+    unicode_us = timed(unicode_normalizer.normalize, batch, args.repeat)
+    print(f"Previous cleaning:    {legacy_us:8.1f} us/item")
+    print(f"Normalizer (ascii):   {ascii_us:8.1f} us/item ({legacy_us / ascii_us:.1f}x)")
+    print(f"Normalizer (unicode): {unicode_us:8.1f} us/item ({legacy_us / unicode_us:.1f}x)")
+
+    # The default list, plus a larger generated list like a curated spam filter
+    rng = random.Random(1)
+    generated = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(5, 12)))
+        for _ in range(300)
+    ]
+    for keywords in (DataCleaner().spam_keywords, generated):
+        matcher = KeywordMatcher(keywords)
+        backend = "Aho-Corasick" if matcher.uses_automaton else "substring"
+
+        loop_us = timed(lambda t: legacy_is_spam(t, keywords), batch, args.repeat)
+        matcher_us = timed(matcher.search, batch, args.repeat)
+        print(f"Spam keyword loop:    {loop_us:8.1f} us/item ({len(keywords)} keywords)")
+        print(f"KeywordMatcher:       {matcher_us:8.1f} us/item ({backend})")
+
+    if not HAS_AHOCORASICK:
+        print("Install pyahocorasick to use the automaton for large keyword sets")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark strip_html against the previous BeautifulSoup implementation.
+
+Builds a synthetic corpus shaped like Twitter/Reddit list entries, checks
+that both implementations return the same text, and reports the time per
+call with and without the memo cache.
+
+Usage:
+    python scripts/benchmark_strip_html.py [--entries 2000] [--repeat 3]
+"""
+
+import re
+import sys
+import time
+import random
+import argparse
+
+from bs4 import BeautifulSoup
+
+from daily_ai_insight.collectors.html_text import html_to_text, clear_cache
+
+
+def strip_html_bs4(html_content: str) -> str:
+    """The BeautifulSoup implementation strip_html used before."""
+    if not html_content:
+        return ""
+
+    soup = BeautifulSoup(html_content, "html.parser")
+    for script in soup(["script", "style"]):
+        script.decompose()
+
+    text = soup.get_text(separator='\n', strip=True)
+    text = re.sub(r'\n\s*\n', '\n\n', text)
+    return text.strip()
+
+
+def build_corpus(count: int, seed: int = 42) -> list:
+    """Generate HTML entries similar to Follow.is list content."""
+    rng = random.Random(seed)
+    words = [
+        "LLM", "agent", "benchmark", "开源", "模型", "推理", "transformer",
+        "dataset", "GPU", "fine-tuning", "论文", "发布", "context", "&amp;",
+        "&lt;3", "&#x1F680;",
+    ]
+
+    def sentence():
+        return " ".join(rng.choice(words) for _ in range(rng.randint(5, 25)))
+
+    corpus = []
+    for i in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 6)):
+            kind = rng.random()
+            if kind < 0.5:
+                parts.append(f"<p>{sentence()} <a href='https://x.com/{i}'>@user{i}</a></p>")
+            elif kind < 0.7:
+                parts.append(f"<blockquote><p>{sentence()}</p></blockquote><br>")
+            elif kind < 0.8:
+                parts.append(f"<ul><li>{sentence()}</li><li><strong>{sentence()}</strong></li></ul>")
+            elif kind < 0.9:
+                parts.append(f"<img src='https://pbs.twimg.com/{i}.jpg'><p>{sentence()}</p>")
+            else:
+                parts.append("<script>window.__data = {\"a\": \"<p>x</p>\"};</script>"
+                             "<style>.c { color: red; }</style>")
+        corpus.append("".join(parts))
+    return corpus
+
+
+def timed(func, corpus: list, repeat: int) -> float:
+    """Return the best time per call in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for html_content in corpus:
+            func(html_content)
+        best = min(best, time.perf_counter() - started)
+    return best / len(corpus) * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.entries)
+
+    mismatches = [h for h in corpus if strip_html_bs4(h) != html_to_text(h, use_cache=False)]
+    print(f"Entries: {len(corpus)}, output mismatches: {len(mismatches)}")
+
+    bs4_us = timed(strip_html_bs4, corpus, args.repeat)
+    parser_us = timed(lambda h: html_to_text(h, use_cache=False), corpus, args.repeat)
+
+    clear_cache()
+    for html_content in corpus:
+        html_to_text(html_content)
+    cached_us = timed(html_to_text, corpus, args.repeat)
+
+    print(f"BeautifulSoup:        {bs4_us:8.1f} us/call")
+    print(f"html_to_text:         {parser_us:8.1f} us/call ({bs4_us / parser_us:.1f}x)")
+    print(f"html_to_text cached:  {cached_us:8.1f} us/call ({bs4_us / cached_us:.1f}x)")
+
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
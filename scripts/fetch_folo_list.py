@@ -9,7 +9,6 @@ Requires FOLO_COOKIE and GEMINI_API_KEY in .env
 """
 
 import asyncio
-import json
 import os
 import re
 from datetime import datetime
@@ -19,6 +18,12 @@ from typing import Any
 import aiohttp
 from dotenv import load_dotenv
 
+from daily_ai_insight.collectors.coalesce import RequestCoalescer, post_page, request_key
+from daily_ai_insight.llm.parsing import extract_json
+from daily_ai_insight.llm.rate_limit import get_limiter, is_rate_limited, retry_after
+from daily_ai_insight.llm.tokens import get_estimator
+from daily_ai_insight.processors.ranker import PreRanker
+
 # Load environment variables
 load_dotenv()
 
@@ -26,6 +31,9 @@ load_dotenv()
 LIST_ID = "216345814850997248"
 FOLO_API = "https://api.follow.is/entries"
 FILTER_DAYS = int(os.getenv("FOLO_FILTER_DAYS", "1"))  # Default 1 day
+# Borderline items sent to the LLM, best-ranked first
+LLM_MAX_ITEMS = int(os.getenv("FOLO_LLM_MAX_ITEMS", "20"))
+LLM_TOKEN_BUDGET = int(os.getenv("FOLO_LLM_TOKEN_BUDGET", "8000"))
 
 # User profile for filtering
 USER_PROFILE = {
@@ -126,34 +134,33 @@ def categorize_item(title: str, content: str) -> str:
 
 
 async def fetch_list_content() -> list[dict[str, Any]]:
-    """Fetch content from Folo list."""
+    """Fetch content from Folo list.
+
+    Pages fetched by another run or collector within FOLO_PAGE_CACHE_TTL
+    are reused instead of requested again.
+    """
     all_items = []
     published_after = None
 
     print(f"Fetching content from list {LIST_ID}...")
+    coalescer = RequestCoalescer()
 
-    async with aiohttp.ClientSession() as session:
-        for page in range(20):  # Fetch up to 20 pages to ensure all daily content
-            body = {
-                "view": 1,
-                "withContent": True,
-                "listId": LIST_ID,
-            }
-            if published_after:
-                body["publishedAfter"] = published_after
-
-            try:
-                async with session.post(
-                    FOLO_API,
-                    headers=get_headers(),
-                    json=body,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as resp:
-                    if resp.status != 200:
-                        print(f"  Page {page + 1}: HTTP {resp.status}")
-                        break
-
-                    data = await resp.json()
+    try:
+        async with aiohttp.ClientSession() as session:
+            for page in range(20):  # Fetch up to 20 pages to ensure all daily content
+                body = {
+                    "view": 1,
+                    "withContent": True,
+                    "listId": LIST_ID,
+                }
+                if published_after:
+                    body["publishedAfter"] = published_after
+
+                try:
+                    data = await coalescer.run(
+                        request_key(FOLO_API, body),
+                        lambda: post_page(session, body, get_headers(), FOLO_API)
+                    )
 
                     if not data or not data.get("data"):
                         print(f"  Page {page + 1}: No more data")
@@ -186,12 +193,15 @@ async def fetch_list_content() -> list[dict[str, Any]]:
                     if data["data"]:
                         published_after = data["data"][-1]["entries"]["publishedAt"]
 
-                    # Small delay between pages
-                    await asyncio.sleep(1)
-
-            except Exception as e:
-                print(f"  Page {page + 1}: Error - {e}")
-                break
+                except aiohttp.ClientResponseError as e:
+                    print(f"  Page {page + 1}: HTTP {e.status}")
+                    # post_page already retried throttled requests on the same cursor
+                    break
+                except Exception as e:
+                    print(f"  Page {page + 1}: Error - {e}")
+                    break
+    finally:
+        coalescer.close()
 
     # Filter by date
     from datetime import datetime, timedelta, timezone
@@ -210,7 +220,10 @@ async def fetch_list_content() -> list[dict[str, Any]]:
         else:
             filtered_items.append(item)
 
-    print(f"Total fetched: {len(all_items)} items, after date filter ({FILTER_DAYS} days): {len(filtered_items)} items")
+    print(
+        f"Total fetched: {len(all_items)} items, "
+        f"after date filter ({FILTER_DAYS} days): {len(filtered_items)} items"
+    )
     return filtered_items
 
 
@@ -235,13 +248,24 @@ Return JSON only:
 {{"include": true/false, "reason": "brief reason", "category": "AI Research|LLM & Agents|Tools|Efficiency|Industry|Skip", "summary": "1-2 sentence summary if include=true"}}
 """
 
+    limiter = get_limiter("gemini")
+    await limiter.acquire(get_estimator("gemini").count(prompt))
+
     try:
-        response = await asyncio.to_thread(
-            model.generate_content,
-            prompt,
-            generation_config={"response_mime_type": "application/json"}
-        )
-        result = json.loads(response.text)
+        try:
+            response = await asyncio.to_thread(
+                model.generate_content,
+                prompt,
+                generation_config={"response_mime_type": "application/json"}
+            )
+        except Exception as e:
+            if is_rate_limited(e):
+                limiter.on_rate_limited(retry_after(e))
+            raise
+        limiter.on_success()
+        result = extract_json(response.text)
+        if result is None:
+            raise ValueError("Response contains no JSON")
         # Handle case where LLM returns a list instead of dict
         if isinstance(result, list):
             result = result[0] if result else {}
@@ -282,10 +306,15 @@ async def filter_and_categorize(items: list[dict[str, Any]]) -> dict[str, list[d
     print(f"  Keyword filter: {sum(len(v) for v in categorized.values())} high relevance")
     print(f"  Borderline items for LLM: {len(borderline_items)}")
 
-    # Second pass: LLM filtering for borderline items
+    # Second pass: LLM filtering for the best-ranked borderline items
     if borderline_items and gemini_key:
-        print("  Running LLM evaluation...")
-        for i, item in enumerate(borderline_items[:20]):  # Limit to 20 for cost
+        ranker = PreRanker.from_files()
+        selected = ranker.select(
+            borderline_items, LLM_MAX_ITEMS, LLM_TOKEN_BUDGET, get_estimator("gemini").count
+        )
+        selected.sort(key=lambda item: -item["rank_score"])
+        print(f"  Running LLM evaluation on {len(selected)} top-ranked items...")
+        for i, item in enumerate(selected):
             result = await llm_filter_item(item, gemini_key)
             if result and result.get("include"):
                 category = result.get("category", "Other")
@@ -311,9 +340,7 @@ async def filter_and_categorize(items: list[dict[str, Any]]) -> dict[str, list[d
                 categorized[category].append(item)
 
             if (i + 1) % 5 == 0:
-                print(f"    Processed {i + 1}/{min(20, len(borderline_items))}")
-
-            await asyncio.sleep(0.5)  # Rate limiting
+                print(f"    Processed {i + 1}/{len(selected)}")
 
     # Remove empty categories
     categorized = {k: v for k, v in categorized.items() if v}
@@ -390,7 +417,8 @@ def generate_markdown(categorized: dict[str, list[dict[str, Any]]]) -> str:
                 sentences = re.split(r'[.!?。！？]', content)
                 for sent in sentences[:10]:
                     sent = sent.strip()
-                    if len(sent) > 50 and any(kw in sent.lower() for kw in ["ai", "model", "效率", "tool"]):
+                    keywords = ["ai", "model", "效率", "tool"]
+                    if len(sent) > 50 and any(kw in sent.lower() for kw in keywords):
                         lines.append(f"**Key point**: {sent}")
                         lines.append("")
                         break
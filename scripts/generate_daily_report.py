@@ -24,6 +24,14 @@ from typing import Any
 import yaml
 from dotenv import load_dotenv
 
+from daily_ai_insight.llm.cache import LLMCache, make_key
+from daily_ai_insight.llm.parsing import extract_json, is_repaired, salvage
+from daily_ai_insight.llm.providers.replay import ReplayProvider
+from daily_ai_insight.llm.rate_limit import get_limiter, is_rate_limited, retry_after
+from daily_ai_insight.llm.schemas import ScoredItem
+from daily_ai_insight.llm.tokens import get_estimator
+from daily_ai_insight.processors.ranker import PreRanker
+
 load_dotenv()
 
 # Default paths
@@ -194,19 +202,61 @@ def build_classification_prompt(profile: dict, feedback: dict) -> str:
     return "\n".join(prompt_parts)
 
 
+def set_default_classification(item: dict[str, Any]) -> None:
+    """Give an item the neutral classification used when the LLM gave none."""
+    item["score"] = 40
+    item["topic"] = "其他"
+    item["summary"] = item["title"][:25]
+    item["tags"] = []
+    item["skip"] = False
+
+
 async def classify_and_score_items(
     items: list[dict[str, Any]],
     profile: dict,
-    feedback: dict
+    feedback: dict,
+    provider: Any = None
 ) -> list[dict[str, Any]]:
-    """Use LLM to classify items based on user profile."""
-    import google.generativeai as genai
+    """Use LLM to classify items based on user profile.
+
+    Calls Gemini directly, or ``provider.generate_text`` when a provider
+    is given (e.g. a ReplayProvider for offline runs).
+    """
+    model_name = "gemini-2.0-flash"
+    if provider is None:
+        import google.generativeai as genai
+
+        genai.configure(api_key=os.getenv("GEMINI_API_KEY", ""))
+        model = genai.GenerativeModel(model_name)
+    generation_config = {"response_mime_type": "application/json"}
 
-    genai.configure(api_key=os.getenv("GEMINI_API_KEY", ""))
-    model = genai.GenerativeModel("gemini-2.0-flash")
+    # Shared with the pipeline, so quota is paced instead of a fixed sleep
+    limiter = get_limiter("gemini")
+
+    # Items already scored with the same profile are answered from disk
+    cache = None
+    if provider is None and os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true":
+        cache = LLMCache(os.getenv("LLM_CACHE_PATH", "storage/data/llm_cache.db"))
 
     profile_context = build_classification_prompt(profile, feedback)
 
+    # Only the best-ranked items within the budget are classified by the LLM
+    ranker = PreRanker(profile, feedback)
+    selected = ranker.select(
+        items,
+        int(os.getenv("LLM_MAX_ITEMS", "200")),
+        int(os.getenv("LLM_ITEM_TOKEN_BUDGET", "60000")),
+        get_estimator("gemini").count
+    )
+    selected_ids = {id(item) for item in selected}
+    skipped = [item for item in items if id(item) not in selected_ids]
+    for item in skipped:
+        set_default_classification(item)
+        item["skip"] = True
+    if skipped:
+        print(f"  Pre-ranking: classifying {len(selected)} of {len(items)} items")
+    items = selected
+
     batch_size = 20
     all_results = []
 
@@ -257,45 +307,64 @@ async def classify_and_score_items(
 
 只返回 JSON 数组，不要其他内容。"""
 
+        key = make_key("gemini", model_name, generation_config, prompt)
+        cached = cache.get(key) if cache is not None else None
+
         try:
-            response = await asyncio.to_thread(
-                model.generate_content,
-                prompt,
-                generation_config={"response_mime_type": "application/json"}
-            )
-            results = json.loads(response.text)
-
-            if isinstance(results, dict) and "items" in results:
-                results = results["items"]
-            elif not isinstance(results, list):
+            if cached is not None:
+                text = cached
+            elif provider is not None:
+                text = await provider.generate_text(prompt, max_tokens=8192)
+            else:
+                await limiter.acquire(get_estimator("gemini").count(prompt))
+                try:
+                    response = await asyncio.to_thread(
+                        model.generate_content,
+                        prompt,
+                        generation_config=generation_config
+                    )
+                except Exception as e:
+                    if is_rate_limited(e):
+                        limiter.on_rate_limited(retry_after(e))
+                    raise
+                limiter.on_success()
+                text = response.text
+            results = extract_json(text)
+            if results is None:
+                raise ValueError("Response contains no JSON")
+            # Truncated responses are not cached, so a rerun can get them whole
+            if cache is not None and cached is None and not is_repaired(results):
+                cache.set(key, text)
+
+            if isinstance(results, dict) and "items" not in results:
                 results = [results]
 
-            for result in results:
-                idx = result.get("idx", 0)
+            # Keep valid entries of a truncated or partly malformed response
+            scored = set()
+            for result in salvage(results, "items", ScoredItem):
+                idx = result.pop("idx")
                 if 0 <= idx < len(batch):
-                    batch[idx]["score"] = result.get("score", 50)
-                    batch[idx]["topic"] = result.get("topic", "其他")
-                    batch[idx]["summary"] = result.get("summary", "")
-                    batch[idx]["tags"] = result.get("tags", [])
-                    batch[idx]["relevance_reason"] = result.get("relevance_reason", "")
-                    batch[idx]["actionable"] = result.get("actionable", False)
-                    batch[idx]["skip"] = result.get("skip", False)
+                    batch[idx].update(result)
+                    scored.add(idx)
+
+            for idx, item in enumerate(batch):
+                if idx not in scored:
+                    set_default_classification(item)
 
             all_results.extend(batch)
 
         except Exception as e:
             print(f"    Error in batch: {e}")
             for item in batch:
-                item["score"] = 40
-                item["topic"] = "其他"
-                item["summary"] = item["title"][:25]
-                item["tags"] = []
-                item["skip"] = False
+                set_default_classification(item)
             all_results.extend(batch)
 
-        await asyncio.sleep(0.5)
+    if cache is not None:
+        stats = cache.stats()
+        print(f"  LLM cache: {stats['hits']} hits, {stats['misses']} misses")
+        cache.close()
 
-    return all_results
+    return all_results + skipped
 
 
 def generate_html_report(
@@ -870,7 +939,14 @@ async def main():
         return
 
     print("Classifying with personalized profile...")
-    items = await classify_and_score_items(items, profile, feedback)
+    provider = None
+    if os.getenv("LLM_PROVIDER") == "replay":
+        provider = ReplayProvider.from_env()
+    try:
+        items = await classify_and_score_items(items, profile, feedback, provider)
+    finally:
+        if provider is not None:
+            provider.close()
 
     date_match = re.search(r'Generated: (\d{4}-\d{2}-\d{2})', content)
     date_str = date_match.group(1) if date_match else datetime.now().strftime("%Y-%m-%d")
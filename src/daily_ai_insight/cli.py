@@ -7,7 +7,7 @@ import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -16,9 +16,14 @@ from rich.logging import RichHandler
 # Import modules
 from daily_ai_insight.collectors import (
     GitHubTrendingCollector,
+    CollectionScheduler,
+    CursorStore,
+    HTTPCache,
+    RequestCoalescer,
     create_from_preset,
 )
-from daily_ai_insight.processors import DataCleaner, Deduplicator
+from daily_ai_insight.net import SessionManager
+from daily_ai_insight.processors import DataCleaner, Deduplicator, TopicClusterer
 from daily_ai_insight.storage import create_storage
 from daily_ai_insight.llm import ContentAnalyzer
 from daily_ai_insight.renderers import MarkdownRenderer, FeishuRenderer, TelegramRenderer
@@ -42,11 +47,31 @@ class DailyInsightPipeline:
     """Main pipeline for Daily AI Insight."""
 
     def __init__(self):
-        self.storage = create_storage()  # Auto-configured from .env
+        # One pooled HTTP session shared by collectors, storage and renderers
+        self.http = SessionManager()
+        self.storage = create_storage(session_manager=self.http)  # Auto-configured from .env
         self.cleaner = DataCleaner()
         self.deduper = Deduplicator()
-        self.analyzer = ContentAnalyzer(provider="gemini")
+        self.clusterer = TopicClusterer()
+        self.analyzer = ContentAnalyzer(provider=os.getenv("LLM_PROVIDER", "gemini"))
         self.markdown_renderer = MarkdownRenderer()
+        self.scheduler = CollectionScheduler()
+
+        # Incremental Follow.is fetching (only new entries since last run);
+        # cursors advance only once the report has been saved
+        self.cursors = None
+        if os.getenv("FOLO_INCREMENTAL", "true").lower() == "true":
+            self.cursors = CursorStore(auto_commit=False)
+
+        # One request per distinct Follow.is page across collectors and runs
+        self.coalescer = None
+        if os.getenv("FOLO_COALESCE", "true").lower() == "true":
+            self.coalescer = RequestCoalescer()
+
+        # Conditional-GET cache for plain HTTP sources
+        self.http_cache = None
+        if os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true":
+            self.http_cache = HTTPCache()
 
         # Initialize renderers based on available credentials
         self.feishu_renderer = None
@@ -54,14 +79,14 @@ class DailyInsightPipeline:
 
         if os.getenv("FEISHU_WEBHOOK"):
             try:
-                self.feishu_renderer = FeishuRenderer()
+                self.feishu_renderer = FeishuRenderer(session_manager=self.http)
                 logger.info("✅ Feishu renderer initialized")
             except Exception as e:
                 logger.warning(f"⚠️  Failed to initialize Feishu: {e}")
 
         if os.getenv("TELEGRAM_BOT_TOKEN") and os.getenv("TELEGRAM_CHAT_ID"):
             try:
-                self.telegram_renderer = TelegramRenderer()
+                self.telegram_renderer = TelegramRenderer(session_manager=self.http)
                 logger.info("✅ Telegram renderer initialized")
             except Exception as e:
                 logger.warning(f"⚠️  Failed to initialize Telegram: {e}")
@@ -76,23 +101,29 @@ class DailyInsightPipeline:
         console.print("\n[bold cyan]🚀 Starting Daily AI Insight Pipeline[/bold cyan]\n")
 
         try:
-            # Step 1: Collect data
+            # Step 1 & 2: Collect, clean and deduplicate
             if not skip_collection:
-                items = await self._collect_data()
+                # Items are cleaned and deduplicated as they stream in
+                collected, items = await self._collect_data()
             else:
                 console.print("[yellow]⏭️  Skipping data collection, using existing data[/yellow]")
                 items = await self.storage.load_recent(hours=24)
+                collected = len(items)
+                if items:
+                    items = await self._process_data(items)
 
-            if not items:
+            if not collected:
                 console.print("[red]❌ No data collected or available[/red]")
                 return
 
-            console.print(f"[green]✅ Collected {len(items)} items[/green]")
-
-            # Step 2: Clean and deduplicate
-            items = await self._process_data(items)
+            console.print(f"[green]✅ Collected {collected} items[/green]")
             console.print(f"[green]✅ Processed to {len(items)} unique items[/green]")
 
+            # Group items into topics locally, before any LLM call
+            clusters = self.clusterer.cluster(items)
+            if clusters:
+                console.print(f"[green]✅ Grouped into {len(clusters)} topics[/green]")
+
             # Save processed data
             await self.storage.save_raw(items, source="processed")
 
@@ -109,68 +140,141 @@ class DailyInsightPipeline:
             # Step 5: Save and send report
             await self._distribute_report(report, analysis)
 
+            # The entries are reported, so the next run can start after them
+            if self.cursors is not None:
+                self.cursors.commit()
+
             console.print("\n[bold green]✅ Pipeline completed successfully![/bold green]")
 
         except Exception as e:
             logger.error(f"❌ Pipeline failed: {e}")
             raise
 
-    async def _collect_data(self) -> List[Dict[str, Any]]:
-        """Collect data from sources."""
-        all_items = []
+        finally:
+            await self.http.close()
+            self.deduper.close()
+            self.analyzer.close()
+            if self.http_cache is not None:
+                self.http_cache.close()
+            if self.coalescer is not None:
+                self.coalescer.close()
+
+    async def _collect_data(self) -> Tuple[int, List[Dict[str, Any]]]:
+        """Collect data from all sources concurrently.
+
+        Items flow through cleaning and deduplication as each page arrives
+        instead of after every collector has finished.
+
+        Returns:
+            Tuple of (number of items collected, cleaned unique items)
+        """
+        collected = 0
+
+        # Shared options for Follow.is collectors
+        follow_options = {
+            "session_manager": self.http,
+            "cursor_store": self.cursors,
+            "coalescer": self.coalescer,
+            "prefilter": self._prefilter,
+        }
 
         # Initialize collectors using factory functions
-        collectors = [
+        follow_collectors = [
             # Social platforms
-            create_from_preset("reddit"),
-            create_from_preset("twitter"),
+            create_from_preset("reddit", **follow_options),
+            create_from_preset("twitter", **follow_options),
             # Academic papers
-            create_from_preset("papers"),
+            create_from_preset("papers", **follow_options),
             # Chinese AI news sites
-            create_from_preset("xiaohu"),
-            create_from_preset("aibase"),
-            create_from_preset("jiqizhixin"),
-            create_from_preset("qbit"),
-            create_from_preset("xinzhiyuan"),
+            create_from_preset("xiaohu", **follow_options),
+            create_from_preset("aibase", **follow_options),
+            create_from_preset("jiqizhixin", **follow_options),
+            create_from_preset("qbit", **follow_options),
+            create_from_preset("xinzhiyuan", **follow_options),
             # News aggregators
-            create_from_preset("news_aggregator"),
+            create_from_preset("news_aggregator", **follow_options),
+        ]
+        collectors = [
+            *follow_collectors,
             # Specialized collectors
-            GitHubTrendingCollector(),
+            GitHubTrendingCollector(session_manager=self.http, http_cache=self.http_cache),
         ]
+        follow_items = 0
 
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console
         ) as progress:
-            for collector in collectors:
-                task = progress.add_task(
-                    f"[cyan]Collecting data from {collector.name}...",
+            tasks = {
+                id(collector): progress.add_task(
+                    f"[dim]Waiting to collect from {collector.name}...",
                     total=None
                 )
+                for collector in collectors
+            }
 
-                try:
-                    # Fetch raw data
-                    raw_data = await collector.fetch()
-
-                    # Transform to unified format
-                    items = collector.transform(raw_data, collector.name.lower().replace(" ", "-"))
+            def on_start(collector):
+                progress.update(
+                    tasks[id(collector)],
+                    description=f"[cyan]Collecting data from {collector.name}..."
+                )
 
-                    all_items.extend(items)
+            def on_finish(result):
+                nonlocal follow_items
+                name = result.collector.name
+                if any(result.collector is c for c in follow_collectors):
+                    follow_items += result.count
+                if result.ok:
                     progress.update(
-                        task,
-                        description=f"[green]✓ Collected {len(items)} items from {collector.name}",
+                        tasks[id(result.collector)],
+                        description=(
+                            f"[green]✓ Collected {result.count} items from {name} "
+                            f"({result.elapsed:.1f}s)"
+                        ),
                         completed=True
                     )
-
-                except Exception as e:
-                    logger.error(f"Failed to collect from {collector.name}: {e}")
+                else:
                     progress.update(
-                        task,
-                        description=f"[red]✗ Failed to collect from {collector.name}"
+                        tasks[id(result.collector)],
+                        description=f"[red]✗ Failed to collect from {name}"
                     )
 
-        return all_items
+            async def count(items):
+                nonlocal collected
+                async for item in items:
+                    collected += 1
+                    yield item
+
+            stream = self.scheduler.stream(
+                collectors,
+                on_start=on_start,
+                on_finish=on_finish
+            )
+            stream = self.cleaner.clean_stream(count(stream))
+            items = [item async for item in self.deduper.deduplicate_stream(stream)]
+
+            # Fallback RSS feeds, only when Follow.is is down or returned nothing
+            if follow_items == 0 and os.getenv("RSS_FALLBACK_ENABLED", "true").lower() == "true":
+                console.print(
+                    "[yellow]No items from Follow.is, collecting fallback RSS feeds[/yellow]"
+                )
+                rss = create_from_preset(
+                    "rss", session_manager=self.http, http_cache=self.http_cache
+                )
+                tasks[id(rss)] = progress.add_task(
+                    f"[dim]Waiting to collect from {rss.name}...", total=None
+                )
+
+                stream = self.scheduler.stream([rss], on_start=on_start, on_finish=on_finish)
+                stream = self.cleaner.clean_stream(count(stream))
+                items.extend([item async for item in self.deduper.deduplicate_stream(stream)])
+
+        return collected, items
+
+    def _prefilter(self, item: Dict[str, Any]) -> bool:
+        """Title/URL check run before Follow.is content is fetched (FOLO_TWO_PHASE)."""
+        return self.cleaner.prefilter(item) and not self.deduper.is_known(item)
 
     async def _process_data(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Clean and deduplicate data."""
@@ -1,7 +1,12 @@
 """Data collectors for various sources."""
 
 from .base import BaseCollector, FollowCollector
+from .cursor import CursorStore
+from .coalesce import RequestCoalescer, request_key, post_page
+from .http_cache import HTTPCache, CachedResponse
 from .github_trending import GitHubTrendingCollector
+from .rss import RSSCollector
+from .scheduler import CollectionScheduler, CollectionResult
 
 # Factory functions (recommended approach)
 from . import factory
@@ -10,6 +15,7 @@ from .factory import (
     create_reddit_collector,
     create_papers_collector,
     create_mixed_collector,
+    create_rss_collector,
     create_collector,
     create_from_preset,
 )
@@ -18,14 +24,25 @@ __all__ = [
     # Base classes
     "BaseCollector",
     "FollowCollector",
+    "CursorStore",
+    "RequestCoalescer",
+    "request_key",
+    "post_page",
+    "HTTPCache",
+    "CachedResponse",
     # Specialized collectors
     "GitHubTrendingCollector",
+    "RSSCollector",
+    # Scheduling
+    "CollectionScheduler",
+    "CollectionResult",
     # Factory module and functions (recommended)
     "factory",
     "create_twitter_collector",
     "create_reddit_collector",
     "create_papers_collector",
     "create_mixed_collector",
+    "create_rss_collector",
     "create_collector",
     "create_from_preset",
 ]
\ No newline at end of file
@@ -6,17 +6,20 @@ This module contains:
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator, Callable, Set, Tuple
 from datetime import datetime
 import hashlib
 import os
+import time
 import logging
 import asyncio
 import aiohttp
 
+from ..net import SessionManager, THROTTLE_STATUSES, get_pacer
+from .cursor import CursorStore, parse_published_at
+from .coalesce import RequestCoalescer, request_key
 from .utils import (
     get_follow_headers,
-    sleep_random,
     is_date_within_last_days,
     strip_html,
     escape_html,
@@ -39,6 +42,11 @@ class BaseCollector(ABC):
         self.name = name
         self.collected_at = None
 
+    @property
+    def source_type(self) -> str:
+        """Type identifier passed to transform() for this collector."""
+        return self.name.lower().replace(" ", "-")
+
     @abstractmethod
     async def fetch(self, **kwargs) -> Dict[str, Any]:
         """Fetch raw data from the source.
@@ -89,6 +97,21 @@ class BaseCollector(ABC):
         """
         pass
 
+    async def stream(self, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Yield unified items as they become available.
+
+        The default implementation fetches everything and then yields the
+        transformed items. Collectors that paginate override this to yield
+        page by page, so memory is bounded by page size and downstream
+        processing overlaps with network waits.
+
+        Yields:
+            Unified items (same structure as transform())
+        """
+        raw_data = await self.fetch(**kwargs)
+        for item in self.transform(raw_data, self.source_type):
+            yield item
+
     def generate_hash(self, content: Dict[str, Any]) -> str:
         """Generate a unique hash for content deduplication.
 
@@ -169,7 +192,12 @@ class FollowCollector(BaseCollector):
         read_more_text: str = "阅读更多...",
         item_type: str = "article",
         custom_source_format: Optional[callable] = None,
-        transform_callback: Optional[callable] = None
+        transform_callback: Optional[callable] = None,
+        session_manager: Optional[SessionManager] = None,
+        cursor_store: Optional[CursorStore] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        two_phase: Optional[bool] = None,
+        prefilter: Optional[Callable[[Dict[str, Any]], bool]] = None
     ):
         """Initialize Follow.is collector.
 
@@ -185,6 +213,17 @@ class FollowCollector(BaseCollector):
             transform_callback: Optional function to transform entries.
                 Should have signature: (entries: Dict, feeds: Dict, ...) -> Dict
                 If not provided, uses default _transform_entry method.
+            session_manager: Optional shared HTTP session manager. A temporary
+                one is used per fetch() when not provided.
+            cursor_store: Optional cursor store enabling incremental fetching.
+                Without one, every fetch() starts from the newest entry.
+            coalescer: Optional request coalescer shared with other
+                collectors, so pages of the same list or feed are fetched once
+            two_phase: Page entries without content, then fetch content only
+                for entries that pass the filters (or from FOLO_TWO_PHASE env)
+            prefilter: Optional check on an entry's title, url and source in
+                two-phase mode; entries it rejects are dropped before their
+                content is fetched
         """
         super().__init__(name)
 
@@ -197,102 +236,401 @@ class FollowCollector(BaseCollector):
         self.item_type = item_type
         self.custom_source_format = custom_source_format
         self.transform_callback = transform_callback
+        self.session_manager = session_manager
+        self.cursor_store = cursor_store
+        self.coalescer = coalescer
+        self.prefilter = prefilter
+        self.two_phase = two_phase if two_phase is not None else (
+            os.getenv("FOLO_TWO_PHASE", "false").lower() == "true"
+        )
 
         # Global Follow.is configuration
         self.fetch_pages = int(os.getenv("FOLO_FETCH_PAGES", "3"))
         self.filter_days = int(os.getenv("FOLO_FILTER_DAYS", "3"))
         self.cookie = os.getenv("FOLO_COOKIE", "")
         self.api_url = os.getenv("FOLO_DATA_API", "https://api.follow.is/entries")
+        self.throttle_retries = int(os.getenv("FOLO_THROTTLE_RETRIES", "3"))
+        self.content_concurrency = int(os.getenv("FOLO_CONTENT_CONCURRENCY", "8"))
+
+        # Shared by every collector on the API host, so together they keep one pace
+        self.pacer = get_pacer(self.api_url)
+
+    @property
+    def cursor_key(self) -> str:
+        """Key identifying this collector's feed or list in the cursor store."""
+        if self.feed_id:
+            return f"{self.name}:feed:{self.feed_id}"
+        return f"{self.name}:list:{self.list_id}"
 
     async def fetch(self, **kwargs) -> Dict[str, Any]:
         """Fetch data from Follow.is API.
 
+        With a cursor store configured, only entries newer than the last
+        run are fetched and pagination stops at the first known entry.
+        Pagination also stops once a page reaches entries older than
+        FOLO_FILTER_DAYS.
+
+        In two-phase mode pages are requested without content and only the
+        entries that pass the date, duplicate-URL and prefilter checks have
+        their content fetched.
+
         Returns:
             Dictionary with JSFeed structure containing items
         """
         all_items = []
+
+        async for page_items in self._iter_pages():
+            all_items.extend(page_items)
+
+        logger.info(f"{self.name}: Collected {len(all_items)} items")
+
+        response = self._empty_response()
+        response["items"] = all_items
+        return response
+
+    async def stream(self, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Yield unified items page by page as they are fetched.
+
+        Yields:
+            Unified items (same structure as transform())
+        """
+        count = 0
+
+        async for page_items in self._iter_pages():
+            for item in self.transform({"items": page_items}, self.source_type):
+                count += 1
+                yield item
+
+        logger.info(f"{self.name}: Streamed {count} items")
+
+    async def _iter_pages(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Fetch Follow.is pages and yield the transformed entries of each.
+
+        Yields:
+            List of JSFeed items per page (entries outside the date window
+            are dropped)
+        """
         published_after = None
 
         # Check if required ID is configured
         feed_or_list_id = self.feed_id or self.list_id
         if not feed_or_list_id:
             logger.warning(f"{self.name}: No feed_id or list_id configured")
-            return self._empty_response()
+            return
+
+        # Incremental state from the previous run
+        cursor = self.cursor_store.get(self.cursor_key) if self.cursor_store else None
+        seen_ids = set(cursor.get("seen_ids", [])) if cursor else set()
+        last_published = parse_published_at(cursor.get("published_at", "")) if cursor else None
+
+        fetched_ids: List[str] = []
+        newest_published = None
+        failed = False
+        # URLs kept this run, so two-phase mode fetches each one's content once
+        seen_urls: Set[str] = set()
 
-        async with aiohttp.ClientSession() as session:
+        async with SessionManager.scoped(self.session_manager) as http:
             for page in range(self.fetch_pages):
+                reached_known = False
+                page_items = []
+                pending: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+
                 try:
                     headers = get_follow_headers(self.cookie)
                     body = self._build_request_body(published_after)
 
                     logger.info(f"{self.name}: Fetching page {page + 1}/{self.fetch_pages}")
 
-                    async with session.post(
-                        self.api_url,
-                        headers=headers,
-                        json=body,
-                        timeout=aiohttp.ClientTimeout(total=30)
-                    ) as resp:
-                        if resp.status != 200:
-                            logger.error(
-                                f"{self.name}: Failed to fetch page {page + 1}: "
-                                f"HTTP {resp.status}"
-                            )
+                    data = await self._request_page(http, headers, body)
+                    if data is None:
+                        logger.error(f"{self.name}: Failed to fetch page {page + 1}")
+                        failed = True
+                        break
+
+                    if not data or not data.get("data"):
+                        logger.info(f"{self.name}: No more data at page {page + 1}")
+                        break
+
+                    # Process and filter items
+                    for entry in data["data"]:
+                        if not entry.get("entries"):
+                            continue
+
+                        entries = entry["entries"]
+                        feeds = entry.get("feeds", {})
+                        entry_published = entries.get("publishedAt", "")
+
+                        # Stop at the first entry fetched by a previous run
+                        if cursor and self._is_known_entry(
+                            entries, seen_ids, last_published
+                        ):
+                            reached_known = True
                             break
 
-                        data = await resp.json()
+                        fetched_ids.append(entries.get("id", ""))
+                        if newest_published is None:
+                            newest_published = entry_published
+
+                        # Filter by date
+                        if not is_date_within_last_days(
+                            entry_published,
+                            self.filter_days
+                        ):
+                            continue
+
+                        # Two-phase mode: content is fetched after the page
+                        if self.two_phase:
+                            if self._keep_before_content(entries, feeds, seen_urls):
+                                pending.append((entries, feeds))
+                            continue
+
+                        # Transform to unified format
+                        item = self._transform_entry(entries, feeds)
+                        page_items.append(item)
+
+                    if pending:
+                        page_items.extend(await self._transform_with_content(http, pending))
+
+                    if page_items:
+                        yield page_items
+
+                    if reached_known:
+                        logger.info(
+                            f"{self.name}: Reached previously fetched entries "
+                            f"at page {page + 1}"
+                        )
+                        break
+
+                    # Pages are newest first, so later pages are out of range too
+                    oldest = data["data"][-1].get("entries") or {}
+                    if not is_date_within_last_days(
+                        oldest.get("publishedAt", ""),
+                        self.filter_days
+                    ):
+                        logger.info(
+                            f"{self.name}: Reached entries older than "
+                            f"{self.filter_days} days at page {page + 1}"
+                        )
+                        break
+
+                    # Update cursor for next page
+                    published_after = oldest["publishedAt"]
 
-                        if not data or not data.get("data"):
-                            logger.info(f"{self.name}: No more data at page {page + 1}")
-                            break
+                except Exception as e:
+                    logger.error(f"{self.name}: Error fetching page {page + 1}: {e}")
+                    failed = True
+                    break
 
-                        # Process and filter items
-                        for entry in data["data"]:
-                            if not entry.get("entries"):
-                                continue
+        # Only advance the cursor after a clean run, so a failed page is retried
+        if self.cursor_store and not failed and fetched_ids:
+            self.cursor_store.update(self.cursor_key, newest_published, fetched_ids)
 
-                            entries = entry["entries"]
-                            feeds = entry.get("feeds", {})
+    async def _request_page(
+        self,
+        http: SessionManager,
+        headers: Dict[str, str],
+        body: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Request one page, through the coalescer when configured.
 
-                            # Filter by date
-                            if not is_date_within_last_days(
-                                entries.get("publishedAt", ""),
-                                self.filter_days
-                            ):
-                                continue
+        Args:
+            http: Session manager
+            headers: Request headers
+            body: Request body
 
-                            # Transform to unified format
-                            item = self._transform_entry(entries, feeds)
-                            all_items.append(item)
+        Returns:
+            Parsed response (shared with other collectors, so read-only),
+            or None on a non-200 response
+        """
+        return await self._request(http, "POST", headers, body, json=body)
 
-                        # Update cursor for next page
-                        if data["data"]:
-                            published_after = data["data"][-1]["entries"]["publishedAt"]
+    async def _request(
+        self,
+        http: SessionManager,
+        method: str,
+        headers: Dict[str, str],
+        key_body: Dict[str, Any],
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """Send an API request, through the coalescer when configured.
 
-                except Exception as e:
-                    logger.error(f"{self.name}: Error fetching page {page + 1}: {e}")
-                    break
+        Args:
+            http: Session manager
+            method: HTTP method
+            headers: Request headers
+            key_body: Request body or query identifying the request
+            **kwargs: Passed through to SessionManager.request (json, params)
 
-                # Random delay between pages
-                if page < self.fetch_pages - 1:
-                    await sleep_random()
+        Returns:
+            Parsed response, or None on a non-200 response
+        """
+        if self.coalescer is None:
+            return await self._send(http, method, headers, **kwargs)
+        return await self.coalescer.run(
+            request_key(self.api_url, key_body),
+            lambda: self._send(http, method, headers, **kwargs)
+        )
+
+    async def _send(
+        self,
+        http: SessionManager,
+        method: str,
+        headers: Dict[str, str],
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """Send an API request, paced by the API host's shared pacer.
 
-        logger.info(f"{self.name}: Collected {len(all_items)} items")
+        Throttled responses (429/503) are retried after the pacer's pause,
+        up to FOLO_THROTTLE_RETRIES times.
 
-        return {
-            "version": "https://jsonfeed.org/version/1.1",
-            "title": f"{self.source_name} Feeds",
-            "home_page_url": self.home_url,
-            "description": f"Aggregated {self.source_name} feeds",
-            "language": "zh-cn",
-            "items": all_items
+        Returns:
+            Parsed response, or None on a non-200 response
+        """
+        for attempt in range(self.throttle_retries + 1):
+            await self.pacer.acquire()
+            started = time.monotonic()
+            try:
+                async with http.request(
+                    method,
+                    self.api_url,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=30),
+                    **kwargs
+                ) as resp:
+                    if resp.status != 200:
+                        self.pacer.on_response(
+                            resp.status, time.monotonic() - started, resp.headers.get("Retry-After")
+                        )
+                        if resp.status in THROTTLE_STATUSES and attempt < self.throttle_retries:
+                            continue
+                        logger.error(f"{self.name}: HTTP {resp.status} from {self.api_url}")
+                        return None
+
+                    data = await resp.json()
+                    self.pacer.on_response(resp.status, time.monotonic() - started)
+                    return data or {}
+
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                self.pacer.on_error()
+                raise
+
+        return None
+
+    def _keep_before_content(
+        self,
+        entries: Dict[str, Any],
+        feeds: Dict[str, Any],
+        seen_urls: Set[str]
+    ) -> bool:
+        """Decide from title and URL alone whether an entry's content is needed.
+
+        Args:
+            entries: Entry data from API, without content
+            feeds: Feed metadata from API
+            seen_urls: URLs kept earlier this run (updated in place)
+
+        Returns:
+            True if the entry's content should be fetched
+        """
+        url = entries.get("url", "")
+        if url and url in seen_urls:
+            return False
+
+        preview = {
+            "title": entries.get("title") or "",
+            "url": url,
+            "source": feeds.get("title", self.source_name),
         }
+        if self.prefilter is not None and not self.prefilter(preview):
+            logger.debug(f"{self.name}: Pre-filtered {url or entries.get('id', '')}")
+            return False
+
+        if url:
+            seen_urls.add(url)
+        return True
+
+    async def _transform_with_content(
+        self,
+        http: SessionManager,
+        pending: List[Tuple[Dict[str, Any], Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Fetch the content of entries concurrently, then transform them.
+
+        Entries whose content cannot be fetched keep their description.
+
+        Args:
+            http: Session manager
+            pending: (entries, feeds) pairs that passed the filters
+
+        Returns:
+            Transformed items, in the order given
+        """
+        semaphore = asyncio.Semaphore(self.content_concurrency)
+        headers = get_follow_headers(self.cookie)
+
+        async def fetch_content(entries: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                content = await self._fetch_content(http, headers, entries)
+            # Pages may be shared with other collectors, so copy the entry
+            return {**entries, "content": content}
+
+        filled = await asyncio.gather(*(fetch_content(entries) for entries, _ in pending))
+        logger.info(f"{self.name}: Fetched content of {len(filled)} entries")
+        return [self._transform_entry(entries, feeds) for entries, (_, feeds) in zip(filled, pending)]
+
+    async def _fetch_content(
+        self,
+        http: SessionManager,
+        headers: Dict[str, str],
+        entries: Dict[str, Any]
+    ) -> str:
+        """Request one entry with its content.
+
+        Returns:
+            Content HTML, or the entry's description if it cannot be fetched
+        """
+        fallback = entries.get("content") or entries.get("description") or ""
+        entry_id = entries.get("id")
+        if not entry_id:
+            return fallback
+
+        try:
+            data = await self._request(http, "GET", headers, {"id": entry_id}, params={"id": entry_id})
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.warning(f"{self.name}: Failed to fetch content of {entry_id}: {e!r}")
+            return fallback
+
+        entry = ((data or {}).get("data") or {}).get("entries") or {}
+        return entry.get("content") or fallback
+
+    @staticmethod
+    def _is_known_entry(
+        entries: Dict[str, Any],
+        seen_ids: set,
+        last_published: Optional[datetime]
+    ) -> bool:
+        """Check whether an entry was already fetched by a previous run.
+
+        Args:
+            entries: Entry data from API
+            seen_ids: Entry IDs recorded in the cursor
+            last_published: Newest publishedAt recorded in the cursor
+
+        Returns:
+            True if the entry is not new
+        """
+        if entries.get("id") and entries["id"] in seen_ids:
+            return True
+
+        published = parse_published_at(entries.get("publishedAt", ""))
+        return bool(published and last_published and published < last_published)
 
     def _build_request_body(self, published_after: Optional[str] = None) -> Dict[str, Any]:
         """Build request body for Follow.is API."""
         body: Dict[str, Any] = {
             "view": 1,
-            "withContent": True,
+            # Two-phase mode fetches content only for entries that pass the filters
+            "withContent": not self.two_phase,
         }
 
         # Use feedId or listId based on configuration
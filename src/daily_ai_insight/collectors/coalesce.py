@@ -0,0 +1,211 @@
+"""Single-flight coalescing of identical Follow.is page requests."""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import sqlite3
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional, Callable, Awaitable
+
+import aiohttp
+
+from ..net.pacing import THROTTLE_STATUSES, get_pacer
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+def request_key(url: str, body: Dict[str, Any]) -> str:
+    """Key of a request: its URL and canonical JSON body.
+
+    Args:
+        url: Request URL
+        body: JSON request body
+
+    Returns:
+        SHA256 hex digest
+    """
+    canonical = json.dumps(body, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(f"{url}\n{canonical}".encode("utf-8")).hexdigest()
+
+
+async def post_page(
+    session: aiohttp.ClientSession,
+    body: Dict[str, Any],
+    headers: Dict[str, str],
+    url: str = "https://api.follow.is/entries",
+    timeout: float = 30,
+    throttle_retries: Optional[int] = None
+) -> Dict[str, Any]:
+    """POST one entries request, paced with every other request to its host.
+
+    Throttled responses (429/503) are retried after the pacer's pause.
+
+    Args:
+        session: HTTP session
+        body: JSON request body
+        headers: Request headers, including the Follow.is cookie
+        url: Entries API URL
+        timeout: Total request timeout in seconds
+        throttle_retries: Retries of a throttled request (or from
+            FOLO_THROTTLE_RETRIES env, default 3)
+
+    Returns:
+        Parsed response
+
+    Raises:
+        aiohttp.ClientResponseError: On a non-200 response, or when still
+            throttled after all retries
+    """
+    if throttle_retries is None:
+        throttle_retries = int(os.getenv("FOLO_THROTTLE_RETRIES", "3"))
+    pacer = get_pacer(url)
+
+    for attempt in range(throttle_retries + 1):
+        await pacer.acquire()
+        started = time.monotonic()
+        try:
+            async with session.post(
+                url, headers=headers, json=body, timeout=aiohttp.ClientTimeout(total=timeout)
+            ) as resp:
+                if resp.status != 200:
+                    pacer.on_response(
+                        resp.status, time.monotonic() - started, resp.headers.get("Retry-After")
+                    )
+                    if resp.status in THROTTLE_STATUSES and attempt < throttle_retries:
+                        logger.debug(f"Throttled by {url}, retrying the same page")
+                        continue
+                    resp.raise_for_status()
+                data = await resp.json()
+        except aiohttp.ClientResponseError:
+            raise
+        except (aiohttp.ClientError, TimeoutError):
+            pacer.on_error()
+            raise
+
+        pacer.on_response(200, time.monotonic() - started)
+        return data or {}
+
+    return {}
+
+
+class RequestCoalescer:
+    """Run each distinct request once per run or cache window.
+
+    Configuration via environment variables:
+        FOLO_PAGE_CACHE_PATH: Page cache database file
+            (default: storage/data/follow_pages.db)
+        FOLO_PAGE_CACHE_TTL: Seconds a page is reused; 0 keeps only
+            in-flight coalescing (default: 300)
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[float] = None):
+        """Open (or create) the page cache and drop expired pages.
+
+        Args:
+            path: SQLite database file (or from FOLO_PAGE_CACHE_PATH env)
+            ttl: Cache window in seconds (or from FOLO_PAGE_CACHE_TTL env)
+        """
+        self.path = Path(path or os.getenv("FOLO_PAGE_CACHE_PATH", "storage/data/follow_pages.db"))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl if ttl is not None else float(os.getenv("FOLO_PAGE_CACHE_TTL", "300"))
+        self.counts = {"requests": 0, "coalesced": 0, "cached": 0}
+
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self.prune()
+
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the result of a request, sending it only if needed.
+
+        Results that are None and exceptions are not cached; an exception
+        is raised to every caller waiting on that request.
+
+        Args:
+            key: Request key (see request_key())
+            call: Sends the request and returns its parsed response
+
+        Returns:
+            The response, shared with other callers of the same key
+        """
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.counts["coalesced"] += 1
+            return await asyncio.shield(task)
+
+        cached = self._get(key)
+        if cached is not None:
+            self.counts["cached"] += 1
+            return cached
+
+        # Shielded, so a caller that times out does not cancel the others
+        task = asyncio.ensure_future(call())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._finish(key, done))
+        self.counts["requests"] += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if task.result() is not None and self.ttl > 0:
+            self._store(key, task.result())
+
+    def _get(self, key: str) -> Optional[Any]:
+        if self.ttl <= 0:
+            return None
+        row = self._conn.execute(
+            "SELECT response FROM pages WHERE key = ? AND fetched_at > ?",
+            (key, time.time() - self.ttl)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _store(self, key: str, response: Any):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO pages (key, response, fetched_at) VALUES (?, ?, ?)",
+            (key, json.dumps(response, ensure_ascii=False), time.time())
+        )
+        self._conn.commit()
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete pages older than the cache window.
+
+        Args:
+            now: Reference time, defaults to now
+
+        Returns:
+            Number of pages removed
+        """
+        now = now or time.time()
+        removed = self._conn.execute(
+            "DELETE FROM pages WHERE fetched_at <= ?", (now - self.ttl,)
+        ).rowcount
+        self._conn.commit()
+        return removed
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of sent, coalesced and cached requests."""
+        return dict(self.counts, entries=len(self))
+
+    def close(self):
+        """Commit and close the database."""
+        self._conn.commit()
+        self._conn.close()
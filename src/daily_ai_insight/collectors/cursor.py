@@ -0,0 +1,167 @@
+"""Persisted fetch cursors for incremental Follow.is collection."""
+
+import os
+import json
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def parse_published_at(value: str) -> Optional[datetime]:
+    """Parse a Follow.is ``publishedAt`` value into an aware datetime.
+
+    Args:
+        value: ISO 8601 timestamp, optionally ending in "Z"
+
+    Returns:
+        Timezone-aware datetime, or None if the value cannot be parsed
+    """
+    if not value:
+        return None
+
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class CursorStore:
+    """JSON-file store of per-feed/list fetch cursors.
+
+    Each feed or list remembers the newest ``publishedAt`` it has seen and
+    the IDs of its most recent entries, so FollowCollector can stop
+    paginating at the first entry it already knows.
+
+    Configuration via environment variables:
+        FOLO_CURSOR_PATH: Cursor file location (default: storage/data/follow_cursors.json)
+
+    Cursor structure:
+        {
+            "published_at": str - newest publishedAt seen,
+            "seen_ids": List[str] - most recent entry IDs, newest first,
+            "updated_at": str
+        }
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_seen_ids: int = 200,
+        auto_commit: bool = True
+    ):
+        """Initialize the cursor store.
+
+        Args:
+            path: Cursor file path (or from FOLO_CURSOR_PATH env)
+            max_seen_ids: Number of recent entry IDs kept per cursor
+            auto_commit: Persist each update() immediately. When False,
+                updates are held until commit(), so a run that fails before
+                its report is saved fetches the same entries again
+        """
+        self.path = Path(
+            path or os.getenv("FOLO_CURSOR_PATH", "storage/data/follow_cursors.json")
+        )
+        self.max_seen_ids = max_seen_ids
+        self.auto_commit = auto_commit
+        self._pending: List[Tuple[str, Optional[str], List[str]]] = []
+        self._cursors: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load cursors from disk."""
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except Exception as e:
+            logger.warning(f"Error loading fetch cursors: {e}")
+            return {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the cursor for a feed or list.
+
+        Args:
+            key: Cursor key
+
+        Returns:
+            Cursor dictionary, or None if the source has never been fetched
+        """
+        return self._cursors.get(key)
+
+    def update(self, key: str, published_at: Optional[str], entry_ids: List[str]):
+        """Advance a cursor and persist it, or hold it until commit().
+
+        Args:
+            key: Cursor key
+            published_at: Newest publishedAt fetched in this run
+            entry_ids: IDs fetched in this run, newest first
+        """
+        if not self.auto_commit:
+            self._pending.append((key, published_at, list(entry_ids)))
+            return
+        self._advance(key, published_at, entry_ids)
+        self.save()
+
+    def commit(self) -> int:
+        """Apply and persist the updates held since the last commit.
+
+        Returns:
+            Number of updates applied
+        """
+        pending, self._pending = self._pending, []
+        for key, published_at, entry_ids in pending:
+            self._advance(key, published_at, entry_ids)
+        if pending:
+            self.save()
+        return len(pending)
+
+    def _advance(self, key: str, published_at: Optional[str], entry_ids: List[str]):
+        previous = self._cursors.get(key, {})
+
+        newest = previous.get("published_at")
+        new_dt = parse_published_at(published_at or "")
+        old_dt = parse_published_at(newest or "")
+        if new_dt and (old_dt is None or new_dt > old_dt):
+            newest = published_at
+
+        seen_ids = list(dict.fromkeys(
+            [i for i in entry_ids if i] + previous.get("seen_ids", [])
+        ))
+
+        self._cursors[key] = {
+            "published_at": newest,
+            "seen_ids": seen_ids[:self.max_seen_ids],
+            "updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def reset(self, key: Optional[str] = None):
+        """Forget one cursor, or all of them.
+
+        Args:
+            key: Cursor key, or None to clear every cursor
+        """
+        if key is None:
+            self._cursors.clear()
+        else:
+            self._cursors.pop(key, None)
+        self.save()
+
+    def save(self):
+        """Write cursors to disk atomically."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._cursors, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.error(f"Error saving fetch cursors: {e}")
@@ -11,8 +11,13 @@ Example:
     data = await collector.fetch()
 """
 
-from typing import Optional, Callable
-from .base import FollowCollector
+from typing import Optional, Callable, Dict, Any
+from ..net import SessionManager
+from .base import BaseCollector, FollowCollector
+from .cursor import CursorStore
+from .coalesce import RequestCoalescer
+from .http_cache import HTTPCache
+from .rss import RSSCollector
 from .transformers import (
     twitter_transform,
     weibo_transform,
@@ -125,6 +130,42 @@ def create_mixed_collector(
     )
 
 
+def create_rss_collector(
+    name: str = "rss",
+    config_path: Optional[str] = None,
+    source_name: str = "RSS Feeds",
+    session_manager: Optional[SessionManager] = None,
+    http_cache: Optional[HTTPCache] = None
+) -> RSSCollector:
+    """
+    Create a collector for the RSS fallback sources.
+
+    Reads ``fallback_sources`` from configs/sources.yaml (or RSS_SOURCES_PATH)
+    and fetches the feeds directly, without Follow.is.
+
+    Args:
+        name: Collector name
+        config_path: Sources file (default: RSS_SOURCES_PATH env)
+        source_name: Display name for the collector
+        session_manager: Optional shared HTTP session manager
+        http_cache: Optional conditional-GET response cache
+
+    Returns:
+        Configured RSSCollector
+
+    Example:
+        collector = create_rss_collector(http_cache=HTTPCache())
+        data = await collector.fetch()
+    """
+    return RSSCollector(
+        name=name,
+        config_path=config_path,
+        source_name=source_name,
+        session_manager=session_manager,
+        http_cache=http_cache
+    )
+
+
 # ============================================================================
 # Generic Factory Function
 # ============================================================================
@@ -137,7 +178,12 @@ def create_collector(
     home_url: str = "https://follow.is",
     item_type: str = "article",
     transform_callback: Optional[Callable] = None,
-    custom_source_format: Optional[Callable] = None
+    custom_source_format: Optional[Callable] = None,
+    session_manager: Optional[SessionManager] = None,
+    cursor_store: Optional[CursorStore] = None,
+    coalescer: Optional[RequestCoalescer] = None,
+    two_phase: Optional[bool] = None,
+    prefilter: Optional[Callable[[Dict[str, Any]], bool]] = None
 ) -> FollowCollector:
     """
     Generic factory function for creating any collector.
@@ -153,6 +199,12 @@ def create_collector(
         item_type: Type identifier (article, tweet, post, etc.)
         transform_callback: Optional transform function
         custom_source_format: Optional source formatter
+        session_manager: Optional shared HTTP session manager
+        cursor_store: Optional cursor store for incremental fetching
+        coalescer: Optional request coalescer shared between collectors
+        two_phase: Fetch content only for entries that pass the filters
+            (default: FOLO_TWO_PHASE env)
+        prefilter: Optional title/URL check applied before content is fetched
 
     Returns:
         Configured FollowCollector
@@ -174,7 +226,12 @@ def create_collector(
         home_url=home_url,
         item_type=item_type,
         transform_callback=transform_callback,
-        custom_source_format=custom_source_format
+        custom_source_format=custom_source_format,
+        session_manager=session_manager,
+        cursor_store=cursor_store,
+        coalescer=coalescer,
+        two_phase=two_phase,
+        prefilter=prefilter
     )
 
 
@@ -257,17 +314,25 @@ PRESET_CONFIGS = {
     },
 }
 
+# Presets that fetch feeds directly instead of through Follow.is
+RSS_PRESET_CONFIGS = {
+    "rss": {
+        "name": "rss",
+        "source_name": "RSS Feeds",
+    },
+}
+
 
-def create_from_preset(preset: str, **overrides) -> FollowCollector:
+def create_from_preset(preset: str, **overrides) -> BaseCollector:
     """
     Create a collector from a preset configuration.
 
     Args:
-        preset: Preset name (twitter, reddit, papers, mixed)
+        preset: Preset name (twitter, reddit, papers, mixed, rss, ...)
         **overrides: Override any preset configuration
 
     Returns:
-        Configured FollowCollector
+        Configured FollowCollector, or RSSCollector for RSS presets
 
     Raises:
         KeyError: If preset name is not found
@@ -279,8 +344,12 @@ def create_from_preset(preset: str, **overrides) -> FollowCollector:
             list_id_env="MY_CUSTOM_TWITTER_LIST"
         )
     """
+    if preset in RSS_PRESET_CONFIGS:
+        config = {**RSS_PRESET_CONFIGS[preset], **overrides}
+        return create_rss_collector(**config)
+
     if preset not in PRESET_CONFIGS:
-        available = ", ".join(PRESET_CONFIGS.keys())
+        available = ", ".join([*PRESET_CONFIGS, *RSS_PRESET_CONFIGS])
         raise KeyError(f"Unknown preset '{preset}'. Available: {available}")
 
     config = {**PRESET_CONFIGS[preset], **overrides}
@@ -8,16 +8,33 @@ Supports optional translation of descriptions to Chinese.
 import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
-import httpx
+import aiohttp
 
+from ..net import SessionManager
 from .base import BaseCollector
+from .http_cache import HTTPCache
 
 
 class GitHubTrendingCollector(BaseCollector):
     """Collect trending repositories from GitHub"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        session_manager: Optional[SessionManager] = None,
+        http_cache: Optional[HTTPCache] = None
+    ):
+        """Initialize the collector.
+
+        Args:
+            session_manager: Optional shared HTTP session manager
+            http_cache: Optional response cache; the list is then reused for
+                GITHUB_TRENDING_CACHE_TTL seconds (default: 3600) and
+                revalidated with conditional requests after that
+        """
         super().__init__("github_trending")
+        self.session_manager = session_manager
+        self.http_cache = http_cache
+        self.cache_ttl = float(os.getenv('GITHUB_TRENDING_CACHE_TTL', '3600'))
         self.api_url = os.getenv(
             'GITHUB_TRENDING_API',
             'https://gh-trending-api.com/repositories'
@@ -35,10 +52,27 @@ class GitHubTrendingCollector(BaseCollector):
                 params['language'] = self.language_filter
                 params['spoken_language_code'] = 'en'  # Get English descriptions
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                projects = response.json()
+            async with SessionManager.scoped(self.session_manager) as http:
+                if self.http_cache is not None:
+                    cached = await self.http_cache.fetch(
+                        http,
+                        url,
+                        params=params,
+                        ttl=self.cache_ttl,
+                        timeout=aiohttp.ClientTimeout(total=30)
+                    )
+                    if cached.stale:
+                        print("⚠️  GitHub Trending unavailable, using cached list")
+                    projects = cached.json()
+                else:
+                    async with http.request(
+                        "GET",
+                        url,
+                        params=params,
+                        timeout=aiohttp.ClientTimeout(total=30)
+                    ) as response:
+                        response.raise_for_status()
+                        projects = await response.json(content_type=None)
 
             if not isinstance(projects, list):
                 print(f"⚠️  GitHub Trending API returned non-list data: {type(projects)}")
@@ -57,10 +91,10 @@ class GitHubTrendingCollector(BaseCollector):
             # Transform to unified format
             return self._transform_items(projects)
 
-        except httpx.HTTPStatusError as e:
+        except aiohttp.ClientResponseError as e:
             print(f"❌ HTTP error fetching GitHub Trending: {e}")
             return []
-        except httpx.RequestError as e:
+        except aiohttp.ClientError as e:
             print(f"❌ Request error fetching GitHub Trending: {e}")
             return []
         except Exception as e:
@@ -0,0 +1,173 @@
+"""Streaming HTML-to-text extraction."""
+
+import re
+import hashlib
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import List, Tuple
+
+# Elements whose text is never part of the readable content. Template and
+# ruby annotation text was never returned by BeautifulSoup's get_text either.
+SKIP_TAGS = frozenset({"script", "style", "template", "rt", "rp"})
+
+# Elements that never have content or an end tag
+VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen",
+    "link", "menuitem", "meta", "param", "source", "track", "wbr",
+})
+
+_BLANK_LINES = re.compile(r'\n\s*\n')
+
+
+class HTMLTextExtractor(HTMLParser):
+    """Collect the text nodes of an HTML document without building a tree.
+
+    Character data is buffered until the next markup event, because the
+    tokenizer may split one text node into several ``handle_data`` calls.
+    Only the names of open elements are kept, so that an end tag closes
+    any unclosed elements inside it the way BeautifulSoup does.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._lines: List[str] = []
+        self._buffer: List[str] = []
+        self._open_tags: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, str]]):
+        self._flush()
+        if tag in VOID_TAGS:
+            return
+        self._open_tags.append(tag)
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str):
+        self._flush()
+        if tag not in self._open_tags:
+            return
+        while True:
+            closed = self._open_tags.pop()
+            if closed in SKIP_TAGS:
+                self._skip_depth -= 1
+            if closed == tag:
+                break
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, str]]):
+        self._flush()
+
+    def handle_data(self, data: str):
+        if not self._skip_depth:
+            self._buffer.append(data)
+
+    def handle_comment(self, data: str):
+        self._flush()
+
+    def handle_decl(self, decl: str):
+        self._flush()
+
+    def handle_pi(self, data: str):
+        self._flush()
+
+    def unknown_decl(self, data: str):
+        self._flush()
+        # CDATA sections are text nodes of their own
+        if data.startswith("CDATA[") and not self._skip_depth:
+            self._buffer.append(data[6:])
+            self._flush()
+
+    def _flush(self):
+        """Close the current text node."""
+        if self._buffer:
+            text = "".join(self._buffer).strip()
+            if text:
+                self._lines.append(text)
+            self._buffer.clear()
+
+    def get_text(self) -> str:
+        """Finish parsing and return the extracted text."""
+        self.close()
+        self._flush()
+        text = "\n".join(self._lines)
+        return _BLANK_LINES.sub('\n\n', text).strip()
+
+
+class _TextCache:
+    """Small LRU cache keyed by the BLAKE2 digest of the HTML."""
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, str]" = OrderedDict()
+
+    @staticmethod
+    def key(html_content: str) -> bytes:
+        return hashlib.blake2b(
+            html_content.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+
+    def get(self, key: bytes):
+        text = self._entries.get(key)
+        if text is not None:
+            self._entries.move_to_end(key)
+        return text
+
+    def put(self, key: bytes, text: str):
+        self._entries[key] = text
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+_cache = _TextCache()
+
+
+def html_to_text(html_content: str, use_cache: bool = True) -> str:
+    """Convert HTML to plain text without building an element tree.
+
+    Output matches ``BeautifulSoup(...).get_text()``: every
+    text node becomes one stripped line, script and style contents are
+    dropped, and blank runs collapse to a single blank line. Results are
+    memoized by a BLAKE2 digest of the input.
+
+    Example:
+        html_to_text("<p>Hello <b>world</b></p><script>x()</script>")
+        # "Hello\nworld"
+
+    Args:
+        html_content: HTML content string
+        use_cache: Reuse the result of an earlier call on identical HTML
+
+    Returns:
+        Plain text, one line per text node
+    """
+    if not html_content:
+        return ""
+
+    if not use_cache:
+        return _extract(html_content)
+
+    key = _cache.key(html_content)
+    text = _cache.get(key)
+    if text is None:
+        text = _extract(html_content)
+        _cache.put(key, text)
+    return text
+
+
+def clear_cache():
+    """Drop all memoized conversions."""
+    _cache.clear()
+
+
+def _extract(html_content: str) -> str:
+    """Run the extractor over one document."""
+    # Fast path for plain text, which is common in tweet and title fields
+    if "<" not in html_content and "&" not in html_content:
+        return _BLANK_LINES.sub('\n\n', html_content.strip()).strip()
+
+    parser = HTMLTextExtractor()
+    parser.feed(html_content)
+    return parser.get_text()
@@ -0,0 +1,225 @@
+"""On-disk HTTP response cache with conditional revalidation."""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+import aiohttp
+from yarl import URL
+
+from ..net import SessionManager
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_type TEXT,
+    body BLOB NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+class CachedResponse:
+    """Body and metadata of a response served through HTTPCache."""
+
+    def __init__(
+        self,
+        url: str,
+        body: bytes,
+        content_type: str = "",
+        from_cache: bool = False,
+        stale: bool = False
+    ):
+        """Initialize the response.
+
+        Args:
+            url: Requested URL including the query string
+            body: Response body
+            content_type: Content-Type header
+            from_cache: True if the body came from disk (fresh hit or 304)
+            stale: True if the source failed and an expired body was served
+        """
+        self.url = url
+        self.body = body
+        self.content_type = content_type
+        self.from_cache = from_cache
+        self.stale = stale
+
+    def text(self, encoding: str = "utf-8") -> str:
+        """Decode the body."""
+        return self.body.decode(encoding, errors="replace")
+
+    def json(self) -> Any:
+        """Parse the body as JSON."""
+        return json.loads(self.body)
+
+
+class HTTPCache:
+    """SQLite-backed cache of GET responses keyed by URL.
+
+    Configuration via environment variables:
+        HTTP_CACHE_PATH: Cache database file (default: storage/data/http_cache.db)
+        HTTP_CACHE_TTL: Seconds a response is served without revalidation,
+            unless a source sets its own (default: 300)
+        HTTP_CACHE_MAX_STALE: Seconds a response may be served when the
+            source is down (default: 604800)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        default_ttl: Optional[float] = None,
+        max_stale: Optional[float] = None
+    ):
+        """Open (or create) the cache and drop responses too old to serve.
+
+        Args:
+            path: SQLite database file (or from HTTP_CACHE_PATH env)
+            default_ttl: Freshness TTL in seconds (or from HTTP_CACHE_TTL env)
+            max_stale: Maximum age of a stale response (or from HTTP_CACHE_MAX_STALE env)
+        """
+        self.path = Path(path or os.getenv("HTTP_CACHE_PATH", "storage/data/http_cache.db"))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.default_ttl = default_ttl if default_ttl is not None else float(
+            os.getenv("HTTP_CACHE_TTL", "300")
+        )
+        self.max_stale = max_stale if max_stale is not None else float(
+            os.getenv("HTTP_CACHE_MAX_STALE", "604800")
+        )
+        self.counts = {"fresh": 0, "revalidated": 0, "fetched": 0, "stale": 0}
+
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self.prune()
+
+    async def fetch(
+        self,
+        http: SessionManager,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        ttl: Optional[float] = None,
+        **kwargs
+    ) -> CachedResponse:
+        """GET a URL through the cache.
+
+        Args:
+            http: Session manager used for network requests
+            url: Request URL
+            params: Query parameters
+            headers: Extra request headers
+            ttl: Freshness TTL of this source in seconds (default: default_ttl)
+            **kwargs: Passed through to SessionManager.request (e.g. timeout)
+
+        Returns:
+            The response, from the network or from disk
+
+        Raises:
+            aiohttp.ClientError: If the request fails and nothing usable is cached
+            TimeoutError: If the request times out and nothing usable is cached
+        """
+        key = str(URL(url).update_query(params)) if params else url
+        ttl = self.default_ttl if ttl is None else ttl
+        entry = self._get(key)
+        now = time.time()
+
+        if entry is not None and now - entry["fetched_at"] < ttl:
+            self.counts["fresh"] += 1
+            return self._response(key, entry, from_cache=True)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if entry["etag"]:
+                request_headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request_headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            async with http.request("GET", key, headers=request_headers, **kwargs) as response:
+                if response.status == 304 and entry is not None:
+                    self._touch(key, response.headers)
+                    self.counts["revalidated"] += 1
+                    return self._response(key, entry, from_cache=True)
+
+                response.raise_for_status()
+                body = await response.read()
+                content_type = response.headers.get("Content-Type", "")
+                self._store(key, response.headers, content_type, body)
+                self.counts["fetched"] += 1
+                return CachedResponse(key, body, content_type)
+
+        except (aiohttp.ClientError, TimeoutError) as e:
+            if entry is None:
+                raise
+            logger.warning(f"Fetching {key} failed ({e!r}), serving cached copy")
+            self.counts["stale"] += 1
+            return self._response(key, entry, from_cache=True, stale=True)
+
+    def _get(self, url: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT etag, last_modified, content_type, body, fetched_at FROM responses "
+            "WHERE url = ? AND fetched_at > ?",
+            (url, time.time() - self.max_stale)
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("etag", "last_modified", "content_type", "body", "fetched_at"), row))
+
+    def _store(self, url: str, headers: Any, content_type: str, body: bytes):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(url, etag, last_modified, content_type, body, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (url, headers.get("ETag"), headers.get("Last-Modified"), content_type, body, time.time())
+        )
+        self._conn.commit()
+
+    def _touch(self, url: str, headers: Any):
+        """Restart the freshness TTL after a 304, keeping any new validators."""
+        self._conn.execute(
+            "UPDATE responses SET fetched_at = ?, etag = COALESCE(?, etag), "
+            "last_modified = COALESCE(?, last_modified) WHERE url = ?",
+            (time.time(), headers.get("ETag"), headers.get("Last-Modified"), url)
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _response(url: str, entry: Dict[str, Any], from_cache: bool, stale: bool = False) -> CachedResponse:
+        return CachedResponse(url, entry["body"], entry["content_type"] or "", from_cache, stale)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete responses older than max_stale.
+
+        Args:
+            now: Reference time, defaults to now
+
+        Returns:
+            Number of responses removed
+        """
+        now = now or time.time()
+        removed = self._conn.execute(
+            "DELETE FROM responses WHERE fetched_at <= ?", (now - self.max_stale,)
+        ).rowcount
+        self._conn.commit()
+        return removed
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of fresh hits, 304 revalidations, full fetches and stale serves."""
+        return dict(self.counts, entries=len(self))
+
+    def close(self):
+        """Commit and close the database."""
+        self._conn.commit()
+        self._conn.close()
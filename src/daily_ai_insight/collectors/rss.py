@@ -0,0 +1,249 @@
+"""RSS/Atom collector for the fallback sources in configs/sources.yaml."""
+
+import os
+import asyncio
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Optional, AsyncIterator
+
+import aiohttp
+import feedparser
+import yaml
+
+from ..net import SessionManager
+from .base import BaseCollector
+from .http_cache import HTTPCache
+from .utils import strip_html, escape_html, is_date_within_last_days
+
+logger = logging.getLogger(__name__)
+
+
+class RSSCollector(BaseCollector):
+    """Collect RSS and Atom feeds listed in a sources file.
+
+    Configuration via environment variables:
+        RSS_SOURCES_PATH: File with a ``fallback_sources`` list
+            (default: configs/sources.yaml)
+        RSS_CACHE_TTL: Seconds a feed is reused from the HTTP cache (default: 900)
+        RSS_FETCH_TIMEOUT: Timeout per feed in seconds (default: 20)
+        RSS_FILTER_DAYS: Entries older than this are dropped (default: the
+            file's ``filters.max_age_days``, else 7)
+        RSS_MAX_ENTRIES: Maximum entries taken from each feed (default: 50)
+    """
+
+    def __init__(
+        self,
+        name: str = "rss",
+        sources: Optional[List[Dict[str, Any]]] = None,
+        config_path: Optional[str] = None,
+        source_name: str = "RSS Feeds",
+        item_type: str = "article",
+        read_more_text: str = "阅读更多...",
+        session_manager: Optional[SessionManager] = None,
+        http_cache: Optional[HTTPCache] = None
+    ):
+        """Initialize the collector.
+
+        Args:
+            name: Collector name
+            sources: Feeds as dictionaries with name, url and optional
+                category (default: ``fallback_sources`` of the config file)
+            config_path: Sources file (or from RSS_SOURCES_PATH env)
+            source_name: Display name for the collector
+            item_type: Type identifier for items
+            read_more_text: Text for "read more" link in HTML
+            session_manager: Optional shared HTTP session manager
+            http_cache: Optional response cache; feeds are then reused for
+                RSS_CACHE_TTL seconds and revalidated with conditional requests
+        """
+        super().__init__(name)
+
+        config = {}
+        if sources is None:
+            config = _load_config(config_path or os.getenv("RSS_SOURCES_PATH", "configs/sources.yaml"))
+            sources = config.get("fallback_sources") or []
+
+        self.sources = [source for source in sources if source.get("url")]
+        self.source_name = source_name
+        self.item_type = item_type
+        self.read_more_text = read_more_text
+        self.session_manager = session_manager
+        self.http_cache = http_cache
+
+        max_age = (config.get("filters") or {}).get("max_age_days") or 7
+        self.filter_days = int(os.getenv("RSS_FILTER_DAYS", str(max_age)))
+        self.cache_ttl = float(os.getenv("RSS_CACHE_TTL", "900"))
+        self.fetch_timeout = float(os.getenv("RSS_FETCH_TIMEOUT", "20"))
+        self.max_entries = int(os.getenv("RSS_MAX_ENTRIES", "50"))
+
+    async def fetch(self, **kwargs) -> Dict[str, Any]:
+        """Fetch and parse all feeds.
+
+        Returns:
+            Dictionary with JSFeed structure whose items are already unified
+        """
+        items = []
+        async for feed_items in self._iter_feeds():
+            items.extend(feed_items)
+
+        logger.info(f"{self.name}: Collected {len(items)} items from {len(self.sources)} feeds")
+        return {
+            "version": "https://jsonfeed.org/version/1.1",
+            "title": self.source_name,
+            "items": items,
+        }
+
+    async def stream(self, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Yield unified items feed by feed, in order of completion.
+
+        Yields:
+            Unified items (same structure as transform())
+        """
+        count = 0
+        async for feed_items in self._iter_feeds():
+            for item in feed_items:
+                count += 1
+                yield item
+
+        logger.info(f"{self.name}: Streamed {count} items")
+
+    def transform(self, raw_data: Dict[str, Any], source_type: str) -> List[Dict[str, Any]]:
+        """Return the items of fetch(), which are already in unified format."""
+        return list((raw_data or {}).get("items") or [])
+
+    async def _iter_feeds(self) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Fetch all feeds concurrently and yield each feed's items when ready."""
+        if not self.sources:
+            logger.warning(f"{self.name}: No feeds configured")
+            return
+
+        async with SessionManager.scoped(self.session_manager) as http:
+            tasks = [asyncio.create_task(self._collect_feed(http, source)) for source in self.sources]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    items = await next_done
+                    if items:
+                        yield items
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _collect_feed(self, http: SessionManager, source: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Download, parse and transform one feed; any failure yields no items."""
+        name = source.get("name") or source["url"]
+        try:
+            body = await self._download(http, source["url"])
+            parsed = await asyncio.to_thread(feedparser.parse, body)
+
+            if parsed.bozo and not parsed.entries:
+                logger.error(f"{self.name}: Could not parse {name}: {parsed.get('bozo_exception')}")
+                return []
+
+            items = []
+            for entry in parsed.entries[:self.max_entries]:
+                item = self._transform_entry(entry, source, parsed.feed)
+                if item is not None:
+                    items.append(item)
+
+        except Exception as e:
+            logger.error(f"{self.name}: Failed to collect {name}: {e!r}")
+            return []
+
+        logger.debug(f"{self.name}: {name} returned {len(items)} items")
+        return items
+
+    async def _download(self, http: SessionManager, url: str) -> bytes:
+        """GET a feed body, through the HTTP cache when configured."""
+        timeout = aiohttp.ClientTimeout(total=self.fetch_timeout)
+        if self.http_cache is not None:
+            cached = await self.http_cache.fetch(http, url, ttl=self.cache_ttl, timeout=timeout)
+            if cached.stale:
+                logger.warning(f"{self.name}: {url} unavailable, using cached feed")
+            return cached.body
+
+        async with http.request("GET", url, timeout=timeout) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    def _transform_entry(
+        self,
+        entry: Dict[str, Any],
+        source: Dict[str, Any],
+        feed: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Convert a feedparser entry to a unified item.
+
+        Returns:
+            Unified item, or None for entries without a link or older than
+            RSS_FILTER_DAYS
+        """
+        url = entry.get("link", "")
+        if not url:
+            return None
+
+        published = _entry_date(entry)
+        if published and not is_date_within_last_days(published, self.filter_days):
+            return None
+
+        content_html = ""
+        if entry.get("content"):
+            content_html = entry["content"][0].get("value", "")
+        content_html = content_html or entry.get("summary", "")
+        text = strip_html(content_html)
+
+        source_label = source.get("name") or feed.get("title") or self.source_name
+        item = self.standardize_item(
+            item_id=entry.get("id") or url,
+            title=strip_html(entry.get("title", "")) or url,
+            description=text,
+            url=url,
+            published_date=published,
+            authors=entry.get("author", ""),
+            source=source_label,
+            item_type=self.item_type,
+            details={
+                "content_html": content_html,
+                "category": source.get("category", ""),
+                "feed_title": feed.get("title", ""),
+                "tags": [tag.get("term", "") for tag in entry.get("tags") or [] if tag.get("term")],
+            }
+        )
+        item["content"] = text
+        return item
+
+    def generate_html(self, item: Dict[str, Any]) -> str:
+        """Generate HTML for an RSS item."""
+        content = item.get("description", "")
+        content_preview = content[:200] + "..." if len(content) > 200 else content
+
+        return f"""
+            <strong>{escape_html(item.get('title', '无标题'))}</strong><br>
+            <small>来源: {escape_html(item.get('source', self.source_name))} |
+                   发布时间: {escape_html(item.get('published_date', '')[:16].replace('T', ' '))}</small><br>
+            <p>{escape_html(content_preview)}</p>
+            <a href="{escape_html(item.get('url', '#'))}"
+               target="_blank" rel="noopener noreferrer">{self.read_more_text}</a>
+        """
+
+
+def _load_config(path: str) -> Dict[str, Any]:
+    file = Path(path)
+    if not file.exists():
+        logger.warning(f"RSS sources file {file} not found")
+        return {}
+    try:
+        with open(file, encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning(f"Could not read {file}: {e}")
+        return {}
+
+
+def _entry_date(entry: Dict[str, Any]) -> str:
+    """Publication (or update) time of an entry as an ISO string in UTC."""
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if not parsed:
+        return ""
+    return datetime(*parsed[:6], tzinfo=timezone.utc).isoformat()
@@ -0,0 +1,258 @@
+"""Concurrent collection scheduler."""
+
+import os
+import time
+import asyncio
+import logging
+from typing import List, Dict, Any, Optional, Callable, AsyncIterator
+from urllib.parse import urlparse
+
+from .base import BaseCollector
+
+logger = logging.getLogger(__name__)
+
+
+class CollectionResult:
+    """Outcome of running a single collector."""
+
+    def __init__(
+        self,
+        collector: BaseCollector,
+        items: Optional[List[Dict[str, Any]]] = None,
+        error: Optional[BaseException] = None,
+        elapsed: float = 0.0,
+        count: Optional[int] = None
+    ):
+        self.collector = collector
+        self.items = items or []
+        self.error = error
+        self.elapsed = elapsed
+        # Streamed results do not keep their items, only how many were yielded
+        self.count = len(self.items) if count is None else count
+
+    @property
+    def ok(self) -> bool:
+        """True if the collector finished without error."""
+        return self.error is None
+
+
+class CollectionScheduler:
+    """Run collectors concurrently with global and per-host limits.
+
+    A collection pass takes roughly as long as the slowest source, and every
+    collector gets its own timeout so a hung source cannot stall the run.
+
+    Configuration via environment variables:
+        COLLECT_MAX_CONCURRENCY: Collectors running at once (default: 6)
+        COLLECT_PER_HOST_CONCURRENCY: Collectors hitting one host at once (default: 3)
+        COLLECT_TIMEOUT: Seconds allowed per collector (default: 180)
+        COLLECT_STREAM_BUFFER: Items buffered between collectors and the
+            stream consumer (default: 500)
+
+    Example:
+        scheduler = CollectionScheduler(max_concurrency=6, per_host_concurrency=3)
+        results = await scheduler.run(collectors)
+
+        # Or consume items as they arrive, page by page
+        async for item in scheduler.stream(collectors):
+            ...
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        per_host_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        stream_buffer: Optional[int] = None
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency: Maximum collectors running at the same time
+            per_host_concurrency: Maximum collectors talking to the same host
+            timeout: Per-collector timeout in seconds
+            stream_buffer: Maximum items queued by stream() before
+                collectors wait for the consumer
+        """
+        self.max_concurrency = max_concurrency or int(os.getenv("COLLECT_MAX_CONCURRENCY", "6"))
+        self.per_host_concurrency = per_host_concurrency or int(
+            os.getenv("COLLECT_PER_HOST_CONCURRENCY", "3")
+        )
+        self.timeout = timeout or float(os.getenv("COLLECT_TIMEOUT", "180"))
+        self.stream_buffer = stream_buffer or int(os.getenv("COLLECT_STREAM_BUFFER", "500"))
+
+    async def run(
+        self,
+        collectors: List[BaseCollector],
+        on_start: Optional[Callable[[BaseCollector], None]] = None,
+        on_finish: Optional[Callable[[CollectionResult], None]] = None
+    ) -> List[CollectionResult]:
+        """Run all collectors and wait for them to finish.
+
+        Args:
+            collectors: Collectors to run
+            on_start: Optional hook called when a collector starts fetching
+            on_finish: Optional hook called with each result as it completes
+
+        Returns:
+            One CollectionResult per collector, in input order
+        """
+        started = time.monotonic()
+        results = await self._run_limited(collectors, self._collect, on_start, on_finish)
+
+        logger.info(
+            f"Collection finished in {time.monotonic() - started:.1f}s "
+            f"({sum(r.ok for r in results)}/{len(results)} collectors succeeded)"
+        )
+        return results
+
+    async def stream(
+        self,
+        collectors: List[BaseCollector],
+        on_start: Optional[Callable[[BaseCollector], None]] = None,
+        on_finish: Optional[Callable[[CollectionResult], None]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run all collectors and yield their items as they arrive.
+
+        Collectors push items into a bounded queue, so at most
+        ``stream_buffer`` items are held in memory and collectors pause
+        while the consumer catches up. Results passed to ``on_finish``
+        carry a count instead of the items. Time spent waiting on a full
+        queue counts towards the collector's timeout.
+
+        Args:
+            collectors: Collectors to run
+            on_start: Optional hook called when a collector starts fetching
+            on_finish: Optional hook called with each result as it completes
+
+        Yields:
+            Unified items, interleaved across collectors
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.stream_buffer)
+        done = object()
+        results: List[CollectionResult] = []
+
+        async def drain(collector: BaseCollector) -> CollectionResult:
+            return await self._drain(collector, queue)
+
+        async def produce():
+            try:
+                results.extend(
+                    await self._run_limited(collectors, drain, on_start, on_finish)
+                )
+            except Exception as e:
+                logger.error(f"Collection stream failed: {e}")
+            await queue.put(done)
+
+        started = time.monotonic()
+        producer = asyncio.create_task(produce())
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            # Stop collectors if the consumer goes away early
+            if not producer.done():
+                producer.cancel()
+                try:
+                    await producer
+                except asyncio.CancelledError:
+                    pass
+
+        logger.info(
+            f"Collection finished in {time.monotonic() - started:.1f}s "
+            f"({sum(r.ok for r in results)}/{len(results)} collectors succeeded)"
+        )
+
+    async def _run_limited(
+        self,
+        collectors: List[BaseCollector],
+        collect: Callable[[BaseCollector], Any],
+        on_start: Optional[Callable[[BaseCollector], None]],
+        on_finish: Optional[Callable[[CollectionResult], None]]
+    ) -> List[CollectionResult]:
+        """Run ``collect`` for every collector under the concurrency limits."""
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+
+        async def run_one(collector: BaseCollector) -> CollectionResult:
+            host = self.get_host(collector)
+            host_limit = host_limits.setdefault(
+                host, asyncio.Semaphore(self.per_host_concurrency)
+            )
+
+            # Take the host slot first so a queued collector never holds a
+            # global slot while waiting on a busy host
+            async with host_limit, global_limit:
+                if on_start:
+                    on_start(collector)
+                result = await collect(collector)
+
+            if on_finish:
+                on_finish(result)
+            return result
+
+        return list(await asyncio.gather(*(run_one(c) for c in collectors)))
+
+    async def _drain(self, collector: BaseCollector, queue: asyncio.Queue) -> CollectionResult:
+        """Stream one collector into the queue under the timeout.
+
+        Items already queued stay in the stream if the collector fails
+        part way through.
+        """
+        started = time.monotonic()
+        count = 0
+
+        try:
+            async with asyncio.timeout(self.timeout):
+                async for item in collector.stream():
+                    await queue.put(item)
+                    count += 1
+
+            return CollectionResult(collector, elapsed=time.monotonic() - started, count=count)
+
+        except TimeoutError:
+            logger.error(f"{collector.name}: Timed out after {self.timeout:.0f}s")
+            error = TimeoutError(f"{collector.name} timed out after {self.timeout:.0f}s")
+            return CollectionResult(
+                collector, error=error, elapsed=time.monotonic() - started, count=count
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to collect from {collector.name}: {e}")
+            return CollectionResult(
+                collector, error=e, elapsed=time.monotonic() - started, count=count
+            )
+
+    async def _collect(self, collector: BaseCollector) -> CollectionResult:
+        """Fetch and transform one collector under the timeout."""
+        started = time.monotonic()
+
+        try:
+            async with asyncio.timeout(self.timeout):
+                raw_data = await collector.fetch()
+
+            items = collector.transform(raw_data, collector.source_type)
+            return CollectionResult(collector, items, elapsed=time.monotonic() - started)
+
+        except TimeoutError:
+            logger.error(f"{collector.name}: Timed out after {self.timeout:.0f}s")
+            error = TimeoutError(f"{collector.name} timed out after {self.timeout:.0f}s")
+            return CollectionResult(collector, error=error, elapsed=time.monotonic() - started)
+
+        except Exception as e:
+            logger.error(f"Failed to collect from {collector.name}: {e}")
+            return CollectionResult(collector, error=e, elapsed=time.monotonic() - started)
+
+    @staticmethod
+    def get_host(collector: BaseCollector) -> str:
+        """Return the upstream host a collector talks to.
+
+        Falls back to the collector name when no API URL is known, which
+        gives such collectors their own slot.
+        """
+        api_url = getattr(collector, "api_url", "") or ""
+        return urlparse(api_url).hostname or collector.name
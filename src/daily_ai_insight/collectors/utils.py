@@ -1,13 +1,13 @@
 """Utility functions for collectors."""
 
-import re
 import asyncio
 import random
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-from bs4 import BeautifulSoup
 import html
 
+from .html_text import html_to_text
+
 
 USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/135.0.0.0 Safari/537.36",
@@ -83,24 +83,9 @@ def strip_html(html_content: str) -> str:
         html_content: HTML content string
 
     Returns:
-        Plain text without HTML tags
+        Plain text without HTML tags, one line per text node
     """
-    if not html_content:
-        return ""
-
-    soup = BeautifulSoup(html_content, "html.parser")
-
-    # Remove script and style elements
-    for script in soup(["script", "style"]):
-        script.decompose()
-
-    # Get text and clean up whitespace
-    text = soup.get_text(separator='\n', strip=True)
-
-    # Remove multiple newlines
-    text = re.sub(r'\n\s*\n', '\n\n', text)
-
-    return text.strip()
+    return html_to_text(html_content)
 
 
 def escape_html(text: str) -> str:
@@ -1,5 +1,23 @@
 """LLM integration for content analysis."""
 
 from .analyzer import ContentAnalyzer
+from .cache import LLMCache, CachedProvider
+from .tokens import TokenEstimator, get_estimator
+from .rate_limit import RateLimiter, get_limiter
+from .router import HedgedRouter
+from .parsing import extract_json, is_repaired, validate, salvage
 
-__all__ = ["ContentAnalyzer"]
+__all__ = [
+    "ContentAnalyzer",
+    "LLMCache",
+    "CachedProvider",
+    "TokenEstimator",
+    "get_estimator",
+    "RateLimiter",
+    "get_limiter",
+    "HedgedRouter",
+    "extract_json",
+    "is_repaired",
+    "validate",
+    "salvage",
+]
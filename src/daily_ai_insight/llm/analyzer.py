@@ -2,39 +2,97 @@
 
 import os
 import json
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+from ..processors.clustering import TopicClusterer, UNCLUSTERED
+from ..processors.ranker import PreRanker
+from .cache import LLMCache, CachedProvider, make_key
+from .parsing import validate, salvage
+from .schemas import FilterResult, BatchFilterItem, SummaryItem, AnalysisResult
+from .router import HedgedRouter
 from .providers.gemini import GeminiProvider
 from .providers.openai import OpenAIProvider
+from .providers.replay import ReplayProvider
 from .prompts.templates import (
     ANALYSIS_PROMPT,
+    REDUCE_ANALYSIS_PROMPT,
     REPORT_GENERATION_PROMPT,
     SUMMARY_PROMPT,
+    BATCH_SUMMARY_PROMPT,
     CATEGORIZATION_PROMPT,
-    FILTER_PROMPT
+    FILTER_PROMPT,
+    BATCH_FILTER_PROMPT
 )
 
 logger = logging.getLogger(__name__)
 
+# Minimum relevance score (0-10) for an item to be included
+RELEVANCE_THRESHOLD = 6
+
+# Ranking used when merging partial analyses without the LLM
+_PRIORITY = {"high": 0, "medium": 1, "low": 2}
+# Entries kept per list when merging partial analyses without the LLM
+_MERGED_LIST_LIMIT = 10
 
-class ContentAnalyzer:
-    """Analyze content using LLM providers."""
 
-    def __init__(self, provider: str = "gemini"):
+class ContentAnalyzer:
+    """Analyze content using LLM providers.
+
+    Configuration via environment variables:
+        LLM_FILTER_BATCH_SIZE: Items classified per relevance prompt (default: 20)
+        LLM_FILTER_CONCURRENCY: Relevance prompts in flight at once (default: 4)
+        LLM_ANALYSIS_CHUNK_TOKENS: Token budget of one analysis prompt (default: 8000)
+        LLM_ANALYSIS_CONCURRENCY: Analysis prompts in flight at once (default: 4)
+        LLM_SUMMARY_BATCH_SIZE: Items summarized per prompt (default: 20)
+        LLM_MAX_ITEMS: Highest-ranked items passed to each LLM stage (default: 200)
+        LLM_ITEM_TOKEN_BUDGET: Tokens of item text passed to each LLM stage (default: 60000)
+        LLM_HEDGE_ENABLED: Hedge slow calls to the other provider when both have keys (default: true)
+        LLM_HEDGE_MAX_RATIO: Maximum fraction of calls that may be hedged (default: 0.2)
+        LLM_CACHE_ENABLED: Cache LLM responses on disk (default: true)
+        LLM_CACHE_PATH: Cache database file (default: storage/data/llm_cache.db)
+        LLM_CACHE_TTL_DAYS: Days a cached response stays valid (default: 7)
+        LLM_CACHE_MAX_ENTRIES: Cached responses kept before LRU eviction (default: 5000)
+    """
+
+    def __init__(
+        self,
+        provider: str = "gemini",
+        filter_batch_size: Optional[int] = None,
+        filter_concurrency: Optional[int] = None,
+        analysis_chunk_tokens: Optional[int] = None,
+        analysis_concurrency: Optional[int] = None
+    ):
         """Initialize content analyzer.
 
         Args:
-            provider: LLM provider to use ("gemini" or "openai")
+            provider: LLM provider to use ("gemini", "openai", or "replay" for
+                offline runs configured by LLM_REPLAY_* env)
+            filter_batch_size: Items per relevance prompt (or from LLM_FILTER_BATCH_SIZE env)
+            filter_concurrency: Concurrent relevance prompts (or from LLM_FILTER_CONCURRENCY env)
+            analysis_chunk_tokens: Tokens per analysis prompt (or from LLM_ANALYSIS_CHUNK_TOKENS env)
+            analysis_concurrency: Concurrent analysis prompts (or from LLM_ANALYSIS_CONCURRENCY env)
         """
         self.provider_name = provider
+        self.filter_batch_size = max(1, filter_batch_size or int(os.getenv("LLM_FILTER_BATCH_SIZE", "20")))
+        self.filter_concurrency = max(1, filter_concurrency or int(os.getenv("LLM_FILTER_CONCURRENCY", "4")))
+        self.analysis_chunk_tokens = analysis_chunk_tokens or int(os.getenv("LLM_ANALYSIS_CHUNK_TOKENS", "8000"))
+        self.analysis_concurrency = max(1, analysis_concurrency or int(os.getenv("LLM_ANALYSIS_CONCURRENCY", "4")))
+        self.summary_batch_size = max(1, int(os.getenv("LLM_SUMMARY_BATCH_SIZE", "20")))
+        self.clusterer = TopicClusterer()
+        self.ranker = PreRanker.from_files()
+        self.max_llm_items = max(1, int(os.getenv("LLM_MAX_ITEMS", "200")))
+        self.llm_token_budget = int(os.getenv("LLM_ITEM_TOKEN_BUDGET", "60000"))
 
         try:
             if provider == "gemini":
                 self.provider = GeminiProvider()
             elif provider == "openai":
                 self.provider = OpenAIProvider()
+            elif provider == "replay":
+                self.provider = ReplayProvider.from_env()
             else:
                 # Default to Gemini
                 self.provider = GeminiProvider()
@@ -51,9 +109,75 @@ class ContentAnalyzer:
                 self.provider = GeminiProvider()
                 self.provider_name = "gemini"
 
+        # With keys for both providers, route calls through the hedged router
+        self.router = None
+        if self.provider_name != "replay" and os.getenv("LLM_HEDGE_ENABLED", "true").lower() == "true":
+            secondary = self._create_secondary()
+            if secondary is not None:
+                self.router = HedgedRouter(
+                    self.provider,
+                    secondary,
+                    max_hedge_ratio=float(os.getenv("LLM_HEDGE_MAX_RATIO", "0.2"))
+                )
+                self.provider = self.router
+                logger.info(f"Hedging slow {self.provider_name} calls to {type(secondary).__name__}")
+
+        self.cache = None
+        if os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true":
+            self.cache = LLMCache(
+                os.getenv("LLM_CACHE_PATH", "storage/data/llm_cache.db"),
+                ttl_days=float(os.getenv("LLM_CACHE_TTL_DAYS", "7")),
+                max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+            )
+            self.provider = CachedProvider(self.provider, self.cache)
+
+    def _create_secondary(self) -> Optional[Any]:
+        """Create the provider other than the current one, if it is configured.
+
+        Returns:
+            Provider instance, or None if it has no API key
+        """
+        secondary_class = OpenAIProvider if self.provider_name == "gemini" else GeminiProvider
+        try:
+            return secondary_class()
+        except Exception as e:
+            logger.debug(f"No secondary provider for hedging: {e}")
+            return None
+
+    def close(self):
+        """Release provider resources and close the response cache."""
+        close_provider = getattr(self.provider, "close", None)
+        if close_provider is not None:
+            close_provider()
+
+        if self.router is not None:
+            summary = self.router.summary()
+            if summary["hedges"] or summary["failovers"]:
+                logger.info(
+                    f"LLM router: {summary['calls']} calls, {summary['hedges']} hedged "
+                    f"({summary['hedge_wins']} won), {summary['failovers']} failovers"
+                )
+
+        if self.cache is None:
+            return
+
+        stats = self.cache.stats()
+        if stats["hits"] or stats["misses"]:
+            logger.info(
+                f"LLM cache: {stats['hits']} hits, {stats['misses']} misses "
+                f"({stats['hit_rate']:.0%} hit rate, {stats['entries']} entries)"
+            )
+        self.cache.close()
+        self.cache = None
+
     async def analyze_content(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze collected content items.
 
+        Items are packed into chunks that fit the analysis token budget.
+        A single chunk is analyzed directly; otherwise the chunks are
+        analyzed concurrently and the partial analyses are merged by a
+        reduce prompt.
+
         Args:
             items: List of content items
 
@@ -65,28 +189,207 @@ class ContentAnalyzer:
             return {}
 
         # Prepare content for analysis
-        content_data = self._prepare_content_for_analysis(items)
+        content_data = self._prepare_content_for_analysis(self._select_for_llm(items))
+        chunks = self._pack(content_data, ANALYSIS_PROMPT.format(content=""))
+        semaphore = asyncio.Semaphore(self.analysis_concurrency)
 
-        # Generate prompt
-        prompt = ANALYSIS_PROMPT.format(content=json.dumps(content_data, ensure_ascii=False, indent=2))
+        if len(chunks) > 1:
+            logger.info(f"Analyzing {len(items)} items in {len(chunks)} chunks")
 
-        # Check token count and truncate if needed
-        token_count = self.provider.count_tokens(prompt)
-        if token_count > 10000:
-            logger.warning(f"Content too long ({token_count} tokens), truncating...")
-            content_data = content_data[:30]  # Limit to 30 items
-            prompt = ANALYSIS_PROMPT.format(content=json.dumps(content_data, ensure_ascii=False, indent=2))
+        partials = await asyncio.gather(*(
+            self._analyze_chunk(chunk, semaphore) for chunk in chunks
+        ))
+        partials = [partial for partial in partials if partial is not None]
 
-        # Analyze with LLM
-        try:
-            analysis = await self.provider.analyze(prompt)
-            logger.info(f"Successfully analyzed {len(items)} items using {self.provider_name}")
-            return analysis
-        except Exception as e:
-            logger.error(f"Analysis failed: {e}")
+        if not partials:
+            logger.error("Analysis failed")
             # Return basic analysis on failure
             return self._fallback_analysis(items)
 
+        analysis = await self._reduce_analyses(partials, len(items), semaphore)
+        logger.info(f"Successfully analyzed {len(items)} items using {self.provider_name}")
+        return analysis
+
+    def _pack(self, entries: List[Any], template: str) -> List[List[Any]]:
+        """Greedily pack entries into chunks within the analysis token budget.
+
+        Args:
+            entries: JSON-serializable entries
+            template: Prompt the entries are inserted into, for its overhead
+
+        Returns:
+            Chunks of entries; an entry larger than the budget gets its own chunk
+        """
+        budget = self.analysis_chunk_tokens - self.provider.count_tokens(template)
+        chunks: List[List[Any]] = []
+        current: List[Any] = []
+        used = 0
+
+        for entry in entries:
+            # Per-entry counts are memoized, so re-packing costs no re-tokenizing
+            tokens = self.provider.count_tokens(json.dumps(entry, ensure_ascii=False, indent=2))
+            if current and used + tokens > budget:
+                chunks.append(current)
+                current, used = [], 0
+            current.append(entry)
+            used += tokens
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def _analyze_chunk(
+        self,
+        chunk: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore
+    ) -> Optional[Dict[str, Any]]:
+        """Analyze one chunk of prepared items.
+
+        Args:
+            chunk: Prepared content entries
+            semaphore: Limits concurrent LLM calls
+
+        Returns:
+            Analysis dictionary, or None if the call or parsing failed
+        """
+        prompt = ANALYSIS_PROMPT.format(content=json.dumps(chunk, ensure_ascii=False, indent=2))
+        try:
+            async with semaphore:
+                analysis = await self.provider.analyze(prompt)
+        except Exception as e:
+            logger.warning(f"Analysis of {len(chunk)} items failed: {e}")
+            return None
+        return analysis if self._is_analysis(analysis) else None
+
+    async def _reduce_analyses(
+        self,
+        analyses: List[Dict[str, Any]],
+        total_items: int,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Merge partial analyses into one, level by level.
+
+        Partial analyses are packed into groups within the token budget and
+        each group is merged by REDUCE_ANALYSIS_PROMPT, concurrently, until a
+        single analysis remains. A group whose reduce call fails is merged
+        locally instead.
+
+        Args:
+            analyses: Partial analyses
+            total_items: Number of items behind all partial analyses
+            semaphore: Limits concurrent LLM calls
+
+        Returns:
+            Merged analysis
+        """
+        template = REDUCE_ANALYSIS_PROMPT.format(analyses="", total_items=total_items)
+
+        while len(analyses) > 1:
+            groups = self._pack(analyses, template)
+            if len(groups) == len(analyses):
+                # Nothing fits together; pair them up so every level shrinks
+                groups = [analyses[i:i + 2] for i in range(0, len(analyses), 2)]
+
+            analyses = list(await asyncio.gather(*(
+                self._reduce_group(group, total_items, semaphore) for group in groups
+            )))
+
+        return analyses[0]
+
+    async def _reduce_group(
+        self,
+        group: List[Dict[str, Any]],
+        total_items: int,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Merge one group of partial analyses with the LLM.
+
+        Args:
+            group: Partial analyses
+            total_items: Number of items behind all partial analyses
+            semaphore: Limits concurrent LLM calls
+
+        Returns:
+            Merged analysis
+        """
+        if len(group) == 1:
+            return group[0]
+
+        prompt = REDUCE_ANALYSIS_PROMPT.format(
+            analyses=json.dumps(group, ensure_ascii=False, indent=2),
+            total_items=total_items
+        )
+        try:
+            async with semaphore:
+                merged = await self.provider.analyze(prompt)
+            if self._is_analysis(merged):
+                return merged
+        except Exception as e:
+            logger.warning(f"Merging {len(group)} partial analyses failed: {e}")
+
+        return self._merge_analyses(group)
+
+    @staticmethod
+    def _is_analysis(result: Any) -> bool:
+        """True if an LLM response matches the analysis schema."""
+        return isinstance(result, dict) and validate(result, AnalysisResult) is not None
+
+    @staticmethod
+    def _merge_analyses(analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge partial analyses without the LLM.
+
+        Args:
+            analyses: Partial analyses
+
+        Returns:
+            Combined analysis, with list fields ranked by importance or
+            priority and de-duplicated
+        """
+        def collect(field: str) -> List[Any]:
+            values = []
+            for analysis in analyses:
+                value = analysis.get(field) or []
+                values.extend(value if isinstance(value, list) else [value])
+            return values
+
+        def ranked(values: List[Any], rank_field: str, key_field: str) -> List[Any]:
+            unique = {}
+            for value in values:
+                if isinstance(value, dict):
+                    unique.setdefault(value.get(key_field) or id(value), value)
+            return sorted(
+                unique.values(),
+                key=lambda v: _PRIORITY.get(str(v.get(rank_field, "")).lower(), len(_PRIORITY))
+            )[:_MERGED_LIST_LIMIT]
+
+        def texts(field: str) -> str:
+            return "\n\n".join(
+                str(analysis[field]) for analysis in analyses if analysis.get(field)
+            )
+
+        trends: Dict[str, List[str]] = {}
+        for analysis in analyses:
+            trend_analysis = analysis.get("trend_analysis")
+            if not isinstance(trend_analysis, dict):
+                continue
+            for field, values in trend_analysis.items():
+                merged = trends.setdefault(field, [])
+                for value in values if isinstance(values, list) else [values]:
+                    if value not in merged:
+                        merged.append(value)
+
+        return {
+            "executive_summary": texts("executive_summary"),
+            "key_points": ranked(collect("key_points"), "importance", "title"),
+            "trend_analysis": {
+                field: values[:_MERGED_LIST_LIMIT] for field, values in trends.items()
+            },
+            "impact_assessment": texts("impact_assessment"),
+            "professional_insights": texts("professional_insights"),
+            "recommendations": ranked(collect("recommendations"), "priority", "action"),
+            "notable_sources": ranked(collect("notable_sources"), "", "url"),
+        }
+
     async def generate_report(self, analysis: Dict[str, Any], items: List[Dict[str, Any]]) -> str:
         """Generate a formatted report from analysis.
 
@@ -134,47 +437,312 @@ class ContentAnalyzer:
         Returns:
             Summary text
         """
+        summary, _ = await self._summarize_single(item)
+        return summary
+
+    async def _summarize_single(self, item: Dict[str, Any]) -> Tuple[str, bool]:
+        """Summarize one item, falling back to truncation.
+
+        Args:
+            item: Content item
+
+        Returns:
+            Tuple of (summary, True if it came from the LLM)
+        """
         content = f"Title: {item.get('title', '')}\nContent: {item.get('content', '')}"
         prompt = SUMMARY_PROMPT.format(content=content)
 
         try:
             summary = await self.provider.generate_text(prompt, max_tokens=200)
-            return summary.strip()
-        except:
+            return summary.strip(), True
+        except Exception:
             # Fallback to truncation
-            return item.get("content", "")[:100] + "..."
+            return item.get("content", "")[:100] + "...", False
+
+    async def summarize_many(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Generate summaries for many items with batched prompts.
+
+        Items are packed ``summary_batch_size`` per BATCH_SUMMARY_PROMPT and
+        the batches run concurrently. Summaries are cached by content hash,
+        so items seen before (or repeated in the input) cost no calls. Items
+        missing from a batch response are summarized one by one.
+
+        Args:
+            items: Content items
+
+        Returns:
+            Summary per item, in input order
+        """
+        keys = [self._summary_key(item) for item in items]
+        summaries: Dict[str, str] = {}
+
+        pending: Dict[str, Dict[str, Any]] = {}
+        for key, item in zip(keys, items):
+            if key in summaries or key in pending:
+                continue
+            cached = self.cache.get(key) if self.cache is not None else None
+            if cached is not None:
+                summaries[key] = cached
+            else:
+                pending[key] = item
+
+        if pending:
+            semaphore = asyncio.Semaphore(self.analysis_concurrency)
+            pending_keys = list(pending)
+            batches = [
+                pending_keys[start:start + self.summary_batch_size]
+                for start in range(0, len(pending_keys), self.summary_batch_size)
+            ]
+            results = await asyncio.gather(*(
+                self._summarize_batch([pending[key] for key in batch], semaphore)
+                for batch in batches
+            ))
+            for batch, batch_summaries in zip(batches, results):
+                for key, (summary, from_llm) in zip(batch, batch_summaries):
+                    summaries[key] = summary
+                    if from_llm and self.cache is not None:
+                        self.cache.set(key, summary)
+
+        logger.info(f"Summarized {len(items)} items ({len(pending)} new)")
+        return [summaries[key] for key in keys]
+
+    def _summary_key(self, item: Dict[str, Any]) -> str:
+        """Cache key of an item's summary, from its title and content."""
+        return make_key(
+            "summary",
+            getattr(self.provider, "model_name", self.provider_name),
+            {"call": "summarize_item"},
+            f"{item.get('title', '')}\n{item.get('content', '')}"
+        )
+
+    async def _summarize_batch(
+        self,
+        items: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore
+    ) -> List[Tuple[str, bool]]:
+        """Summarize a batch of items with one prompt.
+
+        Args:
+            items: Items to summarize
+            semaphore: Limits concurrent LLM calls
+
+        Returns:
+            (summary, from_llm) per item, in input order; from_llm is False
+            for truncation fallbacks, which are not cached
+        """
+        results: List[Optional[Tuple[str, bool]]] = [None] * len(items)
+
+        if len(items) > 1:
+            payload = [
+                {
+                    "id": idx,
+                    "title": item.get("title", ""),
+                    "content": item.get("content", "")[:1000]
+                }
+                for idx, item in enumerate(items)
+            ]
+            prompt = BATCH_SUMMARY_PROMPT.format(items=json.dumps(payload, ensure_ascii=False, indent=2))
+
+            try:
+                async with semaphore:
+                    response = await self.provider.analyze(prompt)
+                for entry in salvage(response, "summaries", SummaryItem):
+                    idx = entry["id"]
+                    if 0 <= idx < len(items) and entry["summary"].strip():
+                        results[idx] = (entry["summary"].strip(), True)
+            except Exception as e:
+                logger.warning(f"Batch summary of {len(items)} items failed: {e}")
+
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        if missing:
+            async def summarize(item: Dict[str, Any]) -> Tuple[str, bool]:
+                async with semaphore:
+                    return await self._summarize_single(item)
+
+            fallback = await asyncio.gather(*(summarize(items[idx]) for idx in missing))
+            for idx, result in zip(missing, fallback):
+                results[idx] = result
+
+        return results
 
     async def filter_relevant_content(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Filter content for relevance.
 
+        Items matching an AI keyword are kept directly. Of the rest, the
+        highest-ranked items within the LLM item and token limits are
+        classified in batches of ``filter_batch_size`` items per prompt, with
+        up to ``filter_concurrency`` prompts in flight; lower-ranked ones are
+        dropped. Items missing from a batch response are classified on their
+        own.
+
         Args:
             items: List of content items
 
         Returns:
-            Filtered list of relevant items
+            Filtered list of relevant items, in their original order
         """
-        relevant_items = []
+        keep = [self._quick_relevance_check(item) for item in items]
+        selected = {id(item) for item in self._select_for_llm([
+            item for item, kept in zip(items, keep) if not kept
+        ])}
+        uncertain = [idx for idx, item in enumerate(items) if id(item) in selected]
+
+        if uncertain:
+            semaphore = asyncio.Semaphore(self.filter_concurrency)
+            batches = [
+                uncertain[start:start + self.filter_batch_size]
+                for start in range(0, len(uncertain), self.filter_batch_size)
+            ]
+            results = await asyncio.gather(*(
+                self._filter_batch([items[idx] for idx in batch], semaphore)
+                for batch in batches
+            ))
+            for batch, decisions in zip(batches, results):
+                for idx, include in zip(batch, decisions):
+                    keep[idx] = include
+
+        relevant_items = [item for item, kept in zip(items, keep) if kept]
+        logger.info(f"Filtered {len(items)} items to {len(relevant_items)} relevant items")
+        return relevant_items
 
-        for item in items:
-            # Quick keyword check first
-            if self._quick_relevance_check(item):
-                relevant_items.append(item)
-                continue
+    def _select_for_llm(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Highest-ranked items within the LLM item and token limits.
+
+        Args:
+            items: Content items
+
+        Returns:
+            Selected items in their original order
+        """
+        if not items:
+            return []
+
+        selected = self.ranker.select(
+            items,
+            self.max_llm_items,
+            self.llm_token_budget,
+            getattr(self.provider, "count_tokens", None)
+        )
+        if len(selected) < len(items):
+            logger.info(f"Pre-ranking passed {len(selected)} of {len(items)} items to the LLM")
+        return selected
+
+    async def _filter_batch(
+        self,
+        items: List[Dict[str, Any]],
+        semaphore: asyncio.Semaphore
+    ) -> List[bool]:
+        """Classify a batch of items with one prompt.
 
-            # Use LLM for uncertain cases
-            content = f"Title: {item.get('title', '')}\nContent: {item.get('content', '')[:500]}"
-            prompt = FILTER_PROMPT.format(content=content)
+        Args:
+            items: Items to classify
+            semaphore: Limits concurrent LLM calls
+
+        Returns:
+            Include decision per item, in input order
+        """
+        decisions: List[Optional[bool]] = [None] * len(items)
+
+        if len(items) > 1:
+            payload = [
+                {
+                    "id": idx,
+                    "title": item.get("title", ""),
+                    "content": item.get("content", "")[:500]
+                }
+                for idx, item in enumerate(items)
+            ]
+            prompt = BATCH_FILTER_PROMPT.format(items=json.dumps(payload, ensure_ascii=False, indent=2))
 
             try:
+                async with semaphore:
+                    response = await self.provider.analyze(prompt)
+                decisions = self._parse_batch_results(response, len(items))
+            except Exception as e:
+                logger.warning(f"Batch relevance check of {len(items)} items failed: {e}")
+
+        missing = [idx for idx, decision in enumerate(decisions) if decision is None]
+        if missing:
+            if len(items) > 1:
+                logger.debug(f"Classifying {len(missing)} of {len(items)} items individually")
+            fallback = await asyncio.gather(*(
+                self._filter_item(items[idx], semaphore) for idx in missing
+            ))
+            for idx, include in zip(missing, fallback):
+                decisions[idx] = include
+
+        return decisions
+
+    async def _filter_item(self, item: Dict[str, Any], semaphore: asyncio.Semaphore) -> bool:
+        """Classify a single item.
+
+        Args:
+            item: Content item
+            semaphore: Limits concurrent LLM calls
+
+        Returns:
+            True if the item should be included (also on error)
+        """
+        content = f"Title: {item.get('title', '')}\nContent: {item.get('content', '')[:500]}"
+        prompt = FILTER_PROMPT.format(content=content)
+
+        try:
+            async with semaphore:
                 result = await self.provider.analyze(prompt)
-                if result.get("include", False) or result.get("relevance_score", 0) >= 6:
-                    relevant_items.append(item)
-            except:
-                # Keep item on error
-                relevant_items.append(item)
+            include = self._is_relevant(validate(result, FilterResult))
+            return True if include is None else include
+        except Exception:
+            # Keep item on error
+            return True
 
-        logger.info(f"Filtered {len(items)} items to {len(relevant_items)} relevant items")
-        return relevant_items
+    def _parse_batch_results(self, response: Any, count: int) -> List[Optional[bool]]:
+        """Map a batch response back to item positions by id.
+
+        Args:
+            response: Parsed LLM response
+            count: Number of items in the batch
+
+        Returns:
+            Include decision per item, or None where the response has no
+            usable result for it
+        """
+        decisions: List[Optional[bool]] = [None] * count
+
+        # Malformed entries are skipped; their items fall back to single prompts
+        for result in salvage(response, "results", BatchFilterItem):
+            idx = result["id"]
+            if 0 <= idx < count:
+                decisions[idx] = self._is_relevant(result)
+
+        return decisions
+
+    @staticmethod
+    def _is_relevant(result: Any) -> Optional[bool]:
+        """Read an include decision from one classification result.
+
+        Args:
+            result: Result dictionary with "include" and/or "relevance_score"
+
+        Returns:
+            Include decision, or None if the result has neither field
+        """
+        if not isinstance(result, dict):
+            return None
+
+        include = result.get("include")
+        if include is True:
+            return True
+
+        try:
+            score = float(result.get("relevance_score"))
+        except (TypeError, ValueError):
+            score = None
+
+        if score is not None:
+            return score >= RELEVANCE_THRESHOLD
+        if include is False:
+            return False
+        return None
 
     def _prepare_content_for_analysis(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Prepare content for LLM analysis.
@@ -187,20 +755,33 @@ class ContentAnalyzer:
         """
         prepared = []
 
-        for item in items[:50]:  # Limit to 50 items
-            prepared.append({
+        # Keep topic clusters together so each analysis chunk is coherent
+        if any("cluster_id" in item for item in items):
+            items = sorted(items, key=self._cluster_order)
+
+        for item in items:
+            entry = {
                 "title": item.get("title", ""),
                 "content": item.get("content", "")[:500],  # Truncate content
                 "url": item.get("url", ""),
                 "source": item.get("source", ""),
                 "published_at": str(item.get("published_at", "")),
                 "tags": item.get("tags", [])
-            })
+            }
+            if item.get("cluster_label"):
+                entry["topic"] = item["cluster_label"]
+            prepared.append(entry)
 
         return prepared
 
+    @staticmethod
+    def _cluster_order(item: Dict[str, Any]) -> float:
+        """Sort key placing items by cluster id, unclustered items last."""
+        cluster_id = item.get("cluster_id", UNCLUSTERED)
+        return cluster_id if cluster_id != UNCLUSTERED else float("inf")
+
     def _categorize_items(self, items: List[Dict[str, Any]]) -> Dict[str, int]:
-        """Categorize items by tags/source.
+        """Count items per topic cluster, or per tag/source without NumPy.
 
         Args:
             items: Content items
@@ -208,6 +789,9 @@ class ContentAnalyzer:
         Returns:
             Category counts
         """
+        if self.clusterer.available:
+            return {label: len(group) for label, group in self.clusterer.group(items).items()}
+
         categories = {}
 
         for item in items:
@@ -0,0 +1,240 @@
+"""Persistent cache of LLM responses."""
+
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .parsing import is_repaired
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+def make_key(provider: str, model: str, config: Dict[str, Any], prompt: str) -> str:
+    """Build the cache key of an LLM call.
+
+    Args:
+        provider: Provider name
+        model: Model name
+        config: Generation settings and call type that affect the output
+        prompt: Prompt text
+
+    Returns:
+        Hex digest identifying the call
+    """
+    identity = json.dumps(
+        [provider, model, config, hashlib.sha256(prompt.encode("utf-8")).hexdigest()],
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    """Disk-backed LLM response cache with TTL and LRU eviction.
+
+    Keys are content-addressed (see make_key()), so re-running the pipeline
+    on the same items returns earlier answers without calling the API.
+
+    Example:
+        cache = LLMCache("storage/data/llm_cache.db")
+        provider = CachedProvider(GeminiProvider(), cache)
+        await provider.analyze(prompt)  # API call
+        await provider.analyze(prompt)  # served from disk
+    """
+
+    def __init__(self, path: str, ttl_days: float = 7, max_entries: int = 5000):
+        """Open (or create) the cache and drop expired entries.
+
+        Args:
+            path: SQLite database file
+            ttl_days: Days a response stays valid after it was stored
+            max_entries: Entries kept before least recently used ones are evicted
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self.prune()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT value FROM responses WHERE key = ? AND created_at > ?",
+            (key, now - self.ttl)
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        self._conn.commit()
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        """Store a response, evicting the least recently used beyond max_entries.
+
+        Args:
+            key: Cache key from make_key()
+            value: JSON-serializable response
+        """
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at) "
+            "VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value, ensure_ascii=False), now, now)
+        )
+        self._conn.execute(
+            "DELETE FROM responses WHERE key IN "
+            "(SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self._conn.commit()
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete expired responses.
+
+        Args:
+            now: Reference time, defaults to now
+
+        Returns:
+            Number of responses removed
+        """
+        now = now or time.time()
+        removed = self._conn.execute(
+            "DELETE FROM responses WHERE created_at <= ?", (now - self.ttl,)
+        ).rowcount
+        self._conn.commit()
+        return removed
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this session.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and entries
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
+
+    def close(self):
+        """Commit and close the database."""
+        self._conn.commit()
+        self._conn.close()
+
+
+class CachedProvider:
+    """Wrap an LLM provider so identical calls are answered from an LLMCache.
+
+    Exposes the provider interface (``analyze``, ``generate_text``,
+    ``count_tokens``); other attributes are forwarded to the wrapped
+    provider. Failed calls, unparsed ``analyze`` responses and responses
+    repaired from truncated output are not cached.
+    """
+
+    def __init__(self, provider: Any, cache: LLMCache):
+        """Initialize the wrapper.
+
+        Args:
+            provider: Provider with model_name and generation_config attributes
+            cache: Response cache
+        """
+        self.provider = provider
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.provider, name)
+
+    def _key(self, call: str, prompt: str, **options: Any) -> str:
+        config = dict(getattr(self.provider, "generation_config", {}), call=call, **options)
+        return make_key(
+            type(self.provider).__name__,
+            getattr(self.provider, "model_name", ""),
+            config,
+            prompt
+        )
+
+    async def analyze(self, prompt: str, max_retries: int = 3) -> Dict[str, Any]:
+        """Analyze content, using a cached response when available.
+
+        Args:
+            prompt: The prompt to send
+            max_retries: Maximum number of retry attempts on a miss
+
+        Returns:
+            Analysis result dictionary
+        """
+        key = self._key("analyze", prompt)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = await self.provider.analyze(prompt, max_retries=max_retries)
+        # Keep parse failures and repaired truncations out of the cache so a
+        # rerun can do better
+        if result and not is_repaired(result) and not (
+            isinstance(result, dict) and set(result) == {"text"}
+        ):
+            self.cache.set(key, result)
+        return result
+
+    async def generate_text(self, prompt: str, max_tokens: int = 2048) -> str:
+        """Generate text, using a cached response when available.
+
+        Args:
+            prompt: The prompt to send
+            max_tokens: Maximum output tokens
+
+        Returns:
+            Generated text
+        """
+        key = self._key("generate_text", prompt, max_tokens=max_tokens)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
+        text = await self.provider.generate_text(prompt, max_tokens=max_tokens)
+        if text:
+            self.cache.set(key, text)
+        return text
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens with the wrapped provider (not cached)."""
+        return self.provider.count_tokens(text)
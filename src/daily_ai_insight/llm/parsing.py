@@ -0,0 +1,193 @@
+"""Tolerant extraction of JSON from LLM responses."""
+
+import re
+import json
+import logging
+from typing import List, Dict, Any, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+logger = logging.getLogger(__name__)
+
+_FENCE = re.compile(r"```(?:json|JSON)?\s*\n?(.*?)(?:```|\Z)", re.DOTALL)
+_CLOSERS = {"{": "}", "[": "]"}
+
+# Truncated responses are repaired by trying cut points from the end
+_MAX_REPAIR_ATTEMPTS = 64
+
+
+class RepairedDict(dict):
+    """A JSON object recovered by closing truncated output."""
+
+
+class RepairedList(list):
+    """A JSON array recovered by closing truncated output."""
+
+
+def is_repaired(value: Any) -> bool:
+    """Whether extract_json() had to repair truncated output to get a value.
+
+    Repaired values may be missing elements, so callers should not cache them.
+    """
+    return isinstance(value, (RepairedDict, RepairedList))
+
+
+def _loads(text: str) -> Tuple[bool, Any]:
+    try:
+        return True, json.loads(text)
+    except (json.JSONDecodeError, ValueError):
+        return False, None
+
+
+def _scan(text: str, start: int) -> Tuple[Optional[int], List[Tuple[int, str]], str]:
+    """Scan a JSON value from ``start``, tracking brackets outside strings.
+
+    Returns:
+        Tuple of (end index if the value closes, else None; cut points as
+        (index, open brackets) pairs; the scanned text without trailing
+        commas)
+    """
+    stack: List[str] = []
+    cuts: List[Tuple[int, str]] = []
+    out: List[str] = []
+    in_string = False
+    escaped = False
+
+    for idx in range(start, len(text)):
+        char = text[idx]
+        if in_string:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(char)
+            out.append(char)
+            cuts.append((len(out), "".join(stack)))
+            continue
+        elif char in "}]":
+            # Drop a trailing comma before the closing bracket
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if not stack or _CLOSERS[stack[-1]] != char:
+                return None, cuts, "".join(out)
+            stack.pop()
+            out.append(char)
+            if not stack:
+                return idx + 1, cuts, "".join(out)
+            cuts.append((len(out), "".join(stack)))
+            continue
+        elif char == ",":
+            # Cutting here drops the element that follows
+            cuts.append((len(out), "".join(stack)))
+
+        out.append(char)
+
+    return None, cuts, "".join(out)
+
+
+def _repair(scanned: str, cuts: List[Tuple[int, str]]) -> Tuple[bool, Any]:
+    """Close a truncated value at the latest cut point that parses.
+
+    An empty container is not a repair: cutting right after the opening
+    bracket would turn prose such as "Sorry [policy]" into ``[]``.
+    """
+    for position, stack in reversed(cuts[-_MAX_REPAIR_ATTEMPTS:]):
+        candidate = scanned[:position].rstrip().rstrip(",")
+        closing = "".join(_CLOSERS[bracket] for bracket in reversed(stack))
+        ok, value = _loads(candidate + closing)
+        if ok and value:
+            return True, RepairedDict(value) if isinstance(value, dict) else RepairedList(value)
+    return False, None
+
+
+def extract_json(text: str) -> Optional[Any]:
+    """Extract a JSON value from an LLM response.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        Parsed value, or None if no JSON could be recovered. Values
+        recovered from truncated output are marked (see is_repaired()).
+    """
+    if not text:
+        return None
+
+    ok, value = _loads(text.strip())
+    if ok:
+        return value
+
+    candidates = [match.group(1) for match in _FENCE.finditer(text)]
+    candidates.append(text)
+
+    for candidate in candidates:
+        ok, value = _loads(candidate.strip())
+        if ok:
+            return value
+
+        starts = [idx for idx in (candidate.find("{"), candidate.find("[")) if idx >= 0]
+        if not starts:
+            continue
+
+        end, cuts, scanned = _scan(candidate, min(starts))
+        if end is not None:
+            ok, value = _loads(scanned)
+            if ok:
+                return value
+
+        ok, value = _repair(scanned, cuts)
+        if ok:
+            logger.debug("Repaired malformed or truncated JSON response")
+            return value
+
+    return None
+
+
+def validate(data: Any, schema: Type[BaseModel]) -> Optional[Dict[str, Any]]:
+    """Validate parsed data against a schema.
+
+    Args:
+        data: Parsed JSON
+        schema: Pydantic model
+
+    Returns:
+        Validated data as a dictionary, or None if it does not match
+    """
+    try:
+        return schema.model_validate(data).model_dump()
+    except ValidationError as e:
+        logger.debug(f"Response does not match {schema.__name__}: {e.error_count()} errors")
+        return None
+
+
+def salvage(data: Any, field: str, schema: Type[BaseModel]) -> List[Dict[str, Any]]:
+    """Validate the entries of a batch response one by one.
+
+    Args:
+        data: Parsed JSON, either ``{field: [...]}`` or a bare list
+        field: Name of the list field
+        schema: Pydantic model of one entry
+
+    Returns:
+        Valid entries as dictionaries; malformed entries are skipped
+    """
+    entries = data.get(field) if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        return []
+
+    valid = []
+    for entry in entries:
+        result = validate(entry, schema)
+        if result is not None:
+            valid.append(result)
+    return valid
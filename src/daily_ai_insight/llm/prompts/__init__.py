@@ -2,16 +2,22 @@
 
 from .templates import (
     ANALYSIS_PROMPT,
+    REDUCE_ANALYSIS_PROMPT,
     REPORT_GENERATION_PROMPT,
     SUMMARY_PROMPT,
+    BATCH_SUMMARY_PROMPT,
     CATEGORIZATION_PROMPT,
-    FILTER_PROMPT
+    FILTER_PROMPT,
+    BATCH_FILTER_PROMPT
 )
 
 __all__ = [
     "ANALYSIS_PROMPT",
+    "REDUCE_ANALYSIS_PROMPT",
     "REPORT_GENERATION_PROMPT",
     "SUMMARY_PROMPT",
+    "BATCH_SUMMARY_PROMPT",
     "CATEGORIZATION_PROMPT",
-    "FILTER_PROMPT"
+    "FILTER_PROMPT",
+    "BATCH_FILTER_PROMPT"
 ]
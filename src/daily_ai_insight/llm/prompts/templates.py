@@ -21,42 +21,70 @@ Please complete the following analysis tasks:
 Please return the analysis results in JSON format:
 
 ```json
-{
+{{
   "executive_summary": "Executive summary within 100 words",
   "key_points": [
-    {
+    {{
       "title": "Key point title",
       "description": "Key point description",
       "importance": "high/medium/low"
-    }
+    }}
   ],
-  "trend_analysis": {
+  "trend_analysis": {{
     "current_trends": ["trend 1", "trend 2"],
     "emerging_topics": ["emerging topic 1", "emerging topic 2"],
     "declining_topics": ["declining topic 1"]
-  },
+  }},
   "impact_assessment": "Impact assessment description",
   "professional_insights": "Professional insights and commentary",
   "recommendations": [
-    {
+    {{
       "action": "Recommended action",
       "reason": "Reason for recommendation",
       "priority": "high/medium/low"
-    }
+    }}
   ],
   "notable_sources": [
-    {
+    {{
       "title": "Article title worth reading in-depth",
       "url": "Article URL",
       "reason": "Reason for recommendation"
-    }
+    }}
   ]
-}
+}}
 ```
 
 Please ensure the analysis is comprehensive, professional, and provides valuable insights.
 """
 
+REDUCE_ANALYSIS_PROMPT = """You are a professional AI industry analyst. Today's {total_items} content items were too many to analyze at once, so they were split into parts and each part was analyzed separately. Please merge the partial analyses below into a single insight report for the whole day.
+
+## Partial Analyses
+
+{analyses}
+
+## Merge Requirements
+
+1. Write one executive summary covering all parts
+2. Keep the 3-5 most important key points across all parts, merging points about the same event
+3. Combine trends, keeping topics that appear in several parts first
+4. Keep the most valuable recommendations and notable sources, without duplicates
+
+Please return the merged analysis in the same JSON format as the partial analyses:
+
+```json
+{{
+  "executive_summary": "...",
+  "key_points": [...],
+  "trend_analysis": {{"current_trends": [...], "emerging_topics": [...], "declining_topics": [...]}},
+  "impact_assessment": "...",
+  "professional_insights": "...",
+  "recommendations": [...],
+  "notable_sources": [...]
+}}
+```
+"""
+
 REPORT_GENERATION_PROMPT = """Based on the following AI industry analysis insights, generate a professional daily report.
 
 ## Analysis Data
@@ -130,6 +158,28 @@ Requirements:
 Output the summary text only.
 """
 
+BATCH_SUMMARY_PROMPT = """Please generate a concise summary for each of the following items.
+
+Each item has an "id". Summarize every item independently:
+
+{items}
+
+Requirements:
+- Summary length: 50-100 words
+- Retain key information
+- Professional and fluent language
+
+Please return in JSON format, with exactly one summary per item and the same "id":
+{{
+  "summaries": [
+    {{
+      "id": 0,
+      "summary": "Summary text"
+    }}
+  ]
+}}
+"""
+
 CATEGORIZATION_PROMPT = """Please categorize the following content:
 
 {content}
@@ -157,9 +207,33 @@ Evaluation criteria:
 4. Quality: Does the content have depth and value
 
 Please return in JSON format:
-{
+{{
   "include": true/false,
   "reason": "Reason for the decision",
   "relevance_score": 0-10
-}
+}}
+"""
+
+BATCH_FILTER_PROMPT = """Please determine which of the following items are worth including in the AI industry daily report.
+
+Each item has an "id". Evaluate every item independently:
+
+{items}
+
+Evaluation criteria:
+1. Relevance: Is it related to AI, machine learning, data science, etc.
+2. Importance: Does it have industry influence or technical value
+3. Timeliness: Is it fresh information or an update
+4. Quality: Does the content have depth and value
+
+Please return in JSON format, with exactly one result per item and the same "id":
+{{
+  "results": [
+    {{
+      "id": 0,
+      "include": true/false,
+      "relevance_score": 0-10
+    }}
+  ]
+}}
 """
\ No newline at end of file
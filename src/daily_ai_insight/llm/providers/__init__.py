@@ -2,5 +2,6 @@
 
 from .gemini import GeminiProvider
 from .openai import OpenAIProvider
+from .replay import ReplayProvider
 
-__all__ = ["GeminiProvider", "OpenAIProvider"]
+__all__ = ["GeminiProvider", "OpenAIProvider", "ReplayProvider"]
@@ -1,34 +1,80 @@
 """Google Gemini API provider."""
 
 import os
-import json
+import asyncio
 import logging
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 import google.generativeai as genai
 from google.generativeai.types import GenerationConfig
 
+from ..tokens import get_estimator
+from ..parsing import extract_json
+from ..rate_limit import RateLimiter, get_limiter, is_rate_limited, retry_after, backoff_delay
+
 logger = logging.getLogger(__name__)
 
 
 class GeminiProvider:
-    """Google Gemini API provider for content analysis."""
+    """Google Gemini API provider for content analysis.
+
+    Calls never block the event loop: they go through the SDK's async
+    client, or through a bounded thread pool when that is disabled. At most
+    ``max_concurrency`` calls are in flight, and each one is cancelled after
+    ``timeout`` seconds. Calls are paced by the shared Gemini rate limiter
+    (see ``rate_limit.get_limiter``).
+
+    Configuration via environment variables:
+        GEMINI_TIMEOUT: Seconds before a single API call is abandoned (default: 60)
+        GEMINI_MAX_CONCURRENCY: API calls in flight at once (default: 4)
+        GEMINI_ASYNC_CLIENT: Use the SDK's async client instead of a thread pool (default: true)
+    """
+
+    def __init__(
+        self,
+        api_key: str = None,
+        timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        use_async_client: Optional[bool] = None,
+        limiter: Optional[RateLimiter] = None
+    ):
+        """Initialize the provider.
 
-    def __init__(self, api_key: str = None):
+        Args:
+            api_key: Gemini API key (or from GEMINI_API_KEY env)
+            timeout: Per-call timeout in seconds (or from GEMINI_TIMEOUT env)
+            max_concurrency: Concurrent API calls (or from GEMINI_MAX_CONCURRENCY env)
+            use_async_client: Use the SDK's async client (or from GEMINI_ASYNC_CLIENT env)
+            limiter: Rate limiter (defaults to the one shared by all Gemini callers)
+        """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key is required")
 
+        self.timeout = timeout or float(os.getenv("GEMINI_TIMEOUT", "60"))
+        self.max_concurrency = max_concurrency or int(os.getenv("GEMINI_MAX_CONCURRENCY", "4"))
+        if use_async_client is None:
+            use_async_client = os.getenv("GEMINI_ASYNC_CLIENT", "true").lower() == "true"
+        self.use_async_client = use_async_client
+        self.limiter = limiter or get_limiter("gemini")
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
         genai.configure(api_key=self.api_key)
 
+        self.model_name = "gemini-1.5-flash"  # Using Flash for cost efficiency
+        self.generation_config = {
+            "temperature": 0.7,
+            "top_p": 0.95,
+            "top_k": 40,
+            "max_output_tokens": 4096,
+        }
+
         # Initialize model with optimal settings
         self.model = genai.GenerativeModel(
-            model_name="gemini-1.5-flash",  # Using Flash for cost efficiency
-            generation_config=GenerationConfig(
-                temperature=0.7,
-                top_p=0.95,
-                top_k=40,
-                max_output_tokens=4096,
-            )
+            model_name=self.model_name,
+            generation_config=GenerationConfig(**self.generation_config)
         )
 
     async def analyze(self, prompt: str, max_retries: int = 3) -> Dict[str, Any]:
@@ -43,36 +89,28 @@ class GeminiProvider:
         """
         for attempt in range(max_retries):
             try:
-                response = self.model.generate_content(prompt)
+                response = await self._generate(prompt)
 
-                # Extract JSON from response
                 text = response.text
 
-                # Try to extract JSON from markdown code blocks
-                if "```json" in text:
-                    json_start = text.find("```json") + 7
-                    json_end = text.find("```", json_start)
-                    text = text[json_start:json_end].strip()
-                elif "```" in text:
-                    json_start = text.find("```") + 3
-                    json_end = text.find("```", json_start)
-                    text = text[json_start:json_end].strip()
-
-                # Parse JSON response
-                try:
-                    result = json.loads(text)
+                # Tolerate code fences, surrounding prose and truncation
+                result = extract_json(text)
+                if result is not None:
                     logger.debug(f"Successfully parsed Gemini response")
                     return result
-                except json.JSONDecodeError:
-                    # If not JSON, return as text
-                    logger.debug(f"Response is not JSON, returning as text")
-                    return {"text": text}
+
+                # If not JSON, return as text
+                logger.debug(f"Response is not JSON, returning as text")
+                return {"text": text}
 
             except Exception as e:
                 logger.warning(f"Gemini API attempt {attempt + 1} failed: {e}")
                 if attempt == max_retries - 1:
                     logger.error(f"All Gemini API attempts failed")
                     raise
+                # After a 429 the shared limiter already pauses every caller
+                if not is_rate_limited(e):
+                    await asyncio.sleep(backoff_delay(attempt))
 
         return {}
 
@@ -88,7 +126,7 @@ class GeminiProvider:
         """
         try:
             # Update generation config for this call
-            response = self.model.generate_content(
+            response = await self._generate(
                 prompt,
                 generation_config=GenerationConfig(
                     temperature=0.7,
@@ -102,17 +140,76 @@ class GeminiProvider:
             logger.error(f"Gemini text generation failed: {e}")
             raise
 
+    async def _generate(self, prompt: str, generation_config: Optional[GenerationConfig] = None):
+        """Run one generate_content call without blocking the event loop.
+
+        Args:
+            prompt: The prompt to send
+            generation_config: Per-call generation config override
+
+        Returns:
+            SDK response object
+
+        Waits for the rate limiter first, and reports 429 responses to it.
+
+        Raises:
+            asyncio.TimeoutError: If the call takes longer than the timeout
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        # The SDK enforces the timeout too, so a pool thread is not left waiting
+        request_options = {"timeout": self.timeout}
+
+        await self.limiter.acquire(self.count_tokens(prompt))
+        async with self._semaphore:
+            if self.use_async_client:
+                call = self.model.generate_content_async(
+                    prompt,
+                    generation_config=generation_config,
+                    request_options=request_options
+                )
+            else:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_concurrency,
+                        thread_name_prefix="gemini"
+                    )
+                call = asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    partial(
+                        self.model.generate_content,
+                        prompt,
+                        generation_config=generation_config,
+                        request_options=request_options
+                    )
+                )
+            try:
+                response = await asyncio.wait_for(call, self.timeout)
+            except Exception as e:
+                if is_rate_limited(e):
+                    self.limiter.on_rate_limited(retry_after(e))
+                raise
+
+        self.limiter.on_success()
+        return response
+
     def count_tokens(self, text: str) -> int:
-        """Count tokens in text.
+        """Estimate tokens in text.
+
+        The countTokens API is a blocking network round-trip, so this is a
+        local estimate calibrated for Gemini.
 
         Args:
             text: Text to count tokens for
 
         Returns:
-            Token count
+            Token count estimate
         """
-        try:
-            return self.model.count_tokens(text).total_tokens
-        except:
-            # Rough estimate if counting fails
-            return len(text) // 4
\ No newline at end of file
+        return get_estimator("gemini").count(text)
+
+    def close(self):
+        """Shut down the thread pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
\ No newline at end of file
@@ -1,24 +1,32 @@
 """OpenAI API provider (backup)."""
 
 import os
-import json
+import asyncio
 import logging
 from typing import Dict, Any, Optional
 from openai import AsyncOpenAI
 
+from ..tokens import get_estimator
+from ..parsing import extract_json
+from ..rate_limit import RateLimiter, get_limiter, is_rate_limited, retry_after, backoff_delay
+
 logger = logging.getLogger(__name__)
 
 
 class OpenAIProvider:
     """OpenAI API provider for content analysis (backup)."""
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, limiter: Optional[RateLimiter] = None):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
 
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        # Retries are paced by the shared rate limiter instead of the SDK
+        self.client = AsyncOpenAI(api_key=self.api_key, max_retries=0)
+        self.limiter = limiter or get_limiter("openai")
         self.model = "gpt-3.5-turbo"  # Using 3.5-turbo for cost efficiency
+        self.model_name = self.model
+        self.generation_config = {"temperature": 0.7, "max_tokens": 2048}
 
     async def analyze(self, prompt: str, max_retries: int = 3) -> Dict[str, Any]:
         """Analyze content using OpenAI.
@@ -32,7 +40,8 @@ class OpenAIProvider:
         """
         for attempt in range(max_retries):
             try:
-                response = await self.client.chat.completions.create(
+                response = await self._create(
+                    prompt,
                     model=self.model,
                     messages=[
                         {"role": "system", "content": "You are a professional AI analyst. Always respond in JSON format when requested."},
@@ -45,52 +54,85 @@ class OpenAIProvider:
 
                 text = response.choices[0].message.content
 
-                # Parse JSON response
-                try:
-                    result = json.loads(text)
+                # Parse JSON response, repairing truncated output
+                result = extract_json(text)
+                if result is not None:
                     logger.debug(f"Successfully parsed OpenAI response")
                     return result
-                except json.JSONDecodeError:
-                    logger.debug(f"Response is not JSON, returning as text")
-                    return {"text": text}
+
+                logger.debug(f"Response is not JSON, returning as text")
+                return {"text": text}
 
             except Exception as e:
                 logger.warning(f"OpenAI API attempt {attempt + 1} failed: {e}")
                 if attempt == max_retries - 1:
                     logger.error(f"All OpenAI API attempts failed")
                     raise
+                # After a 429 the shared limiter already pauses every caller
+                if not is_rate_limited(e):
+                    await asyncio.sleep(backoff_delay(attempt))
 
         return {}
 
-    async def generate_text(self, prompt: str, max_tokens: int = 2048) -> str:
+    async def generate_text(self, prompt: str, max_tokens: int = 2048, max_retries: int = 3) -> str:
         """Generate text using OpenAI.
 
         Args:
             prompt: The prompt to send to OpenAI
             max_tokens: Maximum output tokens
+            max_retries: Maximum number of attempts
 
         Returns:
             Generated text
         """
-        try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a professional content writer."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
-                max_tokens=max_tokens
-            )
-
-            return response.choices[0].message.content
+        for attempt in range(max_retries):
+            try:
+                response = await self._create(
+                    prompt,
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": "You are a professional content writer."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=max_tokens
+                )
+
+                return response.choices[0].message.content
 
+            except Exception as e:
+                if attempt == max_retries - 1:
+                    logger.error(f"OpenAI text generation failed: {e}")
+                    raise
+                logger.warning(f"OpenAI text generation attempt {attempt + 1} failed: {e}")
+                if not is_rate_limited(e):
+                    await asyncio.sleep(backoff_delay(attempt))
+
+        return ""
+
+    async def _create(self, prompt: str, **kwargs):
+        """Make one chat completion call through the rate limiter.
+
+        Args:
+            prompt: User prompt, for the token estimate
+            **kwargs: chat.completions.create arguments
+
+        Returns:
+            SDK response object
+        """
+        await self.limiter.acquire(self.count_tokens(prompt))
+        try:
+            response = await self.client.chat.completions.create(**kwargs)
         except Exception as e:
-            logger.error(f"OpenAI text generation failed: {e}")
+            if is_rate_limited(e):
+                self.limiter.on_rate_limited(retry_after(e))
             raise
 
+        self.limiter.on_success()
+        return response
+
     def count_tokens(self, text: str) -> int:
-        """Count tokens in text (rough estimate).
+        """Count tokens in text (local estimate).
 
         Args:
             text: Text to count tokens for
@@ -98,5 +140,4 @@ class OpenAIProvider:
         Returns:
             Token count estimate
         """
-        # Rough estimate for GPT-3.5
-        return len(text) // 4
\ No newline at end of file
+        return get_estimator("openai").count(text)
\ No newline at end of file
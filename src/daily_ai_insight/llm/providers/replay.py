@@ -0,0 +1,304 @@
+"""Record/replay LLM provider for offline runs and benchmarks."""
+
+import os
+import re
+import gzip
+import json
+import random
+import asyncio
+import hashlib
+import logging
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from ..cache import make_key
+from ..tokens import get_estimator
+
+logger = logging.getLogger(__name__)
+
+MODES = ("replay", "record", "fake")
+
+_JSON_ARRAY = re.compile(r"^\[\s*\{.*?^\]", re.DOTALL | re.MULTILINE)
+_TOPICS = ["LLM进展", "AI Agent", "工具资源", "研究论文", "行业动态"]
+
+
+class ReplayError(Exception):
+    """Injected failure or missing cassette entry."""
+
+
+class InjectedRateLimitError(ReplayError):
+    """Injected HTTP 429."""
+
+    status_code = 429
+
+
+class ReplayProvider:
+    """LLM provider backed by a recorded cassette or synthetic responses.
+
+    Modes:
+        record: Forward calls to ``inner`` and store each request/response
+            pair in the cassette (gzip-compressed JSON lines keyed by
+            ``cache.make_key``)
+        replay: Answer from the cassette; unseen prompts get a synthetic
+            response
+        fake: Always answer with synthetic responses (see synthetic_response())
+
+    Latency, jitter, failures and 429s can be injected to benchmark the
+    analyzer's concurrency and retry behaviour offline.
+
+    Configuration via environment variables (see from_env()):
+        LLM_REPLAY_MODE: replay, record or fake (default: replay)
+        LLM_REPLAY_CASSETTE: Cassette file (default: storage/data/llm_cassette.jsonl.gz)
+        LLM_REPLAY_LATENCY: Seconds added to every call (default: 0)
+        LLM_REPLAY_JITTER: Random extra seconds per call (default: 0)
+        LLM_REPLAY_FAILURE_RATE: Fraction of calls that raise (default: 0)
+        LLM_REPLAY_RATE_LIMIT_RATE: Fraction of calls that raise a 429 (default: 0)
+
+    Example:
+        provider = ReplayProvider("cassette.jsonl.gz", mode="record", inner=GeminiProvider())
+        ...
+        provider.close()  # writes the cassette
+        provider = ReplayProvider("cassette.jsonl.gz", latency=0.5)
+    """
+
+    def __init__(
+        self,
+        cassette: Optional[str] = None,
+        mode: str = "replay",
+        inner: Optional[Any] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: int = 0
+    ):
+        """Initialize the provider.
+
+        Args:
+            cassette: Cassette file to load and/or record to
+            mode: "replay", "record" or "fake"
+            inner: Real provider to record from (record mode)
+            latency: Seconds added to every call
+            jitter: Random extra seconds (0 to jitter) per call
+            failure_rate: Fraction of calls that raise ReplayError
+            rate_limit_rate: Fraction of calls that raise an HTTP 429 error
+            seed: Seed for jitter and failure injection
+
+        Raises:
+            ValueError: If the mode is unknown or record mode has no inner provider
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown replay mode: {mode}. Available: {', '.join(MODES)}")
+        if mode == "record" and inner is None:
+            raise ValueError("Record mode needs a provider to record from")
+
+        self.mode = mode
+        self.inner = inner
+        self.cassette = Path(cassette) if cassette else None
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.rate_limit_rate = rate_limit_rate
+        self._rng = random.Random(seed)
+
+        self.model_name = getattr(inner, "model_name", "replay")
+        self.generation_config = getattr(inner, "generation_config", {})
+
+        self.entries: Dict[str, Any] = {}
+        self._dirty = False
+        self.stats = {"calls": 0, "replayed": 0, "recorded": 0, "synthetic": 0, "failed": 0}
+
+        if self.cassette and self.cassette.exists() and mode != "fake":
+            self._load()
+
+    @classmethod
+    def from_env(cls) -> "ReplayProvider":
+        """Create a provider configured by LLM_REPLAY_* environment variables.
+
+        Record mode records from GeminiProvider.
+        """
+        mode = os.getenv("LLM_REPLAY_MODE", "replay")
+        inner = None
+        if mode == "record":
+            from .gemini import GeminiProvider
+            inner = GeminiProvider()
+
+        return cls(
+            os.getenv("LLM_REPLAY_CASSETTE", "storage/data/llm_cassette.jsonl.gz"),
+            mode=mode,
+            inner=inner,
+            latency=float(os.getenv("LLM_REPLAY_LATENCY", "0")),
+            jitter=float(os.getenv("LLM_REPLAY_JITTER", "0")),
+            failure_rate=float(os.getenv("LLM_REPLAY_FAILURE_RATE", "0")),
+            rate_limit_rate=float(os.getenv("LLM_REPLAY_RATE_LIMIT_RATE", "0"))
+        )
+
+    def _load(self):
+        with gzip.open(self.cassette, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self.entries[entry["k"]] = entry["r"]
+        logger.info(f"Loaded {len(self.entries)} recorded LLM responses from {self.cassette}")
+
+    def save(self):
+        """Write the cassette if anything was recorded."""
+        if not self._dirty or not self.cassette:
+            return
+
+        self.cassette.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cassette.with_name(self.cassette.name + ".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            for key, response in self.entries.items():
+                f.write(json.dumps({"k": key, "r": response}, ensure_ascii=False) + "\n")
+        tmp.replace(self.cassette)
+        self._dirty = False
+        logger.info(f"Saved {len(self.entries)} LLM responses to {self.cassette}")
+
+    def close(self):
+        """Save the cassette and close the recorded provider."""
+        self.save()
+        close_inner = getattr(self.inner, "close", None)
+        if close_inner is not None:
+            close_inner()
+
+    async def analyze(self, prompt: str, max_retries: int = 3) -> Dict[str, Any]:
+        """Return a recorded or synthetic analysis response."""
+        return await self._call("analyze", prompt, {})
+
+    async def generate_text(self, prompt: str, max_tokens: int = 2048) -> str:
+        """Return a recorded or synthetic text response."""
+        return await self._call("generate_text", prompt, {"max_tokens": max_tokens})
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens like the recorded provider (Gemini calibration without one)."""
+        if self.inner is not None:
+            return self.inner.count_tokens(text)
+        return get_estimator("gemini").count(text)
+
+    async def _call(self, call: str, prompt: str, options: Dict[str, Any]) -> Any:
+        """Answer one call according to the mode, with injected latency and errors."""
+        self.stats["calls"] += 1
+        # Keyed on the request only, so a cassette replays without its provider
+        key = make_key("cassette", "", dict(call=call, **options), prompt)
+
+        if self.mode == "record":
+            if call == "analyze":
+                response = await self.inner.analyze(prompt)
+            else:
+                response = await self.inner.generate_text(prompt, **options)
+            self.entries[key] = response
+            self._dirty = True
+            self.stats["recorded"] += 1
+            return response
+
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+
+        roll = self._rng.random()
+        if roll < self.rate_limit_rate:
+            self.stats["failed"] += 1
+            raise InjectedRateLimitError("Injected 429 Too Many Requests")
+        if roll < self.rate_limit_rate + self.failure_rate:
+            self.stats["failed"] += 1
+            raise ReplayError("Injected failure")
+
+        if self.mode == "replay" and key in self.entries:
+            self.stats["replayed"] += 1
+            return self.entries[key]
+
+        self.stats["synthetic"] += 1
+        return synthetic_response(call, prompt)
+
+
+def _hash_int(*parts: Any) -> int:
+    digest = hashlib.blake2b("\x1f".join(map(str, parts)).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _prompt_items(prompt: str) -> Optional[List[Dict[str, Any]]]:
+    """The first JSON array of objects embedded in a prompt, if any."""
+    for match in _JSON_ARRAY.finditer(prompt):
+        try:
+            items = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            continue
+        if items and all(isinstance(item, dict) for item in items):
+            return items
+    return None
+
+
+def synthetic_response(call: str, prompt: str) -> Any:
+    """Build a deterministic response in the shape a prompt asks for.
+
+    Batch prompts get per-item results or summaries, analysis prompts the
+    analysis schema. Values are derived from a hash of the prompt, so runs
+    are reproducible.
+
+    Args:
+        call: "analyze" or "generate_text"
+        prompt: Prompt text
+
+    Returns:
+        Parsed JSON for analyze calls, or text (JSON text for prompts that
+        ask for per-item results) for generate_text calls
+    """
+    seed = _hash_int(call, prompt)
+    items = _prompt_items(prompt)
+
+    if call == "analyze" and "executive_summary" in prompt:
+        titles = [item.get("title", "") for item in items or []]
+        return {
+            "executive_summary": f"Synthetic analysis of {len(titles)} items",
+            "key_points": [
+                {"title": title, "description": title, "importance": ("high", "medium", "low")[i % 3]}
+                for i, title in enumerate(titles[:5])
+            ],
+            "trend_analysis": {"current_trends": ["synthetic"], "emerging_topics": [], "declining_topics": []},
+            "impact_assessment": "Synthetic",
+            "professional_insights": "Synthetic",
+            "recommendations": [],
+            "notable_sources": [
+                {"title": item.get("title", ""), "url": item.get("url", ""), "reason": "Synthetic"}
+                for item in (items or [])[:3]
+            ],
+        }
+
+    if items is not None and '"summaries"' in prompt:
+        summaries = [
+            {
+                "id": item.get("id"),
+                "summary": f"Synthetic summary of {item.get('title') or item.get('id')}",
+            }
+            for item in items
+        ]
+        if call == "analyze":
+            return {"summaries": summaries}
+        return json.dumps({"summaries": summaries}, ensure_ascii=False)
+
+    if items is not None:
+        id_field = "idx" if "idx" in items[0] else "id"
+        results = []
+        for item in items:
+            score = _hash_int(seed, item.get(id_field)) % 101
+            results.append({
+                id_field: item.get(id_field),
+                "include": score >= 50,
+                "relevance_score": score // 10,
+                "score": score,
+                "topic": _TOPICS[score % len(_TOPICS)],
+                "summary": str(item.get("title", ""))[:25],
+                "tags": [],
+                "skip": False,
+            })
+        if call == "analyze":
+            return {"results": results}
+        return json.dumps(results, ensure_ascii=False)
+
+    if call == "analyze":
+        score = seed % 11
+        return {"include": score >= 6, "relevance_score": score, "reason": "Synthetic"}
+
+    first_line = prompt.strip().splitlines()[0] if prompt.strip() else ""
+    return f"Synthetic response {seed % 10000:04d}: {first_line[:80]}"
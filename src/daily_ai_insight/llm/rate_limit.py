@@ -0,0 +1,234 @@
+"""Adaptive rate limiting for LLM API calls."""
+
+import os
+import time
+import random
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+
+from ..net.pacing import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Exponential backoff with full jitter.
+
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay ceiling of the first attempt, in seconds
+        cap: Maximum delay ceiling, in seconds
+
+    Returns:
+        Random delay between 0 and min(cap, base * 2 ** attempt)
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    """True if an SDK exception is an HTTP 429 / quota error.
+
+    Recognizes OpenAI's RateLimitError (status_code 429) and Google's
+    ResourceExhausted (code 429) without importing either SDK.
+    """
+    for attr in ("status_code", "code", "status"):
+        try:
+            if int(getattr(error, attr, 0) or 0) == 429:
+                return True
+        except (TypeError, ValueError):
+            continue
+    return type(error).__name__ in ("RateLimitError", "ResourceExhausted", "TooManyRequests")
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Read the Retry-After delay from an SDK exception, if it carries one.
+
+    Args:
+        error: Exception raised by an API call
+
+    Returns:
+        Delay in seconds, or None
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or getattr(error, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return max(0.0, float(value) / 1000)
+        except (TypeError, ValueError):
+            return None
+    return parse_retry_after(headers.get("retry-after"))
+
+
+class _Bucket:
+    """Token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: float, burst_seconds: float):
+        self.per_minute = per_minute
+        self.burst_seconds = burst_seconds
+        self.level = self.capacity(1.0)
+        self.updated = time.monotonic()
+
+    def capacity(self, scale: float) -> float:
+        return max(1.0, self.per_minute * scale / 60 * self.burst_seconds)
+
+    def refill(self, now: float, scale: float):
+        rate = self.per_minute * scale / 60
+        self.level = min(self.capacity(scale), self.level + (now - self.updated) * rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, scale: float) -> float:
+        # Requests larger than the bucket only wait for a full bucket
+        amount = min(amount, self.capacity(scale))
+        if self.level >= amount:
+            return 0.0
+        return (amount - self.level) / (self.per_minute * scale / 60)
+
+    def take(self, amount: float, scale: float):
+        self.level -= min(amount, self.capacity(scale))
+
+
+class RateLimiter:
+    """Token-bucket rate limiter with AIMD adaptation to 429 responses."""
+
+    def __init__(
+        self,
+        requests_per_minute: float = 60,
+        tokens_per_minute: Optional[float] = None,
+        burst_seconds: float = 5,
+        min_scale: float = 0.05,
+        increase_step: float = 0.05
+    ):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Request ceiling
+            tokens_per_minute: Prompt token ceiling, or None for no token limit
+            burst_seconds: Seconds of quota that may be spent at once
+            min_scale: Lowest fraction of the ceilings the rate is cut to
+            increase_step: Fraction of the ceilings regained per success
+        """
+        self.requests = _Bucket(requests_per_minute, burst_seconds)
+        self.tokens = _Bucket(tokens_per_minute, burst_seconds) if tokens_per_minute else None
+        self.min_scale = min_scale
+        self.increase_step = increase_step
+        self.scale = 1.0
+
+        self._paused_until = 0.0
+        self._failures = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = {"requests": 0, "rate_limited": 0, "waited": 0.0}
+
+    @property
+    def requests_per_minute(self) -> float:
+        """Request rate currently allowed."""
+        return self.requests.per_minute * self.scale
+
+    @property
+    def tokens_per_minute(self) -> Optional[float]:
+        """Token rate currently allowed, or None without a token limit."""
+        return self.tokens.per_minute * self.scale if self.tokens else None
+
+    async def acquire(self, tokens: int = 0):
+        """Wait until a request with this many prompt tokens may be sent.
+
+        Args:
+            tokens: Estimated prompt tokens of the request
+        """
+        # Scripts may run several event loops in turn
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+
+        # Callers are served in order; the lock is held while waiting
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.requests.refill(now, self.scale)
+                wait = max(self._paused_until - now, self.requests.wait_time(1, self.scale))
+                if self.tokens and tokens:
+                    self.tokens.refill(now, self.scale)
+                    wait = max(wait, self.tokens.wait_time(tokens, self.scale))
+                if wait <= 0:
+                    break
+                self._stats["waited"] += wait
+                await asyncio.sleep(wait)
+
+            self.requests.take(1, self.scale)
+            if self.tokens and tokens:
+                self.tokens.take(tokens, self.scale)
+            self._stats["requests"] += 1
+
+    def on_success(self):
+        """Additively raise the allowed rate after a successful call."""
+        self._failures = 0
+        self.scale = min(1.0, self.scale + self.increase_step)
+
+    def on_rate_limited(self, delay: Optional[float] = None) -> float:
+        """Halve the allowed rate and pause all callers after a 429.
+
+        Args:
+            delay: Server-provided Retry-After in seconds, if any
+
+        Returns:
+            Seconds all callers pause for
+        """
+        if delay is None:
+            delay = backoff_delay(self._failures)
+        self._failures += 1
+        self.scale = max(self.min_scale, self.scale / 2)
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        self._stats["rate_limited"] += 1
+
+        logger.warning(
+            f"Rate limited, pausing {delay:.1f}s and lowering to "
+            f"{self.requests_per_minute:.0f} requests/min"
+        )
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current ceilings.
+
+        Returns:
+            Dictionary with requests, rate_limited, waited (seconds),
+            requests_per_minute and tokens_per_minute
+        """
+        return dict(
+            self._stats,
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute
+        )
+
+
+_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_limiter(provider: str) -> RateLimiter:
+    """Return the limiter shared by all callers of a provider.
+
+    Ceilings come from ``<PROVIDER>_RPM`` and ``<PROVIDER>_TPM`` environment
+    variables (e.g. GEMINI_RPM), defaulting to 60 requests/min and no token
+    limit.
+
+    Args:
+        provider: Provider name ("gemini" or "openai")
+
+    Returns:
+        Shared RateLimiter
+    """
+    limiter = _limiters.get(provider)
+    if limiter is None:
+        prefix = provider.upper()
+        tpm = os.getenv(f"{prefix}_TPM")
+        limiter = RateLimiter(
+            requests_per_minute=float(os.getenv(f"{prefix}_RPM", "60")),
+            tokens_per_minute=float(tpm) if tpm else None
+        )
+        _limiters[provider] = limiter
+    return limiter
@@ -0,0 +1,261 @@
+"""Hedged routing between two LLM providers."""
+
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import List, Dict, Any, Optional, Callable, Awaitable
+
+logger = logging.getLogger(__name__)
+
+# Marks "no response yet", since None is a possible provider response
+_MISSING = object()
+
+
+class ProviderStats:
+    """Sliding-window latency and error statistics of one provider."""
+
+    def __init__(self, window: int = 100):
+        """Initialize the statistics.
+
+        Args:
+            window: Number of recent calls considered
+        """
+        self.latencies: deque = deque(maxlen=window)
+        self.outcomes: deque = deque(maxlen=window)
+
+    def record(self, latency: Optional[float]):
+        """Record a call; a latency of None marks a failure."""
+        self.outcomes.append(latency is not None)
+        if latency is not None:
+            self.latencies.append(latency)
+
+    def record_cancelled(self, elapsed: float):
+        """Record a cancelled call, which took at least ``elapsed`` seconds.
+
+        The latency is kept as a lower bound so calls that lose a hedge
+        still raise the tail estimate; the outcome is not counted.
+        """
+        self.latencies.append(elapsed)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Latency quantile of recent successful calls, or None without data."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of recent calls that failed."""
+        if not self.outcomes:
+            return 0.0
+        return 1 - sum(self.outcomes) / len(self.outcomes)
+
+
+class HedgedRouter:
+    """Route LLM calls to two providers with hedging and failover.
+
+    Exposes the provider interface (``analyze``, ``generate_text``,
+    ``count_tokens``), so it can be wrapped by CachedProvider.
+    """
+
+    def __init__(
+        self,
+        primary: Any,
+        secondary: Any,
+        hedge_quantile: float = 0.95,
+        max_hedge_ratio: float = 0.2,
+        min_samples: int = 10,
+        max_error_rate: float = 0.5,
+        window: int = 100
+    ):
+        """Initialize the router.
+
+        Args:
+            primary: Preferred provider
+            secondary: Provider used for hedges and failover
+            hedge_quantile: Primary latency quantile after which a hedge is sent
+            max_hedge_ratio: Maximum fraction of calls that may be hedged
+            min_samples: Successful primary calls needed before hedging starts
+            max_error_rate: Recent error rate at which the providers swap roles
+            window: Calls kept in each provider's statistics
+        """
+        self.providers = [primary, secondary]
+        self.hedge_quantile = hedge_quantile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_samples = min_samples
+        self.max_error_rate = max_error_rate
+        self.stats: Dict[int, ProviderStats] = {
+            id(primary): ProviderStats(window),
+            id(secondary): ProviderStats(window),
+        }
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+    @property
+    def model_name(self) -> str:
+        return getattr(self.providers[0], "model_name", "")
+
+    @property
+    def generation_config(self) -> Dict[str, Any]:
+        return getattr(self.providers[0], "generation_config", {})
+
+    def count_tokens(self, text: str) -> int:
+        """Count tokens with the primary provider."""
+        return self.providers[0].count_tokens(text)
+
+    def close(self):
+        """Close both providers."""
+        for provider in self.providers:
+            close = getattr(provider, "close", None)
+            if close is not None:
+                close()
+
+    async def analyze(self, prompt: str, max_retries: int = 3) -> Dict[str, Any]:
+        """Analyze with hedging; see the provider's analyze()."""
+        return await self._route(
+            lambda provider: provider.analyze(prompt, max_retries=max_retries),
+            lambda result: isinstance(result, (dict, list)) and bool(result)
+            and not (isinstance(result, dict) and set(result) == {"text"})
+        )
+
+    async def generate_text(self, prompt: str, max_tokens: int = 2048) -> str:
+        """Generate text with hedging; see the provider's generate_text()."""
+        return await self._route(
+            lambda provider: provider.generate_text(prompt, max_tokens=max_tokens),
+            lambda result: bool(result)
+        )
+
+    def _ordered(self) -> List[Any]:
+        """Providers in the order to try them, demoting an unhealthy primary."""
+        primary, secondary = self.providers
+        primary_stats = self.stats[id(primary)]
+        if (
+            len(primary_stats.outcomes) >= self.min_samples
+            and primary_stats.error_rate >= self.max_error_rate
+            and self.stats[id(secondary)].error_rate < primary_stats.error_rate
+        ):
+            return [secondary, primary]
+        return [primary, secondary]
+
+    def _hedge_delay(self, provider: Any) -> Optional[float]:
+        """Seconds to wait before hedging, or None if hedging is not allowed."""
+        stats = self.stats[id(provider)]
+        if len(stats.latencies) < self.min_samples:
+            return None
+        if self.hedges >= self.max_hedge_ratio * self.calls:
+            return None
+        return stats.quantile(self.hedge_quantile)
+
+    async def _timed(self, provider: Any, call: Callable[[Any], Awaitable[Any]]) -> Any:
+        """Run a call and record its latency or failure."""
+        started = time.monotonic()
+        try:
+            result = await call(provider)
+        except asyncio.CancelledError:
+            self.stats[id(provider)].record_cancelled(time.monotonic() - started)
+            raise
+        except Exception:
+            self.stats[id(provider)].record(None)
+            raise
+        self.stats[id(provider)].record(time.monotonic() - started)
+        return result
+
+    async def _route(
+        self,
+        call: Callable[[Any], Awaitable[Any]],
+        is_valid: Callable[[Any], bool]
+    ) -> Any:
+        """Run a call on the first provider, hedging or failing over to the second.
+
+        Args:
+            call: Function starting the call on a provider
+            is_valid: Whether a response is usable
+
+        Returns:
+            First valid response, or the first response received if none is valid
+
+        Raises:
+            Exception: Whichever provider error arrived first, if no provider
+                returned a response
+        """
+        self.calls += 1
+        first, second = self._ordered()
+        tasks = {asyncio.create_task(self._timed(first, call)): first}
+        hedge_at = self._hedge_delay(first)
+
+        fallback_result = _MISSING
+        first_error: Optional[BaseException] = None
+        started_second = False
+
+        try:
+            while tasks:
+                timeout = None
+                if not started_second and hedge_at is not None:
+                    timeout = max(0.0, hedge_at)
+                done, _ = await asyncio.wait(
+                    tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # Primary is slower than its usual tail: hedge
+                    self.hedges += 1
+                    logger.debug(f"Hedging slow call after {hedge_at:.1f}s")
+                    tasks[asyncio.create_task(self._timed(second, call))] = second
+                    started_second = True
+                    continue
+
+                for task in done:
+                    provider = tasks.pop(task)
+                    error = task.exception()
+                    if error is None and is_valid(task.result()):
+                        if provider is second and started_second and hedge_at is not None:
+                            self.hedge_wins += 1
+                        return task.result()
+
+                    if error is None and fallback_result is _MISSING:
+                        fallback_result = task.result()
+                    if error is not None and first_error is None:
+                        first_error = error
+
+                if not tasks and not started_second:
+                    self.failovers += 1
+                    logger.info("Primary LLM call failed, failing over to secondary provider")
+                    tasks[asyncio.create_task(self._timed(second, call))] = second
+                    started_second = True
+                    hedge_at = None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        if fallback_result is not _MISSING:
+            return fallback_result
+        if first_error is None:
+            raise RuntimeError("No LLM provider returned a response")
+        raise first_error
+
+    def summary(self) -> Dict[str, Any]:
+        """Routing counters and per-provider statistics.
+
+        Returns:
+            Dictionary with calls, hedges, hedge_wins, failovers and, per
+            provider class, p50/p95 latency and error rate
+        """
+        providers = {}
+        for provider in self.providers:
+            stats = self.stats[id(provider)]
+            providers[type(provider).__name__] = {
+                "p50": stats.quantile(0.5),
+                "p95": stats.quantile(0.95),
+                "error_rate": stats.error_rate,
+            }
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "failovers": self.failovers,
+            "providers": providers,
+        }
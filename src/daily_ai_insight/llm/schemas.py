@@ -0,0 +1,84 @@
+"""Response schemas for the structured LLM prompts.
+
+Fields mirror the JSON formats requested in ``prompts.templates``. Models
+are lenient where models commonly drift (numbers as strings, missing
+optional fields) and ignore extra fields.
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class _Response(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+
+class FilterResult(_Response):
+    """FILTER_PROMPT response."""
+
+    include: Optional[bool] = None
+    relevance_score: Optional[float] = Field(default=None, ge=0, le=10)
+    reason: str = ""
+
+
+class BatchFilterItem(FilterResult):
+    """One entry of a BATCH_FILTER_PROMPT response."""
+
+    id: int
+
+
+class SummaryItem(_Response):
+    """One entry of a BATCH_SUMMARY_PROMPT response."""
+
+    id: int
+    summary: str = Field(min_length=1)
+
+
+class ScoredItem(_Response):
+    """One entry of the classification prompt in scripts/generate_daily_report.py."""
+
+    idx: int
+    score: int = Field(default=50, ge=0, le=100)
+    topic: str = "其他"
+    summary: str = ""
+    tags: List[str] = []
+    relevance_reason: str = ""
+    actionable: bool = False
+    skip: bool = False
+
+
+class KeyPoint(_Response):
+    title: str = ""
+    description: str = ""
+    importance: str = "medium"
+
+
+class TrendAnalysis(_Response):
+    current_trends: List[str] = []
+    emerging_topics: List[str] = []
+    declining_topics: List[str] = []
+
+
+class Recommendation(_Response):
+    action: str = ""
+    reason: str = ""
+    priority: str = "medium"
+
+
+class NotableSource(_Response):
+    title: str = ""
+    url: str = ""
+    reason: str = ""
+
+
+class AnalysisResult(_Response):
+    """ANALYSIS_PROMPT and REDUCE_ANALYSIS_PROMPT response."""
+
+    executive_summary: str = Field(min_length=1)
+    key_points: List[KeyPoint] = []
+    trend_analysis: TrendAnalysis = TrendAnalysis()
+    impact_assessment: str = ""
+    professional_insights: str = ""
+    recommendations: List[Recommendation] = []
+    notable_sources: List[NotableSource] = []
@@ -0,0 +1,104 @@
+"""Local token count estimation for LLM prompts."""
+
+import re
+import json
+import math
+import logging
+from functools import lru_cache
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+# Characters written without spaces between words
+_CJK_CHARS = r'\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff'
+_CJK = re.compile(f'[{_CJK_CHARS}]')
+_WORD = re.compile(f'[^\\W_{_CJK_CHARS}]+')
+_SYMBOL = re.compile(r'[^\w\s]|_')
+
+# Approximate tokenizer behaviour per provider
+CALIBRATION: Dict[str, Dict[str, float]] = {
+    # SentencePiece vocabulary with good CJK coverage
+    "gemini": {"chars_per_token": 4.0, "tokens_per_cjk_char": 0.7, "symbols_per_token": 2.0},
+    # cl100k-style BPE, which splits most CJK characters into byte tokens
+    "openai": {"chars_per_token": 4.0, "tokens_per_cjk_char": 1.2, "symbols_per_token": 1.5},
+}
+
+
+class TokenEstimator:
+    """Estimate token counts locally, memoizing results per text."""
+
+    def __init__(
+        self,
+        chars_per_token: float = 4.0,
+        tokens_per_cjk_char: float = 1.0,
+        symbols_per_token: float = 2.0,
+        cache_size: int = 4096
+    ):
+        """Initialize the estimator.
+
+        Args:
+            chars_per_token: Average characters per token in Latin words
+            tokens_per_cjk_char: Average tokens per CJK character
+            symbols_per_token: Average punctuation characters per token
+            cache_size: Distinct texts whose counts are memoized
+        """
+        self.chars_per_token = chars_per_token
+        self.tokens_per_cjk_char = tokens_per_cjk_char
+        self.symbols_per_token = symbols_per_token
+        self._count = lru_cache(maxsize=cache_size)(self._estimate)
+
+    def count(self, text: str) -> int:
+        """Estimate the tokens in a text.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            Estimated token count
+        """
+        if not text:
+            return 0
+        return self._count(text)
+
+    def count_json(self, value: Any) -> int:
+        """Estimate the tokens of a value serialized as in prompts.
+
+        Args:
+            value: JSON-serializable value
+
+        Returns:
+            Estimated token count
+        """
+        return self.count(json.dumps(value, ensure_ascii=False, indent=2))
+
+    def cache_info(self):
+        """Memoization statistics (functools.lru_cache info)."""
+        return self._count.cache_info()
+
+    def _estimate(self, text: str) -> int:
+        words = sum(
+            math.ceil(len(word) / self.chars_per_token) for word in _WORD.findall(text)
+        )
+        cjk = len(_CJK.findall(text)) * self.tokens_per_cjk_char
+        symbols = len(_SYMBOL.findall(text)) / self.symbols_per_token
+        return math.ceil(words + cjk + symbols)
+
+
+_estimators: Dict[str, TokenEstimator] = {}
+
+
+def get_estimator(provider: str) -> TokenEstimator:
+    """Return the shared estimator for a provider.
+
+    Args:
+        provider: Provider name ("gemini" or "openai"); unknown names get
+            the default calibration
+
+    Returns:
+        TokenEstimator shared by every caller for that provider
+    """
+    estimator = _estimators.get(provider)
+    if estimator is None:
+        estimator = TokenEstimator(**CALIBRATION.get(provider, {}))
+        _estimators[provider] = estimator
+    return estimator
@@ -0,0 +1,6 @@
+"""Shared networking utilities."""
+
+from .session import SessionManager
+from .pacing import HostPacer, get_pacer, parse_retry_after, THROTTLE_STATUSES
+
+__all__ = ["SessionManager", "HostPacer", "get_pacer", "parse_retry_after", "THROTTLE_STATUSES"]
@@ -0,0 +1,207 @@
+"""Adaptive per-host request pacing."""
+
+import os
+import time
+import random
+import asyncio
+import logging
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Statuses that mean "slow down" rather than "failed"
+THROTTLE_STATUSES = (429, 503)
+
+# Smallest interval after a throttled response, in seconds
+_THROTTLED_INTERVAL = 1.0
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Seconds to wait from a Retry-After header value.
+
+    Args:
+        value: Delay in seconds or an HTTP-date, as a string or number
+
+    Returns:
+        Non-negative delay in seconds, or None if the value is missing or invalid
+    """
+    if isinstance(value, (int, float)):
+        return max(0.0, float(value))
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HostPacer:
+    """Space requests to one host, adapting to latency and throttling.
+
+    Configuration via environment variables:
+        HTTP_PACE_INITIAL_INTERVAL: Starting gap between requests in seconds (default: 0.25)
+        HTTP_PACE_MIN_INTERVAL: Smallest gap in seconds (default: 0.05)
+        HTTP_PACE_MAX_INTERVAL: Largest gap in seconds (default: 30)
+    """
+
+    def __init__(
+        self,
+        host: str,
+        initial_interval: Optional[float] = None,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        slow_factor: float = 2.0,
+        speedup: float = 0.7,
+        slowdown: float = 1.5
+    ):
+        """Initialize the pacer.
+
+        Args:
+            host: Hostname, used in log messages
+            initial_interval: Starting gap (or from HTTP_PACE_INITIAL_INTERVAL env)
+            min_interval: Smallest gap (or from HTTP_PACE_MIN_INTERVAL env)
+            max_interval: Largest gap (or from HTTP_PACE_MAX_INTERVAL env)
+            slow_factor: Latency above this multiple of the baseline counts as slow
+            speedup: Factor applied to the gap after a fast response
+            slowdown: Factor applied to the gap after a slow or failed response
+        """
+        self.host = host
+        self.min_interval = min_interval if min_interval is not None else float(
+            os.getenv("HTTP_PACE_MIN_INTERVAL", "0.05")
+        )
+        self.max_interval = max_interval if max_interval is not None else float(
+            os.getenv("HTTP_PACE_MAX_INTERVAL", "30")
+        )
+        initial = initial_interval if initial_interval is not None else float(
+            os.getenv("HTTP_PACE_INITIAL_INTERVAL", "0.25")
+        )
+        self.interval = min(self.max_interval, max(self.min_interval, initial))
+        self.slow_factor = slow_factor
+        self.speedup = speedup
+        self.slowdown = slowdown
+
+        # Lowest recent latency, drifting slowly upwards so it can recover
+        self.baseline: Optional[float] = None
+
+        self._next_at = 0.0
+        self._paused_until = 0.0
+        self._failures = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats = {"requests": 0, "throttled": 0, "slow": 0, "errors": 0, "waited": 0.0}
+
+    async def acquire(self):
+        """Wait for this host's next request slot."""
+        # Scripts may run several event loops in turn
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+
+        # Callers are served in order; the lock is held while waiting
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                wait = max(self._paused_until, self._next_at) - now
+                if wait <= 0:
+                    break
+                self._stats["waited"] += wait
+                await asyncio.sleep(wait)
+
+            self._next_at = now + self.interval
+            self._stats["requests"] += 1
+
+    def on_response(self, status: int, latency: float, retry_after: Any = None) -> float:
+        """Adapt the interval to a completed request.
+
+        Args:
+            status: HTTP status code
+            latency: Seconds from sending the request to reading the body
+            retry_after: Retry-After header value, if any
+
+        Returns:
+            The new interval in seconds
+        """
+        if status in THROTTLE_STATUSES:
+            self._throttled(parse_retry_after(retry_after))
+        elif status >= 500:
+            self._slow_down()
+            self._stats["errors"] += 1
+        else:
+            self._failures = 0
+            if self.baseline is None or latency < self.baseline:
+                self.baseline = latency
+            else:
+                self.baseline += (latency - self.baseline) * 0.05
+
+            if latency > self.slow_factor * self.baseline and latency > self.min_interval:
+                self._slow_down()
+                self._stats["slow"] += 1
+            else:
+                self.interval = max(self.min_interval, self.interval * self.speedup)
+
+        return self.interval
+
+    def on_error(self) -> float:
+        """Back off after a connection error or timeout.
+
+        Returns:
+            The new interval in seconds
+        """
+        self._slow_down()
+        self._stats["errors"] += 1
+        return self.interval
+
+    def _slow_down(self):
+        self.interval = min(self.max_interval, self.interval * self.slowdown)
+
+    def _throttled(self, delay: Optional[float]):
+        """Double the interval and pause all callers after a 429."""
+        if delay is None:
+            delay = random.uniform(0, min(60.0, 2 ** self._failures))
+        self._failures += 1
+        self.interval = min(self.max_interval, max(self.interval * 2, _THROTTLED_INTERVAL))
+        self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        self._stats["throttled"] += 1
+
+        logger.warning(
+            f"{self.host}: Throttled, pausing {delay:.1f}s and spacing requests "
+            f"{self.interval:.2f}s apart"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and the current interval.
+
+        Returns:
+            Dictionary with requests, throttled, slow, errors, waited
+            (seconds), interval and baseline latency
+        """
+        return dict(self._stats, interval=self.interval, baseline=self.baseline)
+
+
+_pacers: Dict[str, HostPacer] = {}
+
+
+def get_pacer(host_or_url: str) -> HostPacer:
+    """Return the pacer shared by all requests to a host.
+
+    Args:
+        host_or_url: Hostname, or a URL whose host is used
+
+    Returns:
+        Shared HostPacer
+    """
+    host = urlparse(host_or_url).hostname if "://" in host_or_url else host_or_url
+    host = (host or host_or_url).lower()
+
+    pacer = _pacers.get(host)
+    if pacer is None:
+        pacer = HostPacer(host)
+        _pacers[host] = pacer
+    return pacer
@@ -0,0 +1,205 @@
+"""Shared, connection-pooled HTTP session management."""
+
+import os
+import asyncio
+import logging
+from contextlib import asynccontextmanager, AsyncExitStack
+from typing import Dict, Optional, AsyncIterator
+from urllib.parse import urlparse
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_host_map(value: str) -> Dict[str, float]:
+    """Parse a "host=value,host=value" setting into a dictionary."""
+    result: Dict[str, float] = {}
+
+    for pair in value.split(","):
+        host, _, number = pair.strip().partition("=")
+        if not host or not number:
+            continue
+        try:
+            result[host.strip().lower()] = float(number)
+        except ValueError:
+            logger.warning(f"Ignoring invalid host setting: {pair}")
+
+    return result
+
+
+class SessionManager:
+    """Own a pooled aiohttp session shared across the pipeline.
+
+    Every collector, storage backend and renderer reuses its keep-alive
+    connections, cached DNS lookups and TLS sessions. The underlying session
+    is created lazily on first use, so a manager can be constructed outside
+    a running event loop and injected everywhere.
+
+    Configuration via environment variables:
+        HTTP_POOL_LIMIT: Total open connections (default: 100)
+        HTTP_POOL_LIMIT_PER_HOST: Open connections per host (default: 10)
+        HTTP_KEEPALIVE_TIMEOUT: Seconds to keep idle connections (default: 30)
+        HTTP_DNS_CACHE_TTL: Seconds to cache DNS lookups (default: 300)
+        HTTP_TIMEOUT: Default total request timeout in seconds (default: 30)
+        HTTP_HOST_LIMITS: Concurrent requests per host, e.g. "api.follow.is=4"
+        HTTP_HOST_TIMEOUTS: Request timeout per host, e.g. "api.telegram.org=15"
+
+    Example:
+        async with SessionManager() as http:
+            async with http.request("GET", "https://example.com") as resp:
+                body = await resp.text()
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int] = None,
+        limit_per_host: Optional[int] = None,
+        keepalive_timeout: Optional[float] = None,
+        dns_cache_ttl: Optional[int] = None,
+        timeout: Optional[float] = None,
+        host_limits: Optional[Dict[str, int]] = None,
+        host_timeouts: Optional[Dict[str, float]] = None
+    ):
+        """Initialize the session manager.
+
+        Args:
+            limit: Maximum open connections in total
+            limit_per_host: Maximum open connections per host
+            keepalive_timeout: Seconds to keep idle connections alive
+            dns_cache_ttl: Seconds to cache DNS lookups
+            timeout: Default total timeout for requests in seconds
+            host_limits: Maximum concurrent requests keyed by host
+            host_timeouts: Request timeout in seconds keyed by host
+        """
+        self.limit = limit or int(os.getenv("HTTP_POOL_LIMIT", "100"))
+        self.limit_per_host = limit_per_host or int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", "10"))
+        self.keepalive_timeout = keepalive_timeout or float(
+            os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30")
+        )
+        self.dns_cache_ttl = dns_cache_ttl or int(os.getenv("HTTP_DNS_CACHE_TTL", "300"))
+        self.timeout = timeout or float(os.getenv("HTTP_TIMEOUT", "30"))
+
+        self.host_limits: Dict[str, int] = {
+            host: int(value)
+            for host, value in _parse_host_map(os.getenv("HTTP_HOST_LIMITS", "")).items()
+        }
+        self.host_limits.update(host_limits or {})
+
+        self.host_timeouts: Dict[str, float] = _parse_host_map(os.getenv("HTTP_HOST_TIMEOUTS", ""))
+        self.host_timeouts.update(host_timeouts or {})
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def configure_host(
+        self,
+        host: str,
+        limit: Optional[int] = None,
+        timeout: Optional[float] = None
+    ):
+        """Set concurrency and timeout for a single host.
+
+        Args:
+            host: Hostname, e.g. "api.follow.is"
+            limit: Maximum concurrent requests to this host
+            timeout: Total request timeout in seconds for this host
+        """
+        host = host.lower()
+        if limit is not None:
+            self.host_limits[host] = limit
+            self._host_semaphores.pop(host, None)
+        if timeout is not None:
+            self.host_timeouts[host] = timeout
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_cache_ttl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            logger.debug(
+                f"Opened pooled HTTP session (limit={self.limit}, "
+                f"per_host={self.limit_per_host})"
+            )
+        return self._session
+
+    @asynccontextmanager
+    async def request(self, method: str, url: str, **kwargs) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Send a request over the shared session.
+
+        Applies the host's concurrency limit and timeout when configured.
+        Accepts the same keyword arguments as aiohttp.ClientSession.request.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Passed through to aiohttp
+
+        Yields:
+            The aiohttp response
+        """
+        host = (urlparse(url).hostname or "").lower()
+
+        if "timeout" not in kwargs and host in self.host_timeouts:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=self.host_timeouts[host])
+
+        session = await self.get_session()
+
+        async with AsyncExitStack() as stack:
+            semaphore = self._host_semaphore(host)
+            if semaphore is not None:
+                await stack.enter_async_context(semaphore)
+
+            response = await stack.enter_async_context(session.request(method, url, **kwargs))
+            yield response
+
+    def _host_semaphore(self, host: str) -> Optional[asyncio.Semaphore]:
+        """Return the concurrency semaphore for a host, if limited."""
+        limit = self.host_limits.get(host)
+        if not limit:
+            return None
+
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(int(limit))
+        return self._host_semaphores[host]
+
+    async def close(self):
+        """Close the shared session and its connection pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self) -> "SessionManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    @classmethod
+    @asynccontextmanager
+    async def scoped(cls, manager: Optional["SessionManager"] = None) -> AsyncIterator["SessionManager"]:
+        """Use an injected manager, or a temporary one when none is given.
+
+        Lets components work both inside the pipeline (shared pool) and
+        standalone (pool closed on exit).
+
+        Args:
+            manager: Shared manager, or None
+
+        Yields:
+            A usable SessionManager
+        """
+        if manager is not None:
+            yield manager
+            return
+
+        async with cls() as owned:
+            yield owned
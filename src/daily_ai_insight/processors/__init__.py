@@ -2,5 +2,7 @@
 
 from .cleaner import DataCleaner
 from .deduper import Deduplicator
+from .clustering import TopicClusterer
+from .ranker import PreRanker
 
-__all__ = ["DataCleaner", "Deduplicator"]
+__all__ = ["DataCleaner", "Deduplicator", "TopicClusterer", "PreRanker"]
@@ -1,22 +1,44 @@
 """Data cleaning and normalization."""
 
+import os
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, AsyncIterable, AsyncIterator
 from datetime import datetime, timedelta
 import logging
 
+from .normalizer import TextNormalizer, KeywordMatcher
+from .clustering import TopicClusterer
+
 logger = logging.getLogger(__name__)
 
+# Tracking query parameters stripped from URLs
+_TRACKING_PARAMS = re.compile(r'[\?\&](utm_|ref=|source=)[^&]*')
+
 
 class DataCleaner:
-    """Clean and normalize collected data."""
+    """Clean and normalize collected data.
+
+    Configuration via environment variables:
+        CLEAN_TEXT_MODE: "unicode" keeps all scripts, "ascii" drops
+            non-ASCII letters as older versions did (default: unicode)
+    """
+
+    def __init__(self, text_mode: Optional[str] = None):
+        """Initialize the cleaner.
+
+        Args:
+            text_mode: Normalizer mode (or from CLEAN_TEXT_MODE env)
+        """
+        self.normalizer = TextNormalizer(text_mode or os.getenv("CLEAN_TEXT_MODE", "unicode"))
+        self.clusterer = TopicClusterer()
 
-    def __init__(self):
         # Keywords to filter out promotional content
         self.spam_keywords = [
             "sponsored", "advertisement", "promo", "discount",
             "limited offer", "buy now", "click here"
         ]
+        self._spam_matcher = KeywordMatcher(self.spam_keywords)
+        self._spam_source = tuple(self.spam_keywords)
 
         # Minimum content length
         self.min_content_length = 50
@@ -36,20 +58,59 @@ class DataCleaner:
         cleaned_items = []
 
         for item in items:
-            # Skip if item doesn't meet basic requirements
-            if not self._is_valid_item(item):
-                continue
-
-            # Clean the item
-            cleaned_item = self._clean_item(item)
-
-            # Apply filters
-            if self._should_keep_item(cleaned_item):
+            cleaned_item = self._process_item(item)
+            if cleaned_item is not None:
                 cleaned_items.append(cleaned_item)
 
         logger.info(f"Cleaned {len(items)} items, kept {len(cleaned_items)}")
         return cleaned_items
 
+    async def clean_stream(
+        self,
+        items: AsyncIterable[Dict[str, Any]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Clean and filter items as they arrive.
+
+        Args:
+            items: Async iterable of raw data items
+
+        Yields:
+            Cleaned items that pass the filters
+        """
+        total = 0
+        kept = 0
+
+        async for item in items:
+            total += 1
+            cleaned_item = self._process_item(item)
+            if cleaned_item is not None:
+                kept += 1
+                yield cleaned_item
+
+        logger.info(f"Cleaned {total} items, kept {kept}")
+
+    def _process_item(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Validate, clean and filter a single item.
+
+        Args:
+            item: Raw data item
+
+        Returns:
+            Cleaned item, or None if it was filtered out
+        """
+        # Skip if item doesn't meet basic requirements
+        if not self._is_valid_item(item):
+            return None
+
+        # Clean the item
+        cleaned_item = self._clean_item(item)
+
+        # Apply filters
+        if not self._should_keep_item(cleaned_item):
+            return None
+
+        return cleaned_item
+
     def _is_valid_item(self, item: Dict[str, Any]) -> bool:
         """Check if item has required fields.
 
@@ -73,16 +134,10 @@ class DataCleaner:
         """
         cleaned = item.copy()
 
-        # Clean title
+        # Clean title and content (markup, URLs, special characters, whitespace)
         cleaned["title"] = self._clean_text(cleaned["title"])
-
-        # Clean content
         cleaned["content"] = self._clean_text(cleaned["content"])
 
-        # Remove duplicate whitespace
-        cleaned["title"] = re.sub(r'\s+', ' ', cleaned["title"]).strip()
-        cleaned["content"] = re.sub(r'\s+', ' ', cleaned["content"]).strip()
-
         # Truncate very long content
         if len(cleaned["content"]) > 2000:
             cleaned["content"] = cleaned["content"][:1997] + "..."
@@ -106,24 +161,9 @@ class DataCleaner:
             text: Raw text
 
         Returns:
-            Cleaned text
+            Cleaned single-line text
         """
-        if not text:
-            return ""
-
-        # Remove HTML tags if any remain
-        text = re.sub(r'<[^>]+>', '', text)
-
-        # Remove URLs from content (keep them in the url field)
-        text = re.sub(r'https?://\S+', '', text)
-
-        # Remove special characters but keep punctuation
-        text = re.sub(r'[^\w\s\.\,\!\?\-\:\;\(\)\'\"]+', ' ', text)
-
-        # Fix encoding issues
-        text = text.encode('ascii', 'ignore').decode('ascii')
-
-        return text
+        return self.normalizer.normalize(text)
 
     def _normalize_url(self, url: str) -> str:
         """Normalize URL format.
@@ -138,7 +178,7 @@ class DataCleaner:
             return ""
 
         # Remove tracking parameters
-        url = re.sub(r'[\?\&](utm_|ref=|source=)[^&]*', '', url)
+        url = _TRACKING_PARAMS.sub('', url)
 
         # Remove trailing slashes
         url = url.rstrip('/')
@@ -164,11 +204,9 @@ class DataCleaner:
             return False
 
         # Check for spam keywords
-        content_lower = (item.get("content", "") + item.get("title", "")).lower()
-        for keyword in self.spam_keywords:
-            if keyword in content_lower:
-                logger.debug(f"Filtered out spam item: {item.get('title', '')}")
-                return False
+        if self._find_spam_keyword(item.get("content", "") + item.get("title", "")):
+            logger.debug(f"Filtered out spam item: {item.get('title', '')}")
+            return False
 
         # Check age
         if "published_at" in item:
@@ -184,8 +222,36 @@ class DataCleaner:
 
         return True
 
+    def prefilter(self, item: Dict[str, Any]) -> bool:
+        """Check an item on its title and URL alone, before content is fetched.
+
+        Args:
+            item: Item with at least title and url
+
+        Returns:
+            False if the item would be filtered out whatever its content
+        """
+        if not item.get("url"):
+            return False
+
+        if self._find_spam_keyword(item.get("title", "")):
+            logger.debug(f"Pre-filtered spam item: {item.get('title', '')}")
+            return False
+
+        return True
+
+    def _find_spam_keyword(self, text: str) -> Optional[str]:
+        """Return the first spam keyword in the text, if any.
+
+        The matcher is rebuilt when spam_keywords has been changed.
+        """
+        if self._spam_source != tuple(self.spam_keywords):
+            self._spam_matcher = KeywordMatcher(self.spam_keywords)
+            self._spam_source = tuple(self.spam_keywords)
+        return self._spam_matcher.search(text)
+
     def group_by_category(self, items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-        """Group items by category/tags.
+        """Group items by topic cluster, or by tags/source without NumPy.
 
         Args:
             items: List of cleaned items
@@ -193,6 +259,9 @@ class DataCleaner:
         Returns:
             Dictionary of categorized items
         """
+        if self.clusterer.available:
+            return self.clusterer.group(items)
+
         categories = {}
 
         for item in items:
@@ -0,0 +1,307 @@
+"""Local topic clustering of content items."""
+
+import os
+import math
+import logging
+from collections import Counter
+from typing import List, Dict, Any, Optional
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from .similarity import terms
+
+logger = logging.getLogger(__name__)
+
+# cluster_id of items without any shared terms
+UNCLUSTERED = -1
+UNCLUSTERED_LABEL = "other"
+
+
+class TopicClusterer:
+    """Cluster items into topics with TF-IDF vectors and k-means.
+
+    The title (counted twice), tags and start of the content of each item
+    become a TF-IDF vector over CJK character bigrams and Latin words (see
+    ``similarity.terms``). Spherical k-means, seeded with k-means++ and
+    updated in mini-batches for large inputs, clusters the vectors; the
+    cluster count with the best silhouette score on a sample is used. Each
+    cluster is labelled with its highest-weighted terms.
+
+    Results are deterministic for the same items. NumPy is optional
+    (``pip install daily-ai-insight[fast]``); without it items are left
+    unclustered.
+
+    Configuration via environment variables:
+        CLUSTER_MAX_CLUSTERS: Upper bound on the number of topics (default: 12)
+        CLUSTER_LABEL_TERMS: Top terms joined into a topic label (default: 3)
+
+    Example:
+        clusters = TopicClusterer().cluster(items)
+        clusters[0]["label"]  # "agent / 智能 / 体"
+        items[0]["cluster_id"], items[0]["cluster_label"]
+    """
+
+    def __init__(
+        self,
+        max_clusters: Optional[int] = None,
+        label_terms: Optional[int] = None,
+        max_features: int = 4096,
+        max_df: float = 0.5,
+        content_chars: int = 1000,
+        batch_size: int = 256,
+        sample_size: int = 500,
+        iterations: int = 30,
+        seed: int = 0
+    ):
+        """Initialize the clusterer.
+
+        Args:
+            max_clusters: Upper bound on clusters (or from CLUSTER_MAX_CLUSTERS env)
+            label_terms: Terms per label (or from CLUSTER_LABEL_TERMS env)
+            max_features: Vocabulary size, most frequent terms first
+            max_df: Terms in more than this fraction of items are ignored
+            content_chars: Characters of content used per item
+            batch_size: Inputs larger than this use mini-batch updates
+            sample_size: Items sampled to choose the number of clusters
+            iterations: Maximum k-means iterations
+            seed: Seed for center initialization and mini-batch sampling
+        """
+        self.max_clusters = max_clusters or int(os.getenv("CLUSTER_MAX_CLUSTERS", "12"))
+        self.label_terms = label_terms or int(os.getenv("CLUSTER_LABEL_TERMS", "3"))
+        self.max_features = max_features
+        self.max_df = max_df
+        self.content_chars = content_chars
+        self.batch_size = batch_size
+        self.sample_size = sample_size
+        self.iterations = iterations
+        self.seed = seed
+
+    @property
+    def available(self) -> bool:
+        """True if NumPy is installed."""
+        return HAS_NUMPY
+
+    def cluster(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Assign a topic cluster to every item.
+
+        Sets ``cluster_id`` (0 is the largest cluster, -1 for items sharing
+        no terms with any other) and ``cluster_label`` on each item.
+
+        Args:
+            items: Content items
+
+        Returns:
+            Clusters by decreasing size, each a dictionary with id, label,
+            terms and size; empty without NumPy
+        """
+        if not items or not HAS_NUMPY:
+            return []
+
+        matrix, vocabulary = self._vectorize([self._terms(item) for item in items])
+        assignments = np.full(len(items), UNCLUSTERED)
+        rows = np.flatnonzero(matrix.any(axis=1))
+        if len(rows):
+            vectors = matrix[rows]
+            assignments[rows] = self._kmeans(vectors, self._choose_k(vectors))
+
+        # Number clusters by size, ties by first member
+        found = [label for label in dict.fromkeys(assignments.tolist()) if label != UNCLUSTERED]
+        found.sort(key=lambda label: -int((assignments == label).sum()))
+
+        clusters = []
+        labels = {UNCLUSTERED: UNCLUSTERED_LABEL}
+        ids = {UNCLUSTERED: UNCLUSTERED}
+        for cluster_id, label in enumerate(found):
+            members = assignments == label
+            weights = matrix[members].mean(axis=0)
+            top = [idx for idx in np.argsort(-weights, kind="stable")[:self.label_terms] if weights[idx] > 0]
+            top_terms = [vocabulary[idx] for idx in top]
+            ids[label] = cluster_id
+            labels[label] = " / ".join(top_terms)
+            clusters.append({
+                "id": cluster_id,
+                "label": labels[label],
+                "terms": top_terms,
+                "size": int(members.sum()),
+            })
+
+        for item, label in zip(items, assignments.tolist()):
+            item["cluster_id"] = ids[label]
+            item["cluster_label"] = labels[label]
+
+        logger.debug(f"Clustered {len(items)} items into {len(clusters)} topics")
+        return clusters
+
+    def group(self, items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Group items by topic label, clustering them first if needed.
+
+        Args:
+            items: Content items
+
+        Returns:
+            Items per topic label; items without a label (e.g. added after
+            clustering, or all items without NumPy) are grouped under
+            UNCLUSTERED_LABEL
+        """
+        if not any("cluster_label" in item for item in items):
+            self.cluster(items)
+
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for item in items:
+            groups.setdefault(item.get("cluster_label", UNCLUSTERED_LABEL), []).append(item)
+        return groups
+
+    def _terms(self, item: Dict[str, Any]) -> List[str]:
+        """Terms of an item, with the title counted twice."""
+        title = terms(item.get("title", ""))
+        tags = [str(tag).lower() for tag in item.get("tags") or []]
+        return title + title + tags + terms(item.get("content", "")[:self.content_chars])
+
+    def _choose_k(self, matrix) -> int:
+        """Pick the cluster count with the best silhouette score.
+
+        Candidates range from half to twice the sqrt(n / 2) rule of thumb,
+        capped by max_clusters; scores are computed on a sample.
+        """
+        count = len(matrix)
+        upper = min(self.max_clusters, count - 1)
+        if upper < 2:
+            return 1
+
+        guess = max(2, round(math.sqrt(count / 2)))
+        candidates = range(max(2, min(guess, upper) // 2), min(upper, 2 * guess) + 1)
+        if len(candidates) == 1:
+            return candidates[0]
+
+        sample = matrix
+        if count > self.sample_size:
+            rng = np.random.default_rng(self.seed)
+            sample = matrix[np.sort(rng.choice(count, self.sample_size, replace=False))]
+
+        scores = {k: _silhouette(sample, self._kmeans(sample, k)) for k in candidates}
+        return max(candidates, key=lambda k: (round(scores[k], 6), -k))
+
+    def _vectorize(self, docs: List[List[str]]):
+        """Build L2-normalized TF-IDF vectors.
+
+        Terms found in only one item (when there are several) or in more
+        than max_df of the items are left out: they cannot pull items
+        together or they pull everything together.
+
+        Returns:
+            Tuple of (matrix with one row per document, vocabulary)
+        """
+        doc_freq: Counter = Counter()
+        for doc in docs:
+            doc_freq.update(set(doc))
+
+        count = len(docs)
+        min_df = 2 if count > 1 else 1
+        max_df = max(min_df, int(self.max_df * count))
+        candidates = [term for term, freq in doc_freq.items() if min_df <= freq <= max_df]
+        vocabulary = sorted(candidates, key=lambda term: (-doc_freq[term], term))[:self.max_features]
+        index = {term: col for col, term in enumerate(vocabulary)}
+
+        matrix = np.zeros((count, len(vocabulary)), dtype=np.float32)
+        for row, doc in enumerate(docs):
+            for term, freq in Counter(doc).items():
+                col = index.get(term)
+                if col is not None:
+                    matrix[row, col] = 1 + math.log(freq)
+
+        if vocabulary:
+            freqs = np.array([doc_freq[term] for term in vocabulary], dtype=np.float32)
+            matrix *= np.log((1 + count) / (1 + freqs)) + 1
+        return _normalize(matrix), vocabulary
+
+    def _kmeans(self, matrix, k: int):
+        """Spherical k-means on normalized rows.
+
+        Returns:
+            Cluster index per row
+        """
+        rng = np.random.default_rng(self.seed)
+        centers = self._init_centers(matrix, k, rng)
+        count = len(matrix)
+
+        if count <= self.batch_size:
+            labels = None
+            for _ in range(self.iterations):
+                nearest = np.argmax(matrix @ centers.T, axis=1)
+                if labels is not None and np.array_equal(nearest, labels):
+                    break
+                labels = nearest
+                for center in range(len(centers)):
+                    members = matrix[labels == center]
+                    if len(members):
+                        centers[center] = members.sum(axis=0)
+                centers = _normalize(centers)
+        else:
+            # Mini-batch updates with a per-center learning rate
+            seen = np.zeros(len(centers))
+            for _ in range(self.iterations):
+                batch = matrix[rng.choice(count, self.batch_size, replace=False)]
+                for row, center in zip(batch, np.argmax(batch @ centers.T, axis=1)):
+                    seen[center] += 1
+                    centers[center] += (row - centers[center]) / seen[center]
+                centers = _normalize(centers)
+
+        return np.argmax(matrix @ centers.T, axis=1)
+
+    @staticmethod
+    def _init_centers(matrix, k: int, rng):
+        """Pick k-means++ initial centers by cosine distance.
+
+        Stops early when every row already coincides with a center.
+        """
+        first = int(rng.integers(len(matrix)))
+        chosen = [first]
+        distance = np.clip(1 - matrix @ matrix[first], 0, None)
+
+        while len(chosen) < k:
+            weights = distance ** 2
+            total = weights.sum()
+            if total <= 1e-9:
+                break
+            pick = int(rng.choice(len(matrix), p=weights / total))
+            chosen.append(pick)
+            distance = np.minimum(distance, np.clip(1 - matrix @ matrix[pick], 0, None))
+
+        return matrix[chosen].copy()
+
+
+def _normalize(matrix):
+    """Scale rows to unit length, leaving zero rows as they are."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return matrix / norms
+
+
+def _silhouette(matrix, labels) -> float:
+    """Mean silhouette score with cosine distance; 0 for a single cluster."""
+    clusters = np.unique(labels)
+    if len(clusters) < 2:
+        return 0.0
+
+    distance = np.clip(1 - matrix @ matrix.T, 0, None)
+    onehot = (labels[:, None] == clusters[None, :]).astype(distance.dtype)
+    sizes = onehot.sum(axis=0)
+    totals = distance @ onehot
+
+    own = np.searchsorted(clusters, labels)
+    rows = np.arange(len(labels))
+    own_size = sizes[own] - 1
+    inner = np.divide(totals[rows, own], own_size, out=np.zeros(len(labels)), where=own_size > 0)
+
+    means = totals / sizes
+    means[rows, own] = np.inf
+    outer = means.min(axis=1)
+
+    scores = (outer - inner) / np.maximum(np.maximum(inner, outer), 1e-9)
+    # Members of singleton clusters score 0 by convention
+    scores[own_size == 0] = 0.0
+    return float(scores.mean())
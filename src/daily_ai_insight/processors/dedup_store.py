@@ -0,0 +1,251 @@
+"""SQLite-backed deduplication state."""
+
+import json
+import time
+import sqlite3
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Callable
+
+logger = logging.getLogger(__name__)
+
+CONTENT = "content"
+URL = "url"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    hash TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    url TEXT NOT NULL DEFAULT '',
+    seen_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+CREATE TABLE IF NOT EXISTS title_bands (
+    band_key TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    PRIMARY KEY (band_key, hash)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS title_bands_hash ON title_bands (hash);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class DedupStore:
+    """Persistent store of seen content hashes, URL hashes and title bands.
+
+    Entries are keyed by hash, carry a numeric expiry timestamp and are
+    written incrementally in WAL mode. Title LSH band keys live in their
+    own indexed table, so near-duplicate candidates are found with a single
+    lookup.
+    """
+
+    def __init__(self, path: str, retention_days: float = 7):
+        """Open (or create) the store and drop expired entries.
+
+        Args:
+            path: SQLite database file
+            retention_days: Days an entry is kept after it was last seen
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = retention_days * 86400
+
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self.prune()
+
+    def get_seen_at(self, hash_id: str, kind: str) -> Optional[float]:
+        """Return when an unexpired entry was last seen.
+
+        Args:
+            hash_id: Entry hash
+            kind: CONTENT or URL
+
+        Returns:
+            Unix timestamp, or None if the hash is unknown or expired
+        """
+        row = self._conn.execute(
+            "SELECT seen_at FROM entries WHERE hash = ? AND kind = ? AND expires_at > ?",
+            (hash_id, kind, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def title_candidates(self, band_keys: List[str]) -> List[Tuple[str, str]]:
+        """Find unexpired content entries sharing an LSH band with a title.
+
+        Args:
+            band_keys: Band keys of the title
+
+        Returns:
+            List of (hash, title) tuples
+        """
+        if not band_keys:
+            return []
+
+        placeholders = ",".join("?" * len(band_keys))
+        return self._conn.execute(
+            f"SELECT DISTINCT e.hash, e.title FROM title_bands b "
+            f"JOIN entries e ON e.hash = b.hash "
+            f"WHERE b.band_key IN ({placeholders}) AND e.expires_at > ?",
+            (*band_keys, time.time())
+        ).fetchall()
+
+    def add(
+        self,
+        hash_id: str,
+        kind: str,
+        title: str = "",
+        url: str = "",
+        band_keys: Optional[List[str]] = None,
+        seen_at: Optional[float] = None
+    ):
+        """Record an entry (uncommitted until commit()).
+
+        Args:
+            hash_id: Entry hash
+            kind: CONTENT or URL
+            title: Item title
+            url: Item URL
+            band_keys: Title LSH band keys, for content entries
+            seen_at: Unix timestamp, defaults to now
+        """
+        seen_at = seen_at or time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries (hash, kind, title, url, seen_at, expires_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (hash_id, kind, title, url, seen_at, seen_at + self.ttl)
+        )
+        if band_keys is not None:
+            self._set_bands(hash_id, band_keys)
+
+    def _set_bands(self, hash_id: str, band_keys: List[str]):
+        self._conn.execute("DELETE FROM title_bands WHERE hash = ?", (hash_id,))
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO title_bands (band_key, hash) VALUES (?, ?)",
+            [(band_key, hash_id) for band_key in band_keys]
+        )
+
+    def commit(self):
+        """Persist pending writes."""
+        self._conn.commit()
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete expired entries and their title bands.
+
+        Args:
+            now: Reference time, defaults to now
+
+        Returns:
+            Number of entries removed
+        """
+        now = now or time.time()
+        self._conn.execute(
+            "DELETE FROM title_bands WHERE hash IN "
+            "(SELECT hash FROM entries WHERE expires_at <= ?)",
+            (now,)
+        )
+        removed = self._conn.execute(
+            "DELETE FROM entries WHERE expires_at <= ?", (now,)
+        ).rowcount
+        self._conn.commit()
+        return removed
+
+    def count(self, kind: Optional[str] = None) -> int:
+        """Number of stored entries, optionally of one kind."""
+        if kind is None:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM entries WHERE kind = ?", (kind,)
+        ).fetchone()[0]
+
+    def ensure_band_params(self, params: str, band_keys_for: Callable[[str], List[str]]):
+        """Recompute title bands if the LSH settings changed.
+
+        Args:
+            params: Current index parameter fingerprint
+            band_keys_for: Function computing band keys for a title
+        """
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'lsh_params'").fetchone()
+        if row and row[0] == params:
+            return
+
+        rows = self._conn.execute(
+            "SELECT hash, title FROM entries WHERE kind = ?", (CONTENT,)
+        ).fetchall()
+        if rows:
+            logger.info(f"Re-indexing {len(rows)} titles for new similarity settings")
+
+        self._conn.execute("DELETE FROM title_bands")
+        for hash_id, title in rows:
+            self._set_bands(hash_id, band_keys_for(title))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('lsh_params', ?)", (params,)
+        )
+        self._conn.commit()
+
+    def import_json(
+        self,
+        history_file: Path,
+        params: str,
+        band_keys_for: Callable[[str], List[str]]
+    ) -> int:
+        """Import a legacy dedup_history.json file and move it aside.
+
+        Args:
+            history_file: Path of the JSON history
+            params: Current index parameter fingerprint, to reuse stored band keys
+            band_keys_for: Function computing band keys for titles without them
+
+        Returns:
+            Number of entries imported
+        """
+        try:
+            with open(history_file, "r", encoding="utf-8") as f:
+                data: Dict[str, Dict[str, Any]] = json.load(f)
+        except Exception as e:
+            logger.warning(f"Error reading legacy dedup history: {e}")
+            return 0
+
+        imported = 0
+        for hash_id, item_data in data.items():
+            try:
+                seen_at = datetime.fromisoformat(item_data.get("seen_at", "")).timestamp()
+            except (ValueError, TypeError):
+                continue
+
+            # URL entries share their title with a content entry
+            is_content = "url" in item_data
+            band_keys = None
+            if is_content:
+                band_keys = item_data.get("lsh")
+                if band_keys is None or item_data.get("lsh_params") != params:
+                    band_keys = band_keys_for(item_data.get("title", ""))
+
+            self.add(
+                hash_id,
+                CONTENT if is_content else URL,
+                title=item_data.get("title", ""),
+                url=item_data.get("url", ""),
+                band_keys=band_keys,
+                seen_at=seen_at
+            )
+            imported += 1
+
+        self.commit()
+        self.prune()
+        history_file.replace(history_file.with_name(history_file.name + ".migrated"))
+        logger.info(f"Imported {imported} entries from {history_file.name}")
+        return imported
+
+    def close(self):
+        """Commit and close the database."""
+        self._conn.commit()
+        self._conn.close()
@@ -1,60 +1,73 @@
 """Deduplication logic for content."""
 
 import os
-import json
+import time
 import hashlib
-from typing import List, Dict, Any, Set
-from datetime import datetime, timedelta
+from typing import List, Dict, Any, Set, Optional, AsyncIterable, AsyncIterator
 from pathlib import Path
 import logging
 
+from .dedup_store import DedupStore, CONTENT, URL
+from .similarity import NearDuplicateIndex
+
 logger = logging.getLogger(__name__)
 
 
+# Title length stored in history and used for similarity
+TITLE_MAX_LENGTH = 100
+
+
 class Deduplicator:
-    """Remove duplicate content based on various strategies."""
+    """Remove duplicate content based on various strategies.
+
+    Configuration via environment variables:
+        DEDUP_TITLE_THRESHOLD: Title Jaccard similarity treated as duplicate (default: 0.7)
+        DEDUP_SHINGLE_SIZE: Character n-gram length for CJK titles (default: 2)
+    """
+
+    def __init__(
+        self,
+        storage_path: str = "storage/data",
+        title_threshold: Optional[float] = None,
+        shingle_size: Optional[int] = None
+    ):
+        """Initialize the deduplicator.
 
-    def __init__(self, storage_path: str = "storage/data"):
+        Args:
+            storage_path: Directory holding the dedup history
+            title_threshold: Title similarity threshold (or from DEDUP_TITLE_THRESHOLD env)
+            shingle_size: CJK shingle length (or from DEDUP_SHINGLE_SIZE env)
+        """
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        # Legacy JSON history, imported into the store on first start
         self.history_file = self.storage_path / "dedup_history.json"
         self.history_retention_days = 7
-        self._load_history()
-
-    def _load_history(self):
-        """Load deduplication history from file."""
-        self.seen_hashes = set()
-        self.history_data = {}
+        self.title_index = NearDuplicateIndex(
+            threshold=title_threshold or float(os.getenv("DEDUP_TITLE_THRESHOLD", "0.7")),
+            shingle_size=shingle_size or int(os.getenv("DEDUP_SHINGLE_SIZE", "2"))
+        )
+        self._open_store()
+
+    def _open_store(self):
+        """Open the dedup store, importing a legacy JSON history once."""
+        self.store = DedupStore(
+            str(self.storage_path / "dedup.db"),
+            retention_days=self.history_retention_days
+        )
+
+        params = self.title_index.params
+        self.store.ensure_band_params(params, self.title_index.band_keys)
 
         if self.history_file.exists():
-            try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.history_data = data
-
-                    # Clean old entries
-                    cutoff_date = datetime.now() - timedelta(days=self.history_retention_days)
+            self.store.import_json(self.history_file, params, self.title_index.band_keys)
 
-                    cleaned_data = {}
-                    for hash_id, item_data in data.items():
-                        seen_date = datetime.fromisoformat(item_data.get("seen_at", ""))
-                        if seen_date > cutoff_date:
-                            cleaned_data[hash_id] = item_data
-                            self.seen_hashes.add(hash_id)
-
-                    self.history_data = cleaned_data
-                    logger.info(f"Loaded {len(self.seen_hashes)} items from dedup history")
-
-            except Exception as e:
-                logger.warning(f"Error loading dedup history: {e}")
-                self.history_data = {}
+        logger.info(f"Loaded {self.store.count(CONTENT)} items from dedup history")
 
     def _save_history(self):
-        """Save deduplication history to file."""
+        """Commit this run's entries to the dedup store."""
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.history_data, f, indent=2, default=str)
-            logger.debug(f"Saved {len(self.history_data)} items to dedup history")
+            self.store.commit()
         except Exception as e:
             logger.error(f"Error saving dedup history: {e}")
 
@@ -71,48 +84,8 @@ class Deduplicator:
         session_seen = set()  # Track duplicates within this batch
 
         for item in items:
-            # Generate various hashes for deduplication
-            content_hash = item.get("hash") or self._generate_content_hash(item)
-            url_hash = self._generate_url_hash(item.get("url", ""))
-            title_hash = self._generate_title_hash(item.get("title", ""))
-
-            # Check if we've seen this exact content before
-            if content_hash in self.seen_hashes or content_hash in session_seen:
-                logger.debug(f"Duplicate content found: {item.get('title', '')[:50]}")
-                continue
-
-            # Check if we've seen this URL recently (allow updates after 24 hours)
-            if url_hash in self.history_data:
-                last_seen = datetime.fromisoformat(self.history_data[url_hash]["seen_at"])
-                if (datetime.now() - last_seen).total_seconds() < 86400:  # 24 hours
-                    logger.debug(f"Recent URL found: {item.get('url', '')}")
-                    continue
-
-            # Check for similar titles (fuzzy matching)
-            if self._is_similar_title_exists(item.get("title", ""), session_seen):
-                logger.debug(f"Similar title found: {item.get('title', '')[:50]}")
-                continue
-
-            # Item is unique, add it
-            unique_items.append(item)
-
-            # Update tracking
-            session_seen.add(content_hash)
-            session_seen.add(title_hash)
-            self.seen_hashes.add(content_hash)
-
-            # Update history
-            self.history_data[content_hash] = {
-                "title": item.get("title", "")[:100],
-                "url": item.get("url", ""),
-                "seen_at": datetime.now().isoformat()
-            }
-
-            if url_hash:
-                self.history_data[url_hash] = {
-                    "title": item.get("title", "")[:100],
-                    "seen_at": datetime.now().isoformat()
-                }
+            if self._check_item(item, session_seen):
+                unique_items.append(item)
 
         # Save updated history
         self._save_history()
@@ -120,110 +93,148 @@ class Deduplicator:
         logger.info(f"Deduplicated {len(items)} items to {len(unique_items)} unique items")
         return unique_items
 
-    def _generate_content_hash(self, item: Dict[str, Any]) -> str:
-        """Generate hash based on content.
+    async def deduplicate_stream(
+        self,
+        items: AsyncIterable[Dict[str, Any]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Remove duplicates from items as they arrive.
+
+        History is saved once the stream is exhausted.
 
         Args:
-            item: Data item
+            items: Async iterable of data items
 
-        Returns:
-            SHA256 hash
+        Yields:
+            Unique items
         """
-        content = f"{item.get('title', '')}{item.get('content', '')}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        session_seen = set()
+        total = 0
+        unique = 0
 
-    def _generate_url_hash(self, url: str) -> str:
-        """Generate hash based on URL.
+        async for item in items:
+            total += 1
+            if self._check_item(item, session_seen):
+                unique += 1
+                yield item
+
+        self._save_history()
+
+        logger.info(f"Deduplicated {total} items to {unique} unique items")
+
+    def _check_item(self, item: Dict[str, Any], session_seen: Set[str]) -> bool:
+        """Check an item against history and record it if it is unique.
 
         Args:
-            url: URL string
+            item: Data item
+            session_seen: Hashes seen earlier in this batch (updated in place)
 
         Returns:
-            SHA256 hash
+            True if the item is unique
         """
-        if not url:
-            return ""
+        # Generate various hashes for deduplication
+        content_hash = item.get("hash") or self._generate_content_hash(item)
+        url_hash = self._generate_url_hash(item.get("url", ""))
 
-        # Normalize URL before hashing
-        url = url.lower().rstrip('/')
+        # Check if we've seen this exact content before
+        if content_hash in session_seen or self.store.get_seen_at(content_hash, CONTENT):
+            logger.debug(f"Duplicate content found: {item.get('title', '')[:50]}")
+            return False
 
-        # Remove common tracking parameters
-        for param in ['utm_source', 'utm_medium', 'utm_campaign', 'ref', 'source']:
-            url = url.split(f'?{param}=')[0].split(f'&{param}=')[0]
+        # Check if we've seen this URL recently (allow updates after 24 hours)
+        now = time.time()
+        if self._is_recent_url(url_hash, now):
+            logger.debug(f"Recent URL found: {item.get('url', '')}")
+            return False
 
-        return hashlib.sha256(url.encode()).hexdigest()
+        # Check for similar titles (fuzzy matching against indexed history)
+        title = item.get("title", "")[:TITLE_MAX_LENGTH]
+        band_keys = self.title_index.band_keys(title)
+        if self._has_similar_title(title, band_keys):
+            logger.debug(f"Similar title found: {item.get('title', '')[:50]}")
+            return False
+
+        # Update tracking
+        session_seen.add(content_hash)
+
+        # Update history
+        self.store.add(
+            content_hash, CONTENT,
+            title=title, url=item.get("url", ""), band_keys=band_keys, seen_at=now
+        )
+        if url_hash:
+            self.store.add(url_hash, URL, title=title, seen_at=now)
 
-    def _generate_title_hash(self, title: str) -> str:
-        """Generate hash based on title.
+        return True
+
+    def is_known(self, item: Dict[str, Any]) -> bool:
+        """Check an item's URL and title against history without recording it.
+
+        Lets collectors skip fetching content of items that deduplication
+        would drop anyway.
 
         Args:
-            title: Title string
+            item: Item with at least title and url
 
         Returns:
-            SHA256 hash
+            True if the URL was seen in the last 24 hours or a similar
+            title is in the history
         """
-        if not title:
-            return ""
+        if self._is_recent_url(self._generate_url_hash(item.get("url", "")), time.time()):
+            return True
 
-        # Normalize title
-        title = title.lower().strip()
-        # Remove common variations
-        title = title.replace(' - ', ' ').replace(' | ', ' ')
+        title = item.get("title", "")[:TITLE_MAX_LENGTH]
+        return self._has_similar_title(title, self.title_index.band_keys(title))
 
-        return hashlib.sha256(title.encode()).hexdigest()
+    def _is_recent_url(self, url_hash: str, now: float) -> bool:
+        """True if the URL was seen less than 24 hours ago."""
+        if not url_hash:
+            return False
+        last_seen = self.store.get_seen_at(url_hash, URL)
+        return bool(last_seen and now - last_seen < 86400)
 
-    def _is_similar_title_exists(self, title: str, seen_hashes: Set[str]) -> bool:
-        """Check if a similar title already exists.
+    def _has_similar_title(self, title: str, band_keys: List[str]) -> bool:
+        """True if a similar title is in the indexed history."""
+        candidates = self.store.title_candidates(band_keys)
+        return bool(candidates and self.title_index.best_match(title, candidates))
+
+    def _generate_content_hash(self, item: Dict[str, Any]) -> str:
+        """Generate hash based on content.
 
         Args:
-            title: Title to check
-            seen_hashes: Set of seen title hashes
+            item: Data item
 
         Returns:
-            True if similar title exists
+            SHA256 hash
         """
-        if not title:
-            return False
-
-        # Simple similarity check based on key words
-        title_words = set(title.lower().split())
+        content = f"{item.get('title', '')}{item.get('content', '')}"
+        return hashlib.sha256(content.encode()).hexdigest()
 
-        # Remove common words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'is', 'are'}
-        title_words = title_words - stop_words
+    def _generate_url_hash(self, url: str) -> str:
+        """Generate hash based on URL.
 
-        if len(title_words) < 3:
-            return False
+        Args:
+            url: URL string
 
-        # Check against history (simplified - in production, use better similarity metrics)
-        for hash_id, data in self.history_data.items():
-            if hash_id not in seen_hashes:
-                continue
+        Returns:
+            SHA256 hash
+        """
+        if not url:
+            return ""
 
-            existing_title = data.get("title", "").lower()
-            existing_words = set(existing_title.split()) - stop_words
+        # Normalize URL before hashing
+        url = url.lower().rstrip('/')
 
-            # If 70% of words match, consider it similar
-            if len(title_words & existing_words) / len(title_words) > 0.7:
-                return True
+        # Remove common tracking parameters
+        for param in ['utm_source', 'utm_medium', 'utm_campaign', 'ref', 'source']:
+            url = url.split(f'?{param}=')[0].split(f'&{param}=')[0]
 
-        return False
+        return hashlib.sha256(url.encode()).hexdigest()
 
     def clear_old_history(self):
         """Clear history older than retention period."""
-        cutoff_date = datetime.now() - timedelta(days=self.history_retention_days)
-
-        cleaned_data = {}
-        for hash_id, item_data in self.history_data.items():
-            try:
-                seen_date = datetime.fromisoformat(item_data.get("seen_at", ""))
-                if seen_date > cutoff_date:
-                    cleaned_data[hash_id] = item_data
-            except:
-                continue
-
-        removed_count = len(self.history_data) - len(cleaned_data)
-        self.history_data = cleaned_data
-        self._save_history()
+        removed_count = self.store.prune()
+        logger.info(f"Cleared {removed_count} old entries from dedup history")
 
-        logger.info(f"Cleared {removed_count} old entries from dedup history")
\ No newline at end of file
+    def close(self):
+        """Close the dedup store."""
+        self.store.close()
@@ -0,0 +1,152 @@
+"""Single-pass text normalization and keyword matching."""
+
+import re
+import logging
+from typing import List, Iterable, Optional, Tuple
+
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+logger = logging.getLogger(__name__)
+
+MODES = ("unicode", "ascii")
+
+# Punctuation kept in both modes (the original DataCleaner set)
+_ASCII_PUNCT = r"\.\,\!\?\-\:\;\(\)\'\""
+# Punctuation also kept in unicode mode
+_CJK_PUNCT = "，。！？：；、（）《》「」『』“”‘’…—·"
+
+# Non-ASCII whitespace, which the old ASCII encode deleted instead of spacing
+_NON_ASCII_SPACE = r"\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+
+_TAG = r"<[^>]+>"
+# Tags are stripped before URLs are matched, so a URL runs on through them
+_URL = r"https?://(?:[^\s<]+|<[^>]+>|<)+"
+
+
+def _build_patterns(mode: str) -> Tuple["re.Pattern", "re.Pattern"]:
+    """Compile the removal and replacement patterns for a mode.
+
+    Whitespace and every character outside the allowed set are replaced
+    by the same rule, so one negated character class both drops special
+    characters and collapses whitespace. Tags and URLs are removed by a
+    single alternation beforehand. Both steps are plain string
+    replacements, so no Python code runs per match.
+    """
+    if mode == "ascii":
+        keep = _ASCII_PUNCT + _NON_ASCII_SPACE
+    else:
+        keep = _ASCII_PUNCT + re.escape(_CJK_PUNCT)
+
+    remove = re.compile(f"{_TAG}|{_URL}")
+    replace = re.compile(r"[^\w" + keep + r"]+")
+    return remove, replace
+
+
+class TextNormalizer:
+    """Normalize text with precompiled rules in a single pass."""
+
+    def __init__(self, mode: str = "unicode"):
+        """Initialize the normalizer.
+
+        Args:
+            mode: "unicode" to keep all scripts, or "ascii" for the legacy
+                behaviour of dropping non-ASCII letters
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown normalizer mode: {mode}. Available: {', '.join(MODES)}")
+
+        self.mode = mode
+        self._remove, self._replace = _build_patterns(mode)
+
+    def normalize(self, text: str) -> str:
+        """Remove markup and URLs, drop disallowed characters and collapse whitespace.
+
+        Args:
+            text: Raw text
+
+        Returns:
+            Normalized single-line text
+        """
+        if not text:
+            return ""
+
+        text = self._replace.sub(" ", self._remove.sub("", text))
+        if self.mode == "ascii":
+            # Drop non-ASCII letters and spaces, then re-collapse the gaps
+            text = " ".join(text.encode("ascii", "ignore").decode("ascii").split())
+        return text.strip()
+
+
+class KeywordMatcher:
+    """Case-insensitive multi-keyword substring matcher."""
+
+    # Below this many keywords, per-keyword substring search beats the automaton
+    AUTOMATON_MIN_KEYWORDS = 16
+
+    def __init__(self, keywords: Iterable[str]):
+        """Build the matcher.
+
+        Args:
+            keywords: Keywords to look for (matched as substrings, ignoring case)
+        """
+        self.keywords = tuple(dict.fromkeys(k.lower() for k in keywords if k))
+        self._automaton = None
+
+        if HAS_AHOCORASICK and len(self.keywords) >= self.AUTOMATON_MIN_KEYWORDS:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    @property
+    def uses_automaton(self) -> bool:
+        """True if matching runs on an Aho-Corasick automaton."""
+        return self._automaton is not None
+
+    def search(self, text: str) -> Optional[str]:
+        """Return the first keyword found in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Matched keyword (lowercase), or None
+        """
+        if not text or not self.keywords:
+            return None
+
+        text = text.lower()
+        if self._automaton is not None:
+            for _, keyword in self._automaton.iter(text):
+                return keyword
+            return None
+
+        for keyword in self.keywords:
+            if keyword in text:
+                return keyword
+        return None
+
+    def find_all(self, text: str) -> List[str]:
+        """Return every distinct keyword found in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Matched keywords
+        """
+        if not text or not self.keywords:
+            return []
+
+        text = text.lower()
+        if self._automaton is not None:
+            return list(dict.fromkeys(keyword for _, keyword in self._automaton.iter(text)))
+        return [keyword for keyword in self.keywords if keyword in text]
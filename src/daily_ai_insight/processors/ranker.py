@@ -0,0 +1,301 @@
+"""Local pre-ranking of items before they reach the LLM."""
+
+import os
+import math
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Callable, Iterable
+
+import yaml
+
+from .similarity import terms
+
+logger = logging.getLogger(__name__)
+
+# Weights (summing to 100) used when the profile has none
+DEFAULT_WEIGHTS = {
+    "topic_relevance": 35,
+    "source_trust": 15,
+    "actionability": 20,
+    "freshness": 15,
+    "engagement": 10,
+    "uniqueness": 5,
+}
+
+# Interest terms used when the profile lists none
+DEFAULT_INTERESTS = ["LLM", "AI", "agent", "GPT", "model", "大模型", "模型", "智能体", "开源"]
+
+# Interest tiers of the profile and how much a matching term counts
+_INTEREST_TIERS = {"must_track": 1.0, "want_track": 0.6, "nice_to_have": 0.3}
+_TECH_STACK_WEIGHT = 0.8
+
+ACTION_KEYWORDS = (
+    "release", "launch", "open source", "open-source", "github", "api", "sdk",
+    "tutorial", "guide", "how to", "benchmark", "发布", "开源", "上线", "教程",
+    "实战", "指南", "工具",
+)
+
+# Metadata counters, with how much one unit counts
+ENGAGEMENT_FIELDS = {
+    "stars_today": 1.0, "likes": 1.0, "like_count": 1.0, "retweets": 2.0,
+    "retweet_count": 2.0, "replies": 2.0, "comments": 2.0, "upvotes": 1.0,
+    "points": 1.0, "stars": 0.1,
+}
+# Weighted engagement count that scores the maximum
+_ENGAGEMENT_SATURATION = 1000
+
+# Points per unit of a learned keyword adjustment, and their cap
+_FEEDBACK_POINTS = 2.0
+_MAX_FEEDBACK_POINTS = 20.0
+
+# Characters of content sent per item, used to size the token budget
+_LLM_CONTENT_CHARS = 500
+
+
+class PreRanker:
+    """Score items from the user profile and learned feedback.
+
+    Configuration via environment variables (see from_files()):
+        USER_PROFILE_PATH: Profile file (default: configs/profile.yaml)
+        USER_FEEDBACK_PATH: Feedback file (default: configs/feedback.yaml)
+    """
+
+    def __init__(
+        self,
+        profile: Optional[Dict[str, Any]] = None,
+        feedback: Optional[Dict[str, Any]] = None,
+        now: Optional[datetime] = None
+    ):
+        """Initialize the ranker.
+
+        Args:
+            profile: Parsed profile.yaml
+            feedback: Parsed feedback.yaml
+            now: Reference time for freshness (default: current time)
+        """
+        profile = profile or {}
+        feedback = feedback or {}
+        interests = profile.get("interests") or {}
+        filters = profile.get("filters") or {}
+        learned = feedback.get("learned_preferences") or {}
+
+        weights = (profile.get("scoring") or {}).get("weights") or DEFAULT_WEIGHTS
+        weights = {name: float(weights.get(name, 0)) for name in DEFAULT_WEIGHTS}
+        total = sum(weights.values()) or 1.0
+        self.weights = {name: weight / total for name, weight in weights.items()}
+
+        # Interest terms, weighted by the highest tier that mentions them
+        self.interest_terms: Dict[str, float] = {}
+        for tier, weight in _INTEREST_TIERS.items():
+            self._add_terms(interests.get(tier) or [], weight)
+        self._add_terms(learned.get("additional_interests") or [], 1.0)
+        self._add_terms((profile.get("identity") or {}).get("tech_stack") or [], _TECH_STACK_WEIGHT)
+        if not self.interest_terms:
+            self._add_terms(DEFAULT_INTERESTS, 1.0)
+
+        self.skip_keywords = [str(k).lower() for k in filters.get("skip_keywords") or []]
+        self.trusted_sources = [_handle(s) for s in filters.get("trusted_sources") or []]
+        self.low_priority_sources = [_handle(s) for s in filters.get("low_priority_sources") or []]
+        self.freshness_hours = float(filters.get("freshness_days") or 3) * 24
+
+        self.keyword_adjustments = {
+            str(k).lower(): float(v) for k, v in (learned.get("keyword_adjustments") or {}).items()
+        }
+        self.source_adjustments = {
+            _handle(k): float(v) for k, v in (learned.get("source_adjustments") or {}).items()
+        }
+        self.now = now
+
+    @classmethod
+    def from_files(
+        cls,
+        profile_path: Optional[str] = None,
+        feedback_path: Optional[str] = None
+    ) -> "PreRanker":
+        """Create a ranker from the profile and feedback files.
+
+        Missing or unreadable files are treated as empty.
+
+        Args:
+            profile_path: Profile file (or from USER_PROFILE_PATH env)
+            feedback_path: Feedback file (or from USER_FEEDBACK_PATH env)
+        """
+        return cls(
+            _load_yaml(profile_path or os.getenv("USER_PROFILE_PATH", "configs/profile.yaml")),
+            _load_yaml(feedback_path or os.getenv("USER_FEEDBACK_PATH", "configs/feedback.yaml"))
+        )
+
+    def _add_terms(self, phrases: Iterable[str], weight: float):
+        for phrase in phrases:
+            for term in terms(str(phrase)):
+                if len(term) > 1 and weight > self.interest_terms.get(term, 0):
+                    self.interest_terms[term] = weight
+
+    def score(self, item: Dict[str, Any], cluster_size: int = 1) -> float:
+        """Score one item.
+
+        Args:
+            item: Content item
+            cluster_size: Items in the item's topic cluster
+
+        Returns:
+            Score from 0 to 100
+        """
+        text = f"{item.get('title', '')} {_content(item)[:2000]}".lower()
+        if any(keyword in text for keyword in self.skip_keywords):
+            return 0.0
+
+        item_terms = set(terms(text))
+        hits = sum(weight for term, weight in self.interest_terms.items() if term in item_terms)
+        actions = sum(1 for keyword in ACTION_KEYWORDS if keyword in text)
+
+        components = {
+            "topic_relevance": 1 - math.exp(-hits / 3),
+            "source_trust": self._source_trust(item),
+            "actionability": 1 - math.exp(-actions / 2),
+            "freshness": self._freshness(item),
+            "engagement": _engagement(item),
+            "uniqueness": 1 / math.sqrt(max(1, cluster_size)),
+        }
+        score = 100 * sum(self.weights[name] * value for name, value in components.items())
+
+        feedback = sum(adj for keyword, adj in self.keyword_adjustments.items() if keyword in text)
+        score += max(-_MAX_FEEDBACK_POINTS, min(_MAX_FEEDBACK_POINTS, feedback * _FEEDBACK_POINTS))
+        return max(0.0, min(100.0, score))
+
+    def rank(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Sort items by score, best first, and store it as ``rank_score``.
+
+        Args:
+            items: Content items
+
+        Returns:
+            New list in score order; ties keep their original order
+        """
+        sizes: Dict[Any, int] = {}
+        for item in items:
+            if item.get("cluster_id", -1) >= 0:
+                sizes[item["cluster_id"]] = sizes.get(item["cluster_id"], 0) + 1
+
+        for item in items:
+            item["rank_score"] = round(self.score(item, sizes.get(item.get("cluster_id"), 1)), 1)
+        return sorted(items, key=lambda item: -item["rank_score"])
+
+    def select(
+        self,
+        items: List[Dict[str, Any]],
+        max_items: int,
+        token_budget: int,
+        count_tokens: Optional[Callable[[str], int]] = None
+    ) -> List[Dict[str, Any]]:
+        """Pick the best-scoring items within an item count and token budget.
+
+        Items are taken in score order; one that does not fit the remaining
+        budget is passed over for smaller, lower-scoring ones.
+
+        Args:
+            items: Content items
+            max_items: Maximum items selected
+            token_budget: Maximum tokens of the selected titles and content
+            count_tokens: Token counter (default: the Gemini estimator)
+
+        Returns:
+            Selected items in their original order
+        """
+        if count_tokens is None:
+            from ..llm.tokens import get_estimator
+            count_tokens = get_estimator("gemini").count
+
+        chosen = set()
+        used = 0
+        for item in self.rank(items):
+            if len(chosen) >= max_items:
+                break
+            cost = count_tokens(f"{item.get('title', '')}\n{_content(item)[:_LLM_CONTENT_CHARS]}")
+            if used + cost > token_budget:
+                continue
+            used += cost
+            chosen.add(id(item))
+
+        return [item for item in items if id(item) in chosen]
+
+    def _source_trust(self, item: Dict[str, Any]) -> float:
+        """1 for trusted sources, 0 for low-priority ones, 0.5 otherwise."""
+        names = " ".join([str(item.get("source", "")), _authors(item), str(item.get("url", ""))]).lower()
+
+        trust = 0.5
+        if any(source and source in names for source in self.trusted_sources):
+            trust = 1.0
+        elif any(source and source in names for source in self.low_priority_sources):
+            trust = 0.0
+
+        trust += 0.1 * sum(adj for source, adj in self.source_adjustments.items() if source and source in names)
+        return max(0.0, min(1.0, trust))
+
+    def _freshness(self, item: Dict[str, Any]) -> float:
+        """Halves every freshness_days; 0.5 when the date is unknown."""
+        published = _published(item)
+        if published is None:
+            return 0.5
+        now = self.now or datetime.now(timezone.utc)
+        age_hours = max(0.0, (now - published).total_seconds() / 3600)
+        return 0.5 ** (age_hours / self.freshness_hours)
+
+
+def _load_yaml(path: str) -> Dict[str, Any]:
+    file = Path(path)
+    if not file.exists():
+        return {}
+    try:
+        with open(file, encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError) as e:
+        logger.warning(f"Could not read {file}: {e}")
+        return {}
+
+
+def _handle(source: str) -> str:
+    """Normalize a source or account name for substring matching."""
+    return str(source).strip().lstrip("@").lower()
+
+
+def _content(item: Dict[str, Any]) -> str:
+    return str(item.get("content") or item.get("content_text") or item.get("description") or "")
+
+
+def _authors(item: Dict[str, Any]) -> str:
+    authors = item.get("authors") or item.get("author") or ""
+    if isinstance(authors, list):
+        return " ".join(a.get("name", "") if isinstance(a, dict) else str(a) for a in authors)
+    return str(authors)
+
+
+def _metadata(item: Dict[str, Any]) -> Dict[str, Any]:
+    return item.get("metadata") or (item.get("details") or {}).get("metadata") or item.get("_metadata") or {}
+
+
+def _published(item: Dict[str, Any]) -> Optional[datetime]:
+    """Publication time as an aware datetime; naive values are local time."""
+    for field in ("published_at", "date_published", "published_date", "date"):
+        value = item.get(field)
+        if not value:
+            continue
+        if not isinstance(value, datetime):
+            try:
+                value = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+            except ValueError:
+                continue
+        return value if value.tzinfo else value.astimezone()
+    return None
+
+
+def _engagement(item: Dict[str, Any]) -> float:
+    """Log-scaled engagement from metadata counters, 0 to 1."""
+    metadata = _metadata(item)
+    total = 0.0
+    for field, weight in ENGAGEMENT_FIELDS.items():
+        value = metadata.get(field, item.get(field))
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+            total += weight * value
+    return min(1.0, math.log1p(total) / math.log1p(_ENGAGEMENT_SATURATION))
@@ -0,0 +1,304 @@
+"""Near-duplicate detection for short texts such as titles."""
+
+import re
+import random
+import hashlib
+import unicodedata
+from typing import List, Dict, Set, Optional, Tuple, FrozenSet, Iterable, Union
+
+# Characters written without spaces between words
+_CJK_RUN = re.compile(
+    r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]+'
+)
+_WORD = re.compile(r'[^\W_]+')
+
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'is', 'are',
+})
+
+# Mersenne prime for universal hashing of 64-bit shingle hashes
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def terms(text: str, size: int = 2) -> List[str]:
+    """Split text into CJK character n-grams and Latin words, with repeats.
+
+    Args:
+        text: Text to split
+        size: Character n-gram length for CJK runs
+
+    Returns:
+        Terms in order of appearance
+    """
+    if not text:
+        return []
+
+    text = unicodedata.normalize("NFKC", text).lower()
+    result: List[str] = []
+
+    for run in _CJK_RUN.findall(text):
+        if len(run) <= size:
+            result.append(run)
+        else:
+            result.extend(run[i:i + size] for i in range(len(run) - size + 1))
+
+    # Whatever is left is space-delimited text
+    for word in _WORD.findall(_CJK_RUN.sub(" ", text)):
+        if word not in STOP_WORDS:
+            result.append(word)
+
+    return result
+
+
+def shingles(text: str, size: int = 2) -> FrozenSet[str]:
+    """Split text into CJK character n-grams and Latin words.
+
+    Args:
+        text: Text to shingle
+        size: Character n-gram length for CJK runs
+
+    Returns:
+        Set of shingles
+    """
+    return frozenset(terms(text, size))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two shingle sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """Compute MinHash signatures with a fixed family of hash functions."""
+
+    def __init__(self, num_perm: int = 64, seed: int = 1):
+        """Initialize the hash family.
+
+        Args:
+            num_perm: Signature length
+            seed: Seed for the hash family; signatures are only comparable
+                when produced with the same seed and length
+        """
+        self.num_perm = num_perm
+        rng = random.Random(seed)
+        self._perms: List[Tuple[int, int]] = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(num_perm)
+        ]
+
+    def signature(self, shingle_set: FrozenSet[str]) -> List[int]:
+        """Compute the MinHash signature of a shingle set.
+
+        Args:
+            shingle_set: Shingles to hash
+
+        Returns:
+            List of num_perm minimum hash values
+        """
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+            for s in shingle_set
+        ]
+        if not hashes:
+            return [_MAX_HASH] * self.num_perm
+
+        return [
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._perms
+        ]
+
+
+def choose_bands(threshold: float, num_perm: int, min_recall: float = 0.95) -> Tuple[int, int]:
+    """Pick an LSH (bands, rows) split for a similarity threshold.
+
+    Uses the most rows per band (fewest false candidates) that still makes
+    a pair at exactly ``threshold`` a candidate with ``min_recall``
+    probability.
+
+    Args:
+        threshold: Jaccard similarity that should be detected
+        num_perm: Signature length
+        min_recall: Required detection probability at the threshold
+
+    Returns:
+        Tuple of (bands, rows)
+    """
+    for rows in range(num_perm, 0, -1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands >= min_recall:
+            return bands, rows
+    return num_perm, 1
+
+
+class NearDuplicateIndex:
+    """MinHash LSH index of titles with exact Jaccard verification.
+
+    Titles are split with shingles(), which handles Chinese (CJK character
+    n-grams) and English (lowercase words). Signatures are bucketed with
+    locality-sensitive hashing, so a lookup only compares against the
+    titles sharing a bucket instead of the whole history.
+
+    Band keys are stable across processes, so callers can persist them
+    with each entry and re-add entries on startup without recomputing
+    signatures.
+
+    Example:
+        index = NearDuplicateIndex(threshold=0.7)
+        index.add("a1", "OpenAI 发布 GPT-5 模型")
+        index.find("OpenAI 正式发布 GPT-5 模型")  # "a1"
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.7,
+        num_perm: int = 64,
+        shingle_size: int = 2,
+        min_shingles: int = 3
+    ):
+        """Initialize the index.
+
+        Args:
+            threshold: Jaccard similarity at or above which titles are duplicates
+            num_perm: MinHash signature length
+            shingle_size: Character n-gram length for CJK text
+            min_shingles: Titles with fewer shingles are never matched
+        """
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.min_shingles = min_shingles
+        self.hasher = MinHasher(num_perm)
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+        # Band keys are only comparable between indexes with equal params
+        self.params = f"{num_perm}x{self.rows}/{shingle_size}/{min_shingles}"
+
+        self._buckets: Dict[str, Set[str]] = {}
+        self._entries: Dict[str, Tuple[str, List[str]]] = {}
+        self._shingle_cache: Dict[str, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def band_keys(self, text: str) -> List[str]:
+        """Compute the LSH bucket keys of a text.
+
+        Args:
+            text: Text to index
+
+        Returns:
+            One key per band, or an empty list for texts too short to match
+        """
+        shingle_set = shingles(text, self.shingle_size)
+        if len(shingle_set) < self.min_shingles:
+            return []
+
+        signature = self.hasher.signature(shingle_set)
+        keys = []
+        for band in range(self.bands):
+            values = signature[band * self.rows:(band + 1) * self.rows]
+            digest = hashlib.blake2b(
+                b"".join(v.to_bytes(4, "little") for v in values),
+                digest_size=8,
+                person=band.to_bytes(2, "little")
+            ).hexdigest()
+            keys.append(f"{band}:{digest}")
+        return keys
+
+    def add(self, key: str, text: str, band_keys: Optional[List[str]] = None) -> List[str]:
+        """Add a text to the index.
+
+        Args:
+            key: Unique entry key
+            text: Text to index
+            band_keys: Previously computed band keys, if persisted
+
+        Returns:
+            The band keys used, for the caller to persist
+        """
+        if band_keys is None:
+            band_keys = self.band_keys(text)
+
+        self.remove(key)
+        self._entries[key] = (text, band_keys)
+        for band_key in band_keys:
+            self._buckets.setdefault(band_key, set()).add(key)
+        return band_keys
+
+    def remove(self, key: str):
+        """Remove an entry from the index."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        self._shingle_cache.pop(key, None)
+        for band_key in entry[1]:
+            bucket = self._buckets.get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band_key]
+
+    def find(self, text: str, band_keys: Optional[List[str]] = None) -> Optional[str]:
+        """Find an indexed entry similar to a text.
+
+        Args:
+            text: Text to look up
+            band_keys: Band keys of the text, if already computed
+
+        Returns:
+            Key of the most similar entry at or above the threshold, or None
+        """
+        if band_keys is None:
+            band_keys = self.band_keys(text)
+        if not band_keys:
+            return None
+
+        candidates: Set[str] = set()
+        for band_key in band_keys:
+            candidates.update(self._buckets.get(band_key, ()))
+
+        return self.best_match(
+            text, ((key, self._shingles_of(key)) for key in candidates)
+        )
+
+    def best_match(
+        self,
+        text: str,
+        candidates: Iterable[Tuple[str, Union[str, FrozenSet[str]]]]
+    ) -> Optional[str]:
+        """Pick the candidate most similar to a text, if any reach the threshold.
+
+        Used by callers that keep the LSH buckets elsewhere (e.g. on disk).
+
+        Args:
+            text: Text to compare
+            candidates: (key, text or shingle set) pairs
+
+        Returns:
+            Key of the best candidate at or above the threshold, or None
+        """
+        shingle_set = shingles(text, self.shingle_size)
+        best_key, best_score = None, self.threshold
+        for key, other in candidates:
+            if isinstance(other, str):
+                other = shingles(other, self.shingle_size)
+            score = jaccard(shingle_set, other)
+            if score >= best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def _shingles_of(self, key: str) -> FrozenSet[str]:
+        """Shingles of an indexed entry, computed on first comparison."""
+        cached = self._shingle_cache.get(key)
+        if cached is None:
+            cached = shingles(self._entries[key][0], self.shingle_size)
+            self._shingle_cache[key] = cached
+        return cached
@@ -6,26 +6,34 @@ import time
 import hmac
 import hashlib
 import base64
-import aiohttp
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
 
+from ..net import SessionManager
+
 logger = logging.getLogger(__name__)
 
 
 class FeishuRenderer:
     """Render and send reports to Feishu."""
 
-    def __init__(self, webhook_url: str = None, secret: str = None):
+    def __init__(
+        self,
+        webhook_url: str = None,
+        secret: str = None,
+        session_manager: Optional[SessionManager] = None
+    ):
         """Initialize Feishu renderer.
 
         Args:
             webhook_url: Feishu webhook URL
             secret: Optional secret key for signature verification
+            session_manager: Optional shared HTTP session manager
         """
         self.webhook_url = webhook_url or os.getenv("FEISHU_WEBHOOK")
         self.secret = secret or os.getenv("FEISHU_SECRET")
+        self.session_manager = session_manager
 
         if not self.webhook_url:
             raise ValueError("Feishu webhook URL is required")
@@ -76,8 +84,9 @@ class FeishuRenderer:
                 card["sign"] = sign
                 logger.debug(f"Added signature: timestamp={timestamp}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
+            async with SessionManager.scoped(self.session_manager) as http:
+                async with http.request(
+                    "POST",
                     self.webhook_url,
                     json=card,
                     headers={"Content-Type": "application/json"}
@@ -284,8 +293,9 @@ class FeishuRenderer:
                 payload["sign"] = sign
                 logger.debug(f"Added signature: timestamp={timestamp}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
+            async with SessionManager.scoped(self.session_manager) as http:
+                async with http.request(
+                    "POST",
                     self.webhook_url,
                     json=payload,
                     headers={"Content-Type": "application/json"}
@@ -1,20 +1,27 @@
 """Telegram renderer for reports."""
 
 import os
-import aiohttp
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 import logging
 
+from ..net import SessionManager
+
 logger = logging.getLogger(__name__)
 
 
 class TelegramRenderer:
     """Render and send reports to Telegram."""
 
-    def __init__(self, bot_token: str = None, chat_id: str = None):
+    def __init__(
+        self,
+        bot_token: str = None,
+        chat_id: str = None,
+        session_manager: Optional[SessionManager] = None
+    ):
         self.bot_token = bot_token or os.getenv("TELEGRAM_BOT_TOKEN")
         self.chat_id = chat_id or os.getenv("TELEGRAM_CHAT_ID")
+        self.session_manager = session_manager
 
         if not self.bot_token or not self.chat_id:
             raise ValueError("Telegram bot token and chat ID are required")
@@ -34,11 +41,12 @@ class TelegramRenderer:
             # Convert report to Telegram format
             messages = self._format_for_telegram(report_data)
 
-            # Send messages (split if too long)
-            for message in messages:
-                success = await self._send_message(message)
-                if not success:
-                    return False
+            # Send messages (split if too long) over one connection pool
+            async with SessionManager.scoped(self.session_manager) as http:
+                for message in messages:
+                    success = await self._send_message(message, http=http)
+                    if not success:
+                        return False
 
             logger.info("Successfully sent report to Telegram")
             return True
@@ -47,12 +55,18 @@ class TelegramRenderer:
             logger.error(f"Error sending to Telegram: {e}")
             return False
 
-    async def _send_message(self, text: str, parse_mode: str = "Markdown") -> bool:
+    async def _send_message(
+        self,
+        text: str,
+        parse_mode: str = "Markdown",
+        http: Optional[SessionManager] = None
+    ) -> bool:
         """Send a single message to Telegram.
 
         Args:
             text: Message text
             parse_mode: Parse mode (Markdown or HTML)
+            http: Session manager to send with (defaults to the injected one)
 
         Returns:
             True if successful
@@ -69,8 +83,9 @@ class TelegramRenderer:
                 "disable_web_page_preview": False
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
+            async with SessionManager.scoped(http or self.session_manager) as http:
+                async with http.request(
+                    "POST",
                     f"{self.api_base}/sendMessage",
                     json=payload
                 ) as response:
@@ -82,7 +97,7 @@ class TelegramRenderer:
                         logger.error(f"Telegram API error: {result}")
                         # Try with plain text if markdown fails
                         if parse_mode != "":
-                            return await self._send_message(text, parse_mode="")
+                            return await self._send_message(text, parse_mode="", http=http)
                         return False
 
         except Exception as e:
@@ -10,6 +10,7 @@ logger = logging.getLogger(__name__)
 
 try:
     import aiohttp
+    from ...net import SessionManager
     HAS_AIOHTTP = True
 except ImportError:
     HAS_AIOHTTP = False
@@ -30,7 +31,8 @@ class KVStorage:
         account_id: Optional[str] = None,
         namespace_id: Optional[str] = None,
         api_token: Optional[str] = None,
-        default_ttl: int = 86400 * 7  # 7 days
+        default_ttl: int = 86400 * 7,  # 7 days
+        session_manager: Optional["SessionManager"] = None
     ):
         """Initialize KV storage.
 
@@ -39,6 +41,7 @@ class KVStorage:
             namespace_id: KV namespace ID (or from CF_KV_NAMESPACE_ID env)
             api_token: API token (or from CF_API_TOKEN env)
             default_ttl: Default TTL in seconds for raw data
+            session_manager: Optional shared HTTP session manager
 
         Raises:
             ValueError: If credentials are missing
@@ -54,6 +57,7 @@ class KVStorage:
         self.namespace_id = namespace_id or os.getenv("CF_KV_NAMESPACE_ID")
         self.api_token = api_token or os.getenv("CF_API_TOKEN")
         self.default_ttl = default_ttl
+        self.session_manager = session_manager
 
         if not all([self.account_id, self.namespace_id, self.api_token]):
             raise ValueError(
@@ -101,11 +105,12 @@ class KVStorage:
             **(metadata or {})
         }
 
-        async with aiohttp.ClientSession() as session:
+        async with SessionManager.scoped(self.session_manager) as http:
             url = f"{self.base_url}/values/{key}"
             params = {"expiration_ttl": self.default_ttl}
 
-            async with session.put(
+            async with http.request(
+                "PUT",
                 url,
                 headers=self.headers,
                 json=data,
@@ -139,11 +144,12 @@ class KVStorage:
             "data": data
         }
 
-        async with aiohttp.ClientSession() as session:
+        async with SessionManager.scoped(self.session_manager) as http:
             url = f"{self.base_url}/values/{key}"
             params = {"expiration_ttl": self.default_ttl * 2}  # Keep longer
 
-            async with session.put(
+            async with http.request(
+                "PUT",
                 url,
                 headers=self.headers,
                 json=payload,
@@ -171,14 +177,15 @@ class KVStorage:
         date_str = datetime.now().strftime("%Y-%m-%d")
         key = f"report-{date_str}"
 
-        async with aiohttp.ClientSession() as session:
+        async with SessionManager.scoped(self.session_manager) as http:
             url = f"{self.base_url}/values/{key}"
             params = {"expiration_ttl": 86400 * 30}  # 30 days for reports
 
             # Store as plain text for markdown
             headers = {**self.headers, "Content-Type": "text/plain; charset=utf-8"}
 
-            async with session.put(
+            async with http.request(
+                "PUT",
                 url,
                 headers=headers,
                 data=content.encode('utf-8'),
@@ -209,13 +216,14 @@ class KVStorage:
             for i in range(days_to_check)
         ]
 
-        async with aiohttp.ClientSession() as session:
+        async with SessionManager.scoped(self.session_manager) as http:
             for date_str in dates:
                 # List keys with prefix
                 list_url = f"{self.base_url}/keys"
                 params = {"prefix": date_str}
 
-                async with session.get(
+                async with http.request(
+                    "GET",
                     list_url,
                     headers=self.headers,
                     params=params
@@ -232,7 +240,7 @@ class KVStorage:
                             continue
 
                         value_url = f"{self.base_url}/values/{key}"
-                        async with session.get(value_url, headers=self.headers) as vresp:
+                        async with http.request("GET", value_url, headers=self.headers) as vresp:
                             if vresp.status == 200:
                                 data = await vresp.json()
                                 all_items.extend(data.get("items", []))
@@ -258,11 +266,12 @@ class KVStorage:
         """
         results = []
 
-        async with aiohttp.ClientSession() as session:
+        async with SessionManager.scoped(self.session_manager) as http:
             list_url = f"{self.base_url}/keys"
             params = {"prefix": pattern}
 
-            async with session.get(
+            async with http.request(
+                "GET",
                 list_url,
                 headers=self.headers,
                 params=params
@@ -274,7 +283,7 @@ class KVStorage:
                 # Fetch each key
                 for key in keys:
                     value_url = f"{self.base_url}/values/{key}"
-                    async with session.get(value_url, headers=self.headers) as vresp:
+                    async with http.request("GET", value_url, headers=self.headers) as vresp:
                         if vresp.status == 200:
                             data = await vresp.json()
                             results.append(data)
@@ -1,11 +1,28 @@
 """Unit tests for data collectors."""
 
 import pytest
-from datetime import datetime, timedelta
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch, AsyncMock
-import json
-
-from daily_ai_insight.collectors import create_from_preset
+import aiohttp
+from aiohttp import web, ClientResponseError
+
+from daily_ai_insight.collectors import (
+    create_from_preset,
+    CollectionScheduler,
+    CursorStore,
+    HTTPCache,
+    GitHubTrendingCollector,
+    RSSCollector,
+    RequestCoalescer,
+    request_key,
+    post_page,
+)
+from daily_ai_insight.net import SessionManager, get_pacer
+from daily_ai_insight.processors import DataCleaner, Deduplicator
+from daily_ai_insight.processors.dedup_store import CONTENT
 from daily_ai_insight.collectors.utils import (
     get_random_user_agent,
     is_date_within_last_days,
@@ -49,6 +66,27 @@ class TestUtils:
         assert "<strong>" not in text
         assert "alert" not in text
 
+    def test_strip_html_text_nodes(self):
+        """Each text node becomes a line; entities, CDATA and skipped tags match BeautifulSoup."""
+        html = (
+            "<p>First &amp; <b>bold</b></p>\n\n<p>Second<br>line</p>"
+            "<style>p { color: red }</style><![CDATA[raw]]><template>hidden</template>"
+            "<ruby>漢<rt>kan</rt></ruby><!-- note -->tail"
+        )
+        assert strip_html(html) == "First &\nbold\nSecond\nline\nraw\n漢\ntail"
+        assert strip_html("plain\n \n\ntext ") == "plain\n\ntext"
+        assert strip_html("") == ""
+
+    def test_strip_html_memoized(self):
+        """Identical HTML is parsed once."""
+        from daily_ai_insight.collectors import html_text
+
+        html_text.clear_cache()
+        html = "<p>cached entry</p>"
+        with patch.object(html_text, "_extract", wraps=html_text._extract) as extract:
+            assert strip_html(html) == strip_html(html) == "cached entry"
+        assert extract.call_count == 1
+
     def test_escape_html(self):
         """Test HTML escaping."""
         text = '<script>alert("test")</script>'
@@ -213,3 +251,633 @@ class TestCollectorIntegration:
             assert len(transformed) == 1
             assert transformed[0]["type"] == "reddit"
             assert "Test Title" in html
+
+
+class TestCollectionScheduler:
+    """Test concurrent collection scheduling."""
+
+    class SlowCollector:
+        """Minimal collector double that sleeps before returning items."""
+
+        def __init__(self, name, delay, api_url="", fail=False):
+            self.name = name
+            self.delay = delay
+            self.api_url = api_url
+            self.fail = fail
+            self.source_type = name
+
+        async def fetch(self):
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("boom")
+            return {"items": [{"id": self.name}]}
+
+        def transform(self, raw_data, source_type):
+            return raw_data["items"]
+
+    @pytest.mark.asyncio
+    async def test_runs_concurrently(self):
+        """Wall-clock time is close to the slowest collector."""
+        collectors = [self.SlowCollector(f"c{i}", 0.2) for i in range(5)]
+        scheduler = CollectionScheduler(max_concurrency=5, per_host_concurrency=5, timeout=5)
+
+        started = time.monotonic()
+        results = await scheduler.run(collectors)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.6
+        assert [r.items[0]["id"] for r in results] == [f"c{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self):
+        """Collectors sharing a host are serialized by the host limit."""
+        collectors = [
+            self.SlowCollector(f"c{i}", 0.1, api_url="https://api.follow.is/entries")
+            for i in range(3)
+        ]
+        scheduler = CollectionScheduler(max_concurrency=10, per_host_concurrency=1, timeout=5)
+
+        started = time.monotonic()
+        await scheduler.run(collectors)
+
+        assert time.monotonic() - started >= 0.3
+
+    @pytest.mark.asyncio
+    async def test_timeout_and_errors_are_isolated(self):
+        """A slow or failing collector does not affect the others."""
+        collectors = [
+            self.SlowCollector("slow", 5),
+            self.SlowCollector("broken", 0, fail=True),
+            self.SlowCollector("ok", 0),
+        ]
+        finished = []
+        scheduler = CollectionScheduler(max_concurrency=3, per_host_concurrency=3, timeout=0.2)
+
+        results = await scheduler.run(collectors, on_finish=finished.append)
+
+        assert isinstance(results[0].error, TimeoutError)
+        assert isinstance(results[1].error, RuntimeError)
+        assert results[2].ok and len(results[2].items) == 1
+        assert len(finished) == 3
+
+
+def fast_pacing(monkeypatch):
+    """Start from fresh pacers that do not space requests."""
+    monkeypatch.setattr("daily_ai_insight.net.pacing._pacers", {})
+    monkeypatch.setenv("HTTP_PACE_INITIAL_INTERVAL", "0")
+    monkeypatch.setenv("HTTP_PACE_MIN_INTERVAL", "0")
+
+
+class FakeFollowAPI:
+    """Session manager double serving Follow.is entries newest first."""
+
+    def __init__(self, entries, page_size=2, throttled=0):
+        self.entries = entries
+        self.page_size = page_size
+        self.throttled = throttled
+        self.calls = []
+        self.content_calls = []
+
+    @asynccontextmanager
+    async def request(self, method, url, params=None, **kwargs):
+        body = kwargs.get("json")
+        if method == "GET":
+            # Single entry with content, as used by two-phase fetching
+            self.content_calls.append(params["id"])
+            entry = next(e for e in self.entries if e["id"] == params["id"])
+            resp = Mock(status=200)
+            resp.json = AsyncMock(return_value={"data": {"entries": entry, "feeds": {"title": "Feed"}}})
+            yield resp
+            return
+
+        self.calls.append(body)
+        if self.throttled:
+            self.throttled -= 1
+            yield Mock(status=429, headers={"Retry-After": "0"})
+            return
+
+        after = body.get("publishedAfter")
+        pool = [e for e in self.entries if not after or e["publishedAt"] < after]
+        if not body.get("withContent", True):
+            pool = [{k: v for k, v in e.items() if k != "content"} for e in pool]
+
+        resp = Mock(status=200)
+        resp.json = AsyncMock(return_value={
+            "data": [
+                {"entries": e, "feeds": {"title": "Feed"}}
+                for e in pool[:self.page_size]
+            ]
+        })
+        yield resp
+
+
+class TestIncrementalFetch:
+    """Test cursor-based incremental Follow.is fetching."""
+
+    @pytest.fixture
+    def mock_env(self, monkeypatch):
+        """Mock environment variables."""
+        monkeypatch.setenv("REDDIT_LIST_ID", "test_list_id")
+        monkeypatch.setenv("FOLO_FETCH_PAGES", "5")
+        monkeypatch.setenv("FOLO_FILTER_DAYS", "3")
+        fast_pacing(monkeypatch)
+
+    @staticmethod
+    def make_entry(idx, hours_ago):
+        published = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+        return {
+            "id": f"entry_{idx}",
+            "url": f"https://example.com/{idx}",
+            "title": f"Entry {idx}",
+            "content": f"<p>Content {idx}</p>",
+            "publishedAt": published.isoformat().replace("+00:00", "Z"),
+        }
+
+    @pytest.mark.asyncio
+    async def test_second_run_fetches_only_new_entries(self, mock_env, tmp_path):
+        """A rerun stops paginating at the first known entry."""
+        entries = [self.make_entry(i, hours_ago=i) for i in range(1, 6)]
+        store = CursorStore(path=str(tmp_path / "cursors.json"))
+
+        api = FakeFollowAPI(entries)
+        collector = create_from_preset("reddit", session_manager=api, cursor_store=store)
+        first = await collector.fetch()
+        assert len(first["items"]) == 5
+
+        # One new entry arrives
+        api = FakeFollowAPI([self.make_entry(0, hours_ago=0)] + entries)
+        collector = create_from_preset(
+            "reddit",
+            session_manager=api,
+            cursor_store=CursorStore(path=str(tmp_path / "cursors.json"))
+        )
+        second = await collector.fetch()
+
+        assert [item["id"] for item in second["items"]] == ["entry_0"]
+        assert len(api.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_deferred_cursor_waits_for_commit(self, mock_env, tmp_path):
+        """Without commit() a rerun fetches the same entries again."""
+        entries = [self.make_entry(i, hours_ago=i) for i in range(1, 4)]
+        path = str(tmp_path / "cursors.json")
+
+        for expected in (3, 3):
+            store = CursorStore(path=path, auto_commit=False)
+            collector = create_from_preset(
+                "reddit", session_manager=FakeFollowAPI(entries), cursor_store=store
+            )
+            assert len((await collector.fetch())["items"]) == expected
+
+        assert store.commit() == 1
+        collector = create_from_preset(
+            "reddit",
+            session_manager=FakeFollowAPI(entries),
+            cursor_store=CursorStore(path=path)
+        )
+        assert (await collector.fetch())["items"] == []
+
+    @pytest.mark.asyncio
+    async def test_stops_at_filter_window(self, mock_env):
+        """Pagination stops once a page reaches entries older than the window."""
+        entries = [self.make_entry(i, hours_ago=i * 24) for i in range(1, 10)]
+        api = FakeFollowAPI(entries)
+
+        collector = create_from_preset("reddit", session_manager=api)
+        result = await collector.fetch()
+
+        assert len(result["items"]) == 2
+        assert len(api.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_throttled_page_is_retried(self, mock_env):
+        """A 429 slows the shared pacer and the same page is requested again."""
+        entries = [self.make_entry(i, hours_ago=i) for i in range(1, 3)]
+        api = FakeFollowAPI(entries, throttled=1)
+
+        collector = create_from_preset("reddit", session_manager=api)
+        interval = collector.pacer.interval
+        result = await collector.fetch()
+
+        assert len(result["items"]) == 2
+        assert api.calls[0] == api.calls[1]
+        assert collector.pacer.stats()["throttled"] == 1
+        assert collector.pacer.interval > interval
+        # Every Follow.is collector shares the same pacer
+        assert create_from_preset("twitter").pacer is collector.pacer
+
+
+class TestTwoPhaseFetch:
+    """Test fetching content only for entries that pass the filters."""
+
+    @pytest.mark.asyncio
+    async def test_content_fetched_for_survivors_only(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("REDDIT_LIST_ID", "test_list_id")
+        monkeypatch.setenv("FOLO_FETCH_PAGES", "5")
+        fast_pacing(monkeypatch)
+
+        entries = [TestIncrementalFetch.make_entry(i, hours_ago=i) for i in range(1, 6)]
+        entries[1]["title"] = "Sponsored: buy now"
+        entries[2]["url"] = entries[0]["url"]
+        entries[4]["publishedAt"] = "2001-01-01T00:00:00Z"
+        api = FakeFollowAPI(entries)
+
+        deduper = Deduplicator(storage_path=str(tmp_path))
+        deduper.deduplicate([{"title": "Entry 4", "content": "seen before", "url": entries[3]["url"]}])
+
+        def prefilter(item):
+            return DataCleaner().prefilter(item) and not deduper.is_known(item)
+
+        collector = create_from_preset(
+            "reddit", session_manager=api, two_phase=True, prefilter=prefilter
+        )
+        items = collector.transform(await collector.fetch(), collector.source_type)
+
+        assert all(call["withContent"] is False for call in api.calls)
+        # Spam title, repeated URL, known URL and old entry cost no content request
+        assert api.content_calls == ["entry_1"]
+        assert [item["id"] for item in items] == ["entry_1"]
+        assert items[0]["description"] == "Content 1"
+        deduper.close()
+
+    @pytest.mark.asyncio
+    async def test_default_mode_requests_content(self, monkeypatch):
+        monkeypatch.setenv("REDDIT_LIST_ID", "test_list_id")
+        monkeypatch.setenv("FOLO_FETCH_PAGES", "1")
+        monkeypatch.delenv("FOLO_TWO_PHASE", raising=False)
+        fast_pacing(monkeypatch)
+        api = FakeFollowAPI([TestIncrementalFetch.make_entry(1, hours_ago=1)])
+
+        collector = create_from_preset("reddit", session_manager=api)
+        items = collector.transform(await collector.fetch(), collector.source_type)
+
+        assert api.calls[0]["withContent"] is True
+        assert api.content_calls == []
+        assert items[0]["description"] == "Content 1"
+
+
+class TestRequestCoalescer:
+    """Test single-flight coalescing of Follow.is page requests."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_run_once(self, tmp_path):
+        coalescer = RequestCoalescer(str(tmp_path / "pages.db"), ttl=0)
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"data": [1]}
+
+        key = request_key("https://api.follow.is/entries", {"listId": "1", "view": 1})
+        results = await asyncio.gather(*(coalescer.run(key, call) for _ in range(3)))
+
+        assert results == [{"data": [1]}] * 3
+        assert len(calls) == 1
+        assert coalescer.stats()["coalesced"] == 2
+        # ttl=0 keeps nothing once the request is done
+        assert len(coalescer) == 0
+        coalescer.close()
+
+    @pytest.mark.asyncio
+    async def test_failures_are_shared_but_not_cached(self, tmp_path):
+        coalescer = RequestCoalescer(str(tmp_path / "pages.db"), ttl=60)
+
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("down")
+
+        results = await asyncio.gather(
+            coalescer.run("k", boom), coalescer.run("k", boom), return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        async def ok():
+            return {"data": []}
+
+        assert await coalescer.run("k", ok) == {"data": []}
+        assert coalescer.counts["requests"] == 2
+        coalescer.close()
+
+    @pytest.mark.asyncio
+    async def test_post_page_paces_and_retries(self):
+        statuses = [200, 429, 200, 429]
+
+        async def handler(request):
+            status = statuses.pop(0)
+            if status != 200:
+                return web.Response(status=status, headers={"Retry-After": "0"})
+            return web.json_response({"data": [await request.json()]})
+
+        app = web.Application()
+        app.router.add_post("/entries", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/entries"
+
+        try:
+            async with aiohttp.ClientSession() as session:
+                data = await post_page(session, {"listId": "1"}, {}, url)
+                assert data == {"data": [{"listId": "1"}]}
+                # The 429 is retried on the same request
+                assert await post_page(session, {"listId": "1"}, {}, url) == data
+                with pytest.raises(ClientResponseError):
+                    await post_page(session, {"listId": "1"}, {}, url, throttle_retries=0)
+            assert get_pacer(url).stats()["throttled"] >= 1
+        finally:
+            await runner.cleanup()
+
+    def test_key_ignores_body_order(self):
+        url = "https://api.follow.is/entries"
+        assert request_key(url, {"listId": "1", "view": 1}) == request_key(url, {"view": 1, "listId": "1"})
+        assert request_key(url, {"listId": "1"}) != request_key(url, {"listId": "1", "publishedAfter": "x"})
+
+    @pytest.mark.asyncio
+    async def test_collectors_share_list_pages(self, monkeypatch, tmp_path):
+        """Two presets on the same list fetch each page once and transform it separately."""
+        monkeypatch.setenv("REDDIT_LIST_ID", "shared_list")
+        monkeypatch.setenv("MIXED_LIST_ID", "shared_list")
+        monkeypatch.setenv("FOLO_FETCH_PAGES", "2")
+        fast_pacing(monkeypatch)
+        entries = [TestIncrementalFetch.make_entry(i, hours_ago=i) for i in range(1, 5)]
+        api = FakeFollowAPI(entries)
+        coalescer = RequestCoalescer(str(tmp_path / "pages.db"))
+
+        reddit = create_from_preset("reddit", session_manager=api, coalescer=coalescer)
+        mixed = create_from_preset("mixed", session_manager=api, coalescer=coalescer)
+        results = await asyncio.gather(reddit.fetch(), mixed.fetch())
+
+        assert [len(result["items"]) for result in results] == [4, 4]
+        assert len(api.calls) == 2
+        assert coalescer.counts["requests"] == 2
+        coalescer.close()
+
+
+class TestStreaming:
+    """Test the streaming collector API."""
+
+    class PagedCollector:
+        """Collector double that yields items in pages."""
+
+        def __init__(self, name, pages, fail_after=None):
+            self.name = name
+            self.pages = pages
+            self.fail_after = fail_after
+            self.api_url = ""
+
+        async def stream(self):
+            for page, items in enumerate(self.pages):
+                if self.fail_after is not None and page >= self.fail_after:
+                    raise RuntimeError("boom")
+                await asyncio.sleep(0.01)
+                for item in items:
+                    yield item
+
+    TITLES = ["Open weights model tops leaderboard", "Chip export rules tightened again",
+              "Robotics startup raises seed round"]
+
+    @classmethod
+    def make_item(cls, idx):
+        return {
+            "id": f"item_{idx}",
+            "title": cls.TITLES[idx % len(cls.TITLES)] + f" {idx}",
+            "content": f"Body text for item {idx} " * 5,
+            "url": f"https://example.com/{idx}",
+        }
+
+    @pytest.mark.asyncio
+    async def test_follow_stream_yields_per_page(self, monkeypatch):
+        """The first page is yielded before later pages are requested."""
+        monkeypatch.setenv("REDDIT_LIST_ID", "test_list_id")
+        monkeypatch.setenv("FOLO_FETCH_PAGES", "5")
+        fast_pacing(monkeypatch)
+        entries = [TestIncrementalFetch.make_entry(i, hours_ago=i) for i in range(1, 6)]
+        api = FakeFollowAPI(entries)
+        collector = create_from_preset("reddit", session_manager=api)
+
+        stream = collector.stream()
+        first = await stream.__anext__()
+        assert first["id"] == "entry_1"
+        assert first["type"] == collector.source_type
+        assert len(api.calls) == 1
+
+        rest = [item async for item in stream]
+        assert len(rest) == 4
+
+    @pytest.mark.asyncio
+    async def test_scheduler_stream_bounded_buffer(self):
+        """All items arrive through a small buffer and partial failures keep earlier pages."""
+        collectors = [
+            self.PagedCollector("a", [[self.make_item(i)] for i in range(5)]),
+            self.PagedCollector("b", [[self.make_item(10)], [self.make_item(11)]], fail_after=1),
+        ]
+        finished = []
+        scheduler = CollectionScheduler(
+            max_concurrency=2, per_host_concurrency=2, timeout=5, stream_buffer=1
+        )
+
+        items = [item async for item in scheduler.stream(collectors, on_finish=finished.append)]
+
+        assert sorted(i["id"] for i in items) == sorted(
+            [f"item_{i}" for i in range(5)] + ["item_10"]
+        )
+        results = {r.collector.name: r for r in finished}
+        assert results["a"].ok and results["a"].count == 5
+        assert isinstance(results["b"].error, RuntimeError) and results["b"].count == 1
+
+    @pytest.mark.asyncio
+    async def test_clean_and_dedup_streams(self, tmp_path):
+        """Cleaner and deduplicator consume a stream and drop duplicates."""
+        items = [self.make_item(i) for i in range(3)] + [self.make_item(1)]
+        scheduler = CollectionScheduler(max_concurrency=1, per_host_concurrency=1, timeout=5)
+        deduper = Deduplicator(storage_path=str(tmp_path))
+
+        stream = scheduler.stream([self.PagedCollector("a", [items[:2], items[2:]])])
+        stream = DataCleaner().clean_stream(stream)
+        unique = [item async for item in deduper.deduplicate_stream(stream)]
+
+        assert [item["id"] for item in unique] == ["item_0", "item_1", "item_2"]
+        assert deduper.store.count(CONTENT) == 3
+
+
+@pytest.fixture
+async def etag_server():
+    """Serve a JSON list with an ETag; the "up" flag simulates outages."""
+    state = {"requests": 0, "conditional": 0, "up": True, "etag": '"v1"'}
+
+    async def handler(request):
+        state["requests"] += 1
+        if not state["up"]:
+            return web.Response(status=503)
+        if request.headers.get("If-None-Match") == state["etag"]:
+            state["conditional"] += 1
+            return web.Response(status=304)
+        projects = [{"author": "octo", "name": "repo", "url": "https://github.com/octo/repo"}]
+        return web.json_response(projects, headers={"ETag": state["etag"]})
+
+    app = web.Application()
+    app.router.add_get("/trending", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/trending", state
+
+    await runner.cleanup()
+
+
+class TestHTTPCache:
+    """Test the conditional-GET response cache."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_revalidated_and_stale(self, etag_server, tmp_path):
+        url, state = etag_server
+        cache = HTTPCache(str(tmp_path / "http.db"), default_ttl=60)
+
+        async with SessionManager() as http:
+            first = await cache.fetch(http, url)
+            assert not first.from_cache and first.json()[0]["name"] == "repo"
+
+            # Within the TTL: no request at all
+            assert (await cache.fetch(http, url)).from_cache
+            assert state["requests"] == 1
+
+            # Expired: revalidated with If-None-Match and answered by a 304
+            revalidated = await cache.fetch(http, url, ttl=0)
+            assert revalidated.from_cache and not revalidated.stale
+            assert state["conditional"] == 1
+
+            # Source down: the stored body is served as stale
+            state["up"] = False
+            stale = await cache.fetch(http, url, ttl=0)
+            assert stale.stale and stale.json() == first.json()
+
+        assert cache.stats()["stale"] == 1
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_failure_without_cached_copy(self, etag_server, tmp_path):
+        url, state = etag_server
+        state["up"] = False
+        cache = HTTPCache(str(tmp_path / "http.db"))
+
+        async with SessionManager() as http:
+            with pytest.raises(ClientResponseError):
+                await cache.fetch(http, url)
+        assert len(cache) == 0
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_github_trending_uses_cache(self, etag_server, tmp_path, monkeypatch):
+        url, state = etag_server
+        monkeypatch.setenv("GITHUB_TRENDING_API", url)
+        cache = HTTPCache(str(tmp_path / "http.db"))
+
+        async with SessionManager() as http:
+            collector = GitHubTrendingCollector(session_manager=http, http_cache=cache)
+            assert [item["title"] for item in await collector.fetch()] == ["octo/repo"]
+            assert [item["title"] for item in await collector.fetch()] == ["octo/repo"]
+
+        assert state["requests"] == 1
+        cache.close()
+
+
+RSS_FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>{name}</title>
+<item><title>{name} news</title><link>https://example.com/{name}/1</link>
+<description>&lt;p&gt;New open-source agent framework&lt;/p&gt;</description>
+<pubDate>{recent}</pubDate></item>
+<item><title>{name} archive</title><link>https://example.com/{name}/2</link>
+<description>Old post</description><pubDate>Mon, 01 Jan 2001 00:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+@pytest.fixture
+async def rss_server():
+    """Serve RSS feeds at /<name>.xml; /slow.xml answers late, /down.xml fails."""
+    recent = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+    async def handler(request):
+        name = request.match_info["name"]
+        if name == "down":
+            return web.Response(status=503)
+        if name == "slow":
+            await asyncio.sleep(0.3)
+        return web.Response(
+            text=RSS_FEED.format(name=name, recent=recent),
+            content_type="application/rss+xml"
+        )
+
+    app = web.Application()
+    app.router.add_get("/{name}.xml", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}"
+
+    await runner.cleanup()
+
+
+class TestRSSCollector:
+    """Test the RSS fallback collector."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_unified_items(self, rss_server):
+        sources = [
+            {"name": "alpha", "url": f"{rss_server}/alpha.xml", "category": "technology"},
+            {"name": "down", "url": f"{rss_server}/down.xml"},
+        ]
+        collector = RSSCollector(sources=sources)
+        items = collector.transform(await collector.fetch(), collector.source_type)
+
+        # The failing feed is skipped and old entries are dropped
+        assert [item["title"] for item in items] == ["alpha news"]
+        item = items[0]
+        assert item["url"] == "https://example.com/alpha/1"
+        assert item["source"] == "alpha"
+        assert item["description"] == item["content"] == "New open-source agent framework"
+        assert item["details"]["category"] == "technology"
+        assert item["published_date"].endswith("+00:00")
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_fast_feeds_first(self, rss_server):
+        sources = [
+            {"name": "slow", "url": f"{rss_server}/slow.xml"},
+            {"name": "fast", "url": f"{rss_server}/fast.xml"},
+        ]
+        collector = RSSCollector(sources=sources)
+
+        started = time.monotonic()
+        titles = [item["title"] async for item in collector.stream()]
+        assert titles == ["fast news", "slow news"]
+        # Feeds are fetched concurrently
+        assert time.monotonic() - started < 0.6
+
+    @pytest.mark.asyncio
+    async def test_preset_reads_sources_file(self, rss_server, tmp_path):
+        config = tmp_path / "sources.yaml"
+        config.write_text(
+            f"fallback_sources:\n  - name: beta\n    url: {rss_server}/beta.xml\n",
+            encoding="utf-8"
+        )
+        cache = HTTPCache(str(tmp_path / "http.db"))
+
+        async with SessionManager() as http:
+            collector = create_from_preset(
+                "rss", config_path=str(config), session_manager=http, http_cache=cache
+            )
+            assert isinstance(collector, RSSCollector)
+            items = [item async for item in collector.stream()]
+            assert [item["title"] for item in items] == ["beta news"]
+            # Second run is served from the cache
+            assert len([item async for item in collector.stream()]) == 1
+
+        assert cache.stats()["fresh"] == 1
+        cache.close()
@@ -0,0 +1,667 @@
+"""Unit tests for the LLM content analyzer."""
+
+import json
+import time
+import asyncio
+import importlib.util
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from daily_ai_insight.llm import ContentAnalyzer, LLMCache, CachedProvider
+from daily_ai_insight.llm.providers.gemini import GeminiProvider
+from daily_ai_insight.llm.tokens import TokenEstimator, get_estimator
+from daily_ai_insight.llm.rate_limit import RateLimiter, is_rate_limited, retry_after
+from daily_ai_insight.llm.router import HedgedRouter
+from daily_ai_insight.llm.providers.replay import ReplayProvider, ReplayError
+from daily_ai_insight.llm.parsing import extract_json, is_repaired, salvage
+from daily_ai_insight.llm.schemas import BatchFilterItem
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+class FakeProvider:
+    """Provider double that scores items by a keyword in their title."""
+
+    def __init__(self, drop_ids=(), fail_batches=False):
+        self.drop_ids = set(drop_ids)
+        self.fail_batches = fail_batches
+        self.prompts = []
+
+    async def analyze(self, prompt, max_retries=3):
+        self.prompts.append(prompt)
+        if '"id"' not in prompt.split("Evaluation criteria")[0]:
+            return {"include": "robotics" in prompt, "relevance_score": 0}
+        if self.fail_batches:
+            return {"text": "not json"}
+
+        items = json.loads(prompt[prompt.index("["):prompt.index("]\n") + 1])
+        return {"results": [
+            {"id": item["id"], "include": "robotics" in item["title"], "relevance_score": 0}
+            for item in items
+            if item["id"] not in self.drop_ids
+        ]}
+
+
+@pytest.fixture
+def analyzer(monkeypatch, tmp_path):
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "llm_cache.db"))
+    return ContentAnalyzer(filter_batch_size=4, filter_concurrency=2)
+
+
+def make_items(count):
+    return [
+        {"title": f"{'robotics' if i % 2 else 'cooking'} story {i}", "content": "weekly notes"}
+        for i in range(count)
+    ]
+
+
+class TestRelevanceFilter:
+    """Test batched relevance filtering."""
+
+    @pytest.mark.asyncio
+    async def test_batches_map_back_by_id(self, analyzer):
+        analyzer.provider = FakeProvider()
+        items = [{"title": "New LLM released", "content": ""}] + make_items(10)
+
+        kept = await analyzer.filter_relevant_content(items)
+
+        # Keyword match first, then odd-numbered items, in input order
+        assert [item["title"] for item in kept] == [
+            "New LLM released", "robotics story 1", "robotics story 3", "robotics story 5",
+            "robotics story 7", "robotics story 9",
+        ]
+        assert len(analyzer.provider.prompts) == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_results_fall_back_per_item(self, analyzer):
+        analyzer.provider = FakeProvider(drop_ids={1, 2})
+        kept = await analyzer.filter_relevant_content(make_items(4))
+
+        assert [item["title"] for item in kept] == ["robotics story 1", "robotics story 3"]
+        # One batch prompt plus one prompt per dropped item
+        assert len(analyzer.provider.prompts) == 3
+
+    @pytest.mark.asyncio
+    async def test_unparseable_batch_falls_back(self, analyzer):
+        analyzer.provider = FakeProvider(fail_batches=True)
+        kept = await analyzer.filter_relevant_content(make_items(4))
+
+        assert [item["title"] for item in kept] == ["robotics story 1", "robotics story 3"]
+        assert len(analyzer.provider.prompts) == 5
+
+
+class MapReduceProvider:
+    """Provider double that summarizes chunks and merges partial analyses."""
+
+    def __init__(self, fail_reduce=False):
+        self.fail_reduce = fail_reduce
+        self.analyzed = []
+        self.reduce_calls = 0
+
+    def count_tokens(self, text):
+        return len(text) // 4
+
+    async def analyze(self, prompt, max_retries=3):
+        if "## Partial Analyses" in prompt:
+            self.reduce_calls += 1
+            if self.fail_reduce:
+                raise RuntimeError("reduce failed")
+            body = prompt.split("## Partial Analyses\n\n")[1].split("\n\n## Merge")[0]
+            partials = json.loads(body)
+            return {
+                "executive_summary": "merged",
+                "key_points": [point for p in partials for point in p["key_points"]],
+            }
+
+        body = prompt.split("## Today's Content Data\n\n")[1].split("\n\n## Analysis Tasks")[0]
+        chunk = json.loads(body)
+        self.analyzed.extend(entry["title"] for entry in chunk)
+        return {
+            "executive_summary": f"{len(chunk)} items",
+            "key_points": [{"title": entry["title"], "importance": "high"} for entry in chunk[:1]],
+            "trend_analysis": {"current_trends": ["agents"]},
+        }
+
+
+class TestMapReduceAnalysis:
+    """Test token-budgeted map-reduce analysis."""
+
+    @staticmethod
+    def make_items(count):
+        return [
+            {"title": f"item {i}", "content": "x" * 400, "url": f"https://example.com/{i}"}
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_all_items_are_analyzed(self, analyzer):
+        analyzer.provider = MapReduceProvider()
+        analyzer.analysis_chunk_tokens = 2000
+        items = self.make_items(120)
+
+        analysis = await analyzer.analyze_content(items)
+
+        assert analyzer.provider.analyzed == [item["title"] for item in items]
+        chunks = len(analysis["key_points"])
+        assert chunks > 4
+        assert analysis["executive_summary"] == "merged"
+        assert analyzer.provider.reduce_calls >= 1
+
+    @pytest.mark.asyncio
+    async def test_small_input_is_one_call(self, analyzer):
+        analyzer.provider = MapReduceProvider()
+        analysis = await analyzer.analyze_content(self.make_items(3))
+
+        assert analysis["executive_summary"] == "3 items"
+        assert analyzer.provider.reduce_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_reduce_merges_locally(self, analyzer):
+        analyzer.provider = MapReduceProvider(fail_reduce=True)
+        analyzer.analysis_chunk_tokens = 2000
+
+        analysis = await analyzer.analyze_content(self.make_items(30))
+
+        assert len(analysis["key_points"]) == len(analysis["executive_summary"].split("\n\n"))
+        assert analysis["trend_analysis"] == {"current_trends": ["agents"]}
+
+
+class SummaryProvider:
+    """Provider double answering batch summary prompts."""
+
+    def __init__(self, drop_ids=()):
+        self.drop_ids = set(drop_ids)
+        self.batch_calls = 0
+        self.single_calls = 0
+
+    async def analyze(self, prompt, max_retries=3):
+        self.batch_calls += 1
+        items = json.loads(prompt[prompt.index("["):prompt.index("]\n") + 1])
+        return {"summaries": [
+            {"id": item["id"], "summary": f"summary of {item['title']}"}
+            for item in items
+            if item["id"] not in self.drop_ids
+        ]}
+
+    async def generate_text(self, prompt, max_tokens=2048):
+        self.single_calls += 1
+        return "single summary"
+
+
+class TestSummarizeMany:
+    """Test batched per-item summaries."""
+
+    @pytest.mark.asyncio
+    async def test_batches_in_order_with_fallback(self, analyzer):
+        analyzer.provider = SummaryProvider(drop_ids={2})
+        analyzer.summary_batch_size = 4
+        items = make_items(10)
+
+        summaries = await analyzer.summarize_many(items)
+
+        assert summaries[0] == "summary of cooking story 0"
+        assert summaries[9] == "summary of robotics story 9"
+        # id 2 is missing from the two full batch responses
+        assert summaries[2] == summaries[6] == "single summary"
+        assert analyzer.provider.batch_calls == 3
+        assert analyzer.provider.single_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_and_repeated_items_cost_nothing(self, analyzer):
+        analyzer.provider = SummaryProvider()
+        items = make_items(3)
+        await analyzer.summarize_many(items)
+
+        provider = SummaryProvider()
+        analyzer.provider = provider
+        summaries = await analyzer.summarize_many(items + items[:1])
+
+        assert summaries[3] == summaries[0] == "summary of cooking story 0"
+        assert provider.batch_calls == 0 and provider.single_calls == 0
+
+
+class CountingProvider:
+    """Provider double that counts calls."""
+
+    model_name = "fake-1"
+    generation_config = {"temperature": 0.7}
+
+    def __init__(self):
+        self.calls = 0
+
+    async def analyze(self, prompt, max_retries=3):
+        self.calls += 1
+        if "truncated" in prompt:
+            return extract_json('{"results": [{"id": 0}, {"id": 1, "incl')
+        return {"text": prompt} if "garbled" in prompt else {"answer": prompt}
+
+    async def generate_text(self, prompt, max_tokens=2048):
+        self.calls += 1
+        return f"{prompt}:{max_tokens}"
+
+
+class TestLLMCache:
+    """Test the persistent response cache."""
+
+    @pytest.mark.asyncio
+    async def test_hits_survive_reopen(self, tmp_path):
+        path = str(tmp_path / "cache.db")
+        inner = CountingProvider()
+        provider = CachedProvider(inner, LLMCache(path))
+        assert await provider.analyze("p1") == {"answer": "p1"}
+        assert await provider.generate_text("p1", max_tokens=10) == "p1:10"
+        provider.cache.close()
+
+        cache = LLMCache(path)
+        provider = CachedProvider(inner, cache)
+        assert await provider.analyze("p1") == {"answer": "p1"}
+        assert await provider.generate_text("p1", max_tokens=10) == "p1:10"
+        # A different generation setting is a different entry
+        assert await provider.generate_text("p1", max_tokens=20) == "p1:20"
+
+        assert inner.calls == 3
+        assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unparsed_responses_not_cached(self, tmp_path):
+        inner = CountingProvider()
+        provider = CachedProvider(inner, LLMCache(str(tmp_path / "cache.db")))
+        await provider.analyze("garbled")
+        await provider.analyze("garbled")
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_repaired_responses_not_cached(self, tmp_path):
+        inner = CountingProvider()
+        provider = CachedProvider(inner, LLMCache(str(tmp_path / "cache.db")))
+        assert await provider.analyze("truncated") == {"results": [{"id": 0}, {"id": 1}]}
+        await provider.analyze("truncated")
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_report_script_does_not_cache_repaired_responses(self, monkeypatch, tmp_path):
+        import google.generativeai as genai
+
+        spec = importlib.util.spec_from_file_location(
+            "generate_daily_report", ROOT / "scripts" / "generate_daily_report.py"
+        )
+        script = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(script)
+
+        class TruncatingModel:
+            calls = 0
+
+            def __init__(self, name):
+                pass
+
+            def generate_content(self, prompt, generation_config=None):
+                TruncatingModel.calls += 1
+                return SimpleNamespace(text='[{"idx": 0, "score": 80}, {"idx": 1, "sco')
+
+        monkeypatch.setattr(genai, "configure", lambda **kwargs: None)
+        monkeypatch.setattr(genai, "GenerativeModel", TruncatingModel)
+        monkeypatch.setenv("LLM_CACHE_PATH", str(tmp_path / "cache.db"))
+        items = [{"title": f"story {i}", "content": "notes"} for i in range(2)]
+
+        for _ in range(2):
+            await script.classify_and_score_items([dict(item) for item in items], {}, {})
+        assert TruncatingModel.calls == 2
+        assert len(LLMCache(str(tmp_path / "cache.db"))) == 0
+
+    def test_ttl_and_lru_eviction(self, tmp_path):
+        cache = LLMCache(str(tmp_path / "cache.db"), ttl_days=1, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+
+        # "b" was least recently used
+        assert cache.get("b") is None
+        assert len(cache) == 2
+
+        assert cache.prune(now=time.time() + 2 * 86400) == 2
+        assert cache.get("a") is None
+
+
+class SlowModel:
+    """GenerativeModel double whose calls take a fixed time."""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def generate_content(self, prompt, generation_config=None, request_options=None):
+        time.sleep(self.delay)
+        return type("Response", (), {"text": f"sync:{prompt}"})()
+
+    async def generate_content_async(self, prompt, generation_config=None, request_options=None):
+        await asyncio.sleep(self.delay)
+        return type("Response", (), {"text": f"async:{prompt}"})()
+
+
+class TestGeminiProvider:
+    """Test that Gemini calls do not block the event loop."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_async_client", [True, False])
+    async def test_calls_overlap_with_other_work(self, use_async_client):
+        provider = GeminiProvider(
+            api_key="test-key",
+            max_concurrency=3,
+            use_async_client=use_async_client,
+            limiter=RateLimiter(requests_per_minute=60000)
+        )
+        provider.model = SlowModel(0.2)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        started = time.perf_counter()
+        texts = await asyncio.gather(*(provider.generate_text(f"p{i}") for i in range(3)))
+        elapsed = time.perf_counter() - started
+        task.cancel()
+        provider.close()
+
+        prefix = "async" if use_async_client else "sync"
+        assert texts == [f"{prefix}:p0", f"{prefix}:p1", f"{prefix}:p2"]
+        assert elapsed < 0.5
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_call_timeout(self):
+        provider = GeminiProvider(api_key="test-key", timeout=0.05, limiter=RateLimiter(requests_per_minute=60000))
+        provider.model = SlowModel(1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await provider.generate_text("slow")
+
+
+class TestTokenEstimator:
+    """Test local token estimation."""
+
+    def test_chinese_costs_more_than_length_over_four(self):
+        text = "英伟达发布新一代 GPU 架构，训练性能提升四倍"
+        assert get_estimator("openai").count(text) > len(text) // 4 * 2
+        assert get_estimator("openai").count(text) > get_estimator("gemini").count(text)
+
+    def test_english_estimate(self):
+        text = "Researchers publish a survey of agent benchmarks and evaluation methods."
+        assert 12 <= TokenEstimator().count(text) <= 24
+
+    def test_counts_are_memoized(self):
+        estimator = TokenEstimator()
+        entry = {"title": "item", "content": "text " * 50}
+        first = estimator.count_json(entry)
+        assert estimator.count_json(entry) == first
+        assert estimator.cache_info().hits == 1
+
+    def test_provider_counts_locally(self):
+        provider = GeminiProvider(api_key="test-key")
+        provider.model = None  # any API call would fail
+        assert provider.count_tokens("hello world") == get_estimator("gemini").count("hello world")
+
+
+class RateLimitError(Exception):
+    """Stand-in for an SDK 429 error carrying response headers."""
+
+    status_code = 429
+
+    def __init__(self, headers):
+        super().__init__("429 Too Many Requests")
+        self.response = type("Response", (), {"headers": headers})()
+
+
+class TestRateLimiter:
+    """Test request pacing and adaptation to 429 responses."""
+
+    @pytest.mark.asyncio
+    async def test_paces_requests(self):
+        # 1200 requests/min with no burst: one request every 50ms
+        limiter = RateLimiter(requests_per_minute=1200, burst_seconds=0.05)
+        started = time.perf_counter()
+        for _ in range(5):
+            await limiter.acquire()
+        assert time.perf_counter() - started >= 0.18
+
+    @pytest.mark.asyncio
+    async def test_token_ceiling(self):
+        limiter = RateLimiter(requests_per_minute=60000, tokens_per_minute=60000, burst_seconds=0.1)
+        await limiter.acquire(tokens=100)
+        started = time.perf_counter()
+        await limiter.acquire(tokens=100)
+        # 100 tokens at 1000 tokens/s
+        assert time.perf_counter() - started >= 0.08
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_pauses_and_recovers(self):
+        limiter = RateLimiter(requests_per_minute=60000, increase_step=0.25)
+        limiter.on_rate_limited(0.1)
+        assert limiter.requests_per_minute == 30000
+
+        started = time.perf_counter()
+        await limiter.acquire()
+        assert time.perf_counter() - started >= 0.09
+
+        limiter.on_success()
+        limiter.on_success()
+        assert limiter.requests_per_minute == 60000
+        assert limiter.stats()["rate_limited"] == 1
+
+    def test_retry_after_parsing(self):
+        assert is_rate_limited(RateLimitError({}))
+        assert not is_rate_limited(ValueError("bad"))
+        assert retry_after(RateLimitError({"retry-after": "3"})) == 3.0
+        assert retry_after(RateLimitError({"retry-after-ms": "250"})) == 0.25
+        assert retry_after(RateLimitError({})) is None
+
+    @pytest.mark.asyncio
+    async def test_provider_retries_after_429(self):
+        class ThrottledModel:
+            calls = 0
+
+            async def generate_content_async(self, prompt, generation_config=None, request_options=None):
+                self.calls += 1
+                if self.calls == 1:
+                    raise RateLimitError({"retry-after": "0.05"})
+                return type("Response", (), {"text": '{"ok": true}'})()
+
+        limiter = RateLimiter(requests_per_minute=60000)
+        provider = GeminiProvider(api_key="test-key", limiter=limiter)
+        provider.model = ThrottledModel()
+
+        assert await provider.analyze("prompt") == {"ok": True}
+        assert provider.model.calls == 2
+        assert limiter.stats()["rate_limited"] == 1
+
+
+class TimedProvider:
+    """Provider double with scripted latencies and failures."""
+
+    def __init__(self, name, delays, fail=False):
+        self.name = name
+        self.delays = list(delays)
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate_text(self, prompt, max_tokens=2048):
+        delay = self.delays[min(self.calls, len(self.delays) - 1)]
+        self.calls += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        return self.name
+
+
+class TestHedgedRouter:
+    """Test hedging and failover between providers."""
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged(self):
+        primary = TimedProvider("primary", [0.01] * 5 + [1.0])
+        secondary = TimedProvider("secondary", [0.01])
+        router = HedgedRouter(primary, secondary, min_samples=5, max_hedge_ratio=0.5)
+
+        for _ in range(5):
+            assert await router.generate_text("p") == "primary"
+        assert secondary.calls == 0
+
+        started = time.perf_counter()
+        assert await router.generate_text("p") == "secondary"
+        assert time.perf_counter() - started < 0.5
+        await asyncio.sleep(0)
+        assert primary.cancelled == 1
+        assert router.summary()["hedge_wins"] == 1
+        # The cancelled primary call still counts as a slow sample
+        assert max(router.stats[id(primary)].latencies) >= 0.01
+        assert len(router.stats[id(primary)].latencies) == 6
+
+    @pytest.mark.asyncio
+    async def test_hedges_are_capped(self):
+        primary = TimedProvider("primary", [0.01] * 5 + [0.2])
+        secondary = TimedProvider("secondary", [0.01])
+        router = HedgedRouter(primary, secondary, min_samples=5, max_hedge_ratio=0.1)
+
+        for _ in range(8):
+            await router.generate_text("p")
+        # 8 calls allow one hedge
+        assert router.hedges == 1
+
+    @pytest.mark.asyncio
+    async def test_failover_and_unhealthy_primary(self):
+        primary = TimedProvider("primary", [0.0], fail=True)
+        secondary = TimedProvider("secondary", [0.0])
+        router = HedgedRouter(primary, secondary, min_samples=3)
+
+        for _ in range(3):
+            assert await router.generate_text("p") == "secondary"
+        assert router.failovers == 3
+
+        # The failing primary is now tried second
+        assert await router.generate_text("p") == "secondary"
+        assert primary.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_both_failing_raises(self):
+        router = HedgedRouter(
+            TimedProvider("primary", [0.0], fail=True),
+            TimedProvider("secondary", [0.0], fail=True)
+        )
+        with pytest.raises(RuntimeError, match="primary failed"):
+            await router.generate_text("p")
+
+    @pytest.mark.asyncio
+    async def test_invalid_none_response_is_returned(self):
+        class NoneProvider:
+            async def generate_text(self, prompt, max_tokens=2048):
+                return None
+
+        router = HedgedRouter(NoneProvider(), NoneProvider())
+        assert await router.generate_text("p") is None
+
+
+class TestReplayProvider:
+    """Test recording, replaying and synthetic responses."""
+
+    @pytest.mark.asyncio
+    async def test_record_then_replay(self, tmp_path):
+        cassette = str(tmp_path / "cassette.jsonl.gz")
+        inner = CountingProvider()
+        recorder = ReplayProvider(cassette, mode="record", inner=inner)
+        assert await recorder.analyze("p1") == {"answer": "p1"}
+        assert await recorder.generate_text("p2", max_tokens=5) == "p2:5"
+        recorder.close()
+
+        replayer = ReplayProvider(cassette)
+        assert await replayer.analyze("p1") == {"answer": "p1"}
+        assert await replayer.generate_text("p2", max_tokens=5) == "p2:5"
+        assert replayer.stats["replayed"] == 2
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_synthetic_batch_responses(self, analyzer):
+        analyzer.provider = ReplayProvider(mode="fake")
+        items = make_items(10)
+
+        first = await analyzer.filter_relevant_content(items)
+        second = await analyzer.filter_relevant_content(items)
+
+        assert first == second
+        # One batch prompt per batch, no per-item fallback needed
+        assert analyzer.provider.stats["calls"] == 6
+        analysis = await analyzer.analyze_content(items)
+        assert analysis["key_points"][0]["title"] == "cooking story 0"
+
+    @pytest.mark.asyncio
+    async def test_synthetic_batch_summaries(self, analyzer):
+        analyzer.provider = ReplayProvider(mode="fake")
+        analyzer.summary_batch_size = 4
+        summaries = await analyzer.summarize_many(make_items(10))
+
+        assert summaries[0] == "Synthetic summary of cooking story 0"
+        assert summaries[9] == "Synthetic summary of robotics story 9"
+        # One call per batch, no per-item fallback
+        assert analyzer.provider.stats["calls"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_injection(self):
+        provider = ReplayProvider(mode="fake", failure_rate=1.0)
+        with pytest.raises(ReplayError):
+            await provider.generate_text("p")
+
+
+class TestParsing:
+    """Test tolerant JSON extraction and schema salvage."""
+
+    def test_strips_fences_and_prose(self):
+        text = 'Here you go:\n```json\n{"a": [1, 2,], "b": "x}y"}\n```\nHope this helps'
+        assert extract_json(text) == {"a": [1, 2], "b": "x}y"}
+        assert extract_json('Result: [1, 2] as requested') == [1, 2]
+        assert extract_json("no json here") is None
+
+    def test_repairs_truncated_output(self):
+        text = '```json\n{"results": [{"id": 0, "include": true}, {"id": 1, "incl'
+        assert extract_json(text) == {"results": [{"id": 0, "include": True}, {"id": 1}]}
+        assert extract_json('[{"id": 0, "s": "ok"}, {"id": 1, "s": "trunc') == [{"id": 0, "s": "ok"}, {"id": 1}]
+        assert is_repaired(extract_json(text))
+        assert not is_repaired(extract_json('{"a": [1, 2,]}'))
+
+    def test_prose_is_not_repaired_to_empty_container(self):
+        assert extract_json("Sorry [policy]") is None
+        assert extract_json("I can't help with {that") is None
+
+    def test_salvage_skips_invalid_entries(self):
+        data = {"results": [{"id": "0", "include": True}, {"include": False}, "junk", {"id": 2}]}
+        assert [entry["id"] for entry in salvage(data, "results", BatchFilterItem)] == [0, 2]
+        assert salvage({"text": "oops"}, "results", BatchFilterItem) == []
+
+    @pytest.mark.asyncio
+    async def test_batch_keeps_valid_entries(self, analyzer):
+        class PartialProvider(FakeProvider):
+            async def analyze(self, prompt, max_retries=3):
+                result = await super().analyze(prompt, max_retries)
+                if "results" in result:
+                    # Second entry lost its id, third a valid score
+                    result["results"][1].pop("id")
+                    result["results"][2]["relevance_score"] = "high"
+                return result
+
+        analyzer.provider = PartialProvider()
+        kept = await analyzer.filter_relevant_content(make_items(4))
+
+        assert [item["title"] for item in kept] == ["robotics story 1", "robotics story 3"]
+        # One batch prompt plus one prompt per invalid entry
+        assert len(analyzer.provider.prompts) == 3
@@ -0,0 +1,128 @@
+"""Unit tests for shared networking utilities."""
+
+import pytest
+import asyncio
+from aiohttp import web
+
+from daily_ai_insight.net import SessionManager, HostPacer, get_pacer
+from daily_ai_insight.net.session import _parse_host_map
+
+
+@pytest.fixture
+async def local_server():
+    """Serve a tiny local app and track peak concurrent requests."""
+    state = {"active": 0, "peak": 0}
+
+    async def handler(request):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.05)
+        state["active"] -= 1
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f"http://127.0.0.1:{port}/", state
+
+    await runner.cleanup()
+
+
+class TestSessionManager:
+    """Test pooled session management."""
+
+    def test_parse_host_map(self):
+        """Test parsing per-host settings."""
+        assert _parse_host_map("api.follow.is=4, Example.com=2.5") == {
+            "api.follow.is": 4.0,
+            "example.com": 2.5,
+        }
+        assert _parse_host_map("") == {}
+        assert _parse_host_map("bad,host=x") == {}
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused(self, local_server):
+        """Requests share one session until closed."""
+        url, _ = local_server
+        http = SessionManager()
+
+        async with http.request("GET", url) as resp:
+            assert (await resp.json())["ok"] is True
+        first = await http.get_session()
+
+        async with http.request("GET", url) as resp:
+            assert resp.status == 200
+        assert await http.get_session() is first
+
+        await http.close()
+        assert first.closed
+
+    @pytest.mark.asyncio
+    async def test_host_limit(self, local_server):
+        """Per-host limits cap concurrent requests."""
+        url, state = local_server
+        http = SessionManager(host_limits={"127.0.0.1": 2})
+
+        async def get():
+            async with http.request("GET", url) as resp:
+                await resp.read()
+
+        await asyncio.gather(*(get() for _ in range(6)))
+        await http.close()
+
+        assert state["peak"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_scoped(self):
+        """Scoped uses an injected manager and owns a temporary one."""
+        shared = SessionManager()
+        async with SessionManager.scoped(shared) as http:
+            assert http is shared
+        await shared.close()
+
+        async with SessionManager.scoped() as http:
+            session = await http.get_session()
+        assert session.closed
+
+
+class TestHostPacer:
+    """Test adaptive per-host request pacing."""
+
+    @pytest.mark.asyncio
+    async def test_spaces_requests(self):
+        pacer = HostPacer("example.com", initial_interval=0.1, min_interval=0.1)
+        started = asyncio.get_running_loop().time()
+        await asyncio.gather(*(pacer.acquire() for _ in range(3)))
+        assert asyncio.get_running_loop().time() - started >= 0.2
+
+    def test_adapts_to_latency(self):
+        pacer = HostPacer("example.com", initial_interval=1.0, min_interval=0.05)
+        for _ in range(5):
+            pacer.on_response(200, 0.1)
+        fast = pacer.interval
+        assert fast < 0.2
+
+        # Latency far above the baseline widens the gap again
+        assert pacer.on_response(200, 1.0) > fast
+        assert pacer.stats()["slow"] == 1
+
+    @pytest.mark.asyncio
+    async def test_throttled_pauses_callers(self):
+        pacer = HostPacer("example.com", initial_interval=0, min_interval=0)
+        pacer.on_response(429, 0.01, retry_after="0.2")
+        assert pacer.interval >= 1.0
+
+        started = asyncio.get_running_loop().time()
+        await pacer.acquire()
+        assert asyncio.get_running_loop().time() - started >= 0.15
+
+    def test_shared_per_host(self, monkeypatch):
+        monkeypatch.setattr("daily_ai_insight.net.pacing._pacers", {})
+        pacer = get_pacer("https://api.follow.is/entries")
+        assert get_pacer("api.follow.is") is pacer
+        assert get_pacer("example.com") is not pacer
@@ -0,0 +1,278 @@
+"""Unit tests for data processors."""
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from daily_ai_insight.processors import DataCleaner, Deduplicator
+from daily_ai_insight.processors.normalizer import KeywordMatcher, TextNormalizer
+from daily_ai_insight.processors.dedup_store import DedupStore, CONTENT
+from daily_ai_insight.processors.clustering import (
+    TopicClusterer,
+    HAS_NUMPY,
+    UNCLUSTERED,
+    UNCLUSTERED_LABEL,
+)
+from daily_ai_insight.processors.ranker import PreRanker
+from daily_ai_insight.processors.similarity import (
+    NearDuplicateIndex,
+    choose_bands,
+    jaccard,
+    shingles,
+)
+
+
+class TestNormalizer:
+    """Test text normalization and keyword matching."""
+
+    def test_unicode_mode_keeps_chinese(self):
+        text = "<p>OpenAI 发布  GPT-5，推理能力提升！😀\n详情: https://x.com/a?b=1</p>"
+        assert TextNormalizer().normalize(text) == "OpenAI 发布 GPT-5，推理能力提升！ 详情:"
+
+    def test_ascii_mode_matches_previous_cleaning(self):
+        """ascii mode reproduces the old multi-pass output."""
+        normalizer = TextNormalizer("ascii")
+        assert normalizer.normalize("<b>Hi</b> 中文\u3000there @you http://t.co/x<br>y") == "Hi there you"
+        assert normalizer.normalize("a\xa0b $5") == "ab 5"
+
+    def test_keyword_matcher(self):
+        matcher = KeywordMatcher(["Buy Now", "promo"])
+        assert matcher.search("Limited PROMOtion") == "promo"
+        assert matcher.search("nothing here") is None
+        assert sorted(matcher.find_all("promo: buy now")) == ["buy now", "promo"]
+
+    def test_keyword_matcher_large_set(self):
+        """Large keyword sets give the same answers whichever backend is used."""
+        keywords = [f"spam{i:02d}word" for i in range(40)]
+        matcher = KeywordMatcher(keywords)
+        assert matcher.search("contains SPAM17WORD somewhere") == "spam17word"
+        assert matcher.find_all("spam03word and spam39word") == ["spam03word", "spam39word"]
+
+    def test_cleaner_spam_filter_follows_keyword_changes(self):
+        cleaner = DataCleaner()
+        item = {"title": "Weekly roundup", "content": "Plenty of useful links here " * 3}
+        assert cleaner._should_keep_item(item)
+
+        cleaner.spam_keywords.append("roundup")
+        assert not cleaner._should_keep_item(item)
+
+
+class TestSimilarity:
+    """Test shingling and the MinHash LSH index."""
+
+    def test_cjk_shingles(self):
+        """Chinese runs become character bigrams, Latin text becomes words."""
+        result = shingles("OpenAI 发布新模型 and GPT-5")
+        assert {"发布", "布新", "新模", "模型"} <= result
+        assert {"openai", "gpt", "5"} <= result
+        assert "and" not in result
+
+    def test_choose_bands_recall(self):
+        """The band split detects pairs at the threshold with high probability."""
+        bands, rows = choose_bands(0.7, 64)
+        assert bands * rows == 64
+        assert 1 - (1 - 0.7 ** rows) ** bands >= 0.95
+
+    def test_find_near_duplicate(self):
+        """Reworded Chinese titles match; unrelated ones do not."""
+        index = NearDuplicateIndex(threshold=0.7)
+        index.add("a", "OpenAI 发布 GPT-5 模型，推理能力大幅提升")
+        index.add("b", "谷歌推出 Gemini 3，多模态能力全面升级")
+
+        assert index.find("OpenAI 正式发布 GPT-5 模型，推理能力大幅提升") == "a"
+        assert index.find("Meta 开源 Llama 4 系列大模型") is None
+        assert index.find("短标题") is None
+
+    def test_persisted_band_keys(self):
+        """Band keys from one index can be reused by another."""
+        title = "Anthropic releases new Claude model with longer context"
+        keys = NearDuplicateIndex().add("a", title)
+
+        index = NearDuplicateIndex()
+        index.add("a", title, band_keys=keys)
+        assert index.find(title) == "a"
+
+        index.remove("a")
+        assert len(index) == 0 and index.find(title) is None
+
+    def test_jaccard(self):
+        assert jaccard(frozenset("ab"), frozenset("bc")) == 1 / 3
+        assert jaccard(frozenset(), frozenset("a")) == 0.0
+
+
+def make_topic_items():
+    """Three topics, four items each, in interleaved order."""
+    topics = [
+        ("OpenAI GPT-5 模型发布", "新模型 推理 benchmark 成绩"),
+        ("AI agent 智能体框架", "智能体 工具调用 agent workflow"),
+        ("Nvidia GPU 芯片出口", "芯片 出口管制 数据中心 gpu"),
+    ]
+    return [
+        {"title": f"{topics[i % 3][0]} {i}", "content": topics[i % 3][1]}
+        for i in range(12)
+    ]
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="NumPy not installed")
+class TestClustering:
+    """Test local topic clustering."""
+
+    def test_groups_items_by_topic(self):
+        items = make_topic_items()
+        clusters = TopicClusterer(max_clusters=3).cluster(items)
+
+        assert [cluster["size"] for cluster in clusters] == [4, 4, 4]
+        for topic in range(3):
+            assert len({item["cluster_id"] for item in items[topic::3]}) == 1
+        assert "gpu" in items[2]["cluster_label"]
+
+    def test_deterministic(self):
+        first, second = make_topic_items(), make_topic_items()
+        TopicClusterer().cluster(first)
+        TopicClusterer().cluster(second)
+        assert [item["cluster_label"] for item in first] == [item["cluster_label"] for item in second]
+
+    def test_items_without_shared_terms(self):
+        items = make_topic_items() + [{"title": "zzz", "content": ""}]
+        TopicClusterer().cluster(items)
+        assert items[-1]["cluster_id"] == UNCLUSTERED
+
+    def test_group_keeps_items_added_after_clustering(self):
+        items = make_topic_items()
+        clusterer = TopicClusterer()
+        clusterer.cluster(items)
+        late = {"title": "late arrival", "content": ""}
+
+        groups = clusterer.group(items + [late])
+        assert sum(len(group) for group in groups.values()) == 13
+        assert late in groups[UNCLUSTERED_LABEL]
+
+    def test_cleaner_groups_by_cluster(self):
+        groups = DataCleaner().group_by_category(make_topic_items())
+        assert sum(len(group) for group in groups.values()) == 12
+        assert all(len(group) >= 4 for group in groups.values())
+
+
+PROFILE = {
+    "interests": {"must_track": ["AI Agent 框架"], "want_track": ["论文"]},
+    "filters": {"skip_keywords": ["抽奖"], "trusted_sources": ["@karpathy"], "freshness_days": 1},
+}
+
+
+class TestPreRanker:
+    """Test local pre-ranking."""
+
+    def test_ranks_by_profile(self):
+        now = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        ranker = PreRanker(PROFILE, {"learned_preferences": {"keyword_adjustments": {"prompt": 3}}}, now=now)
+        items = [
+            {"title": "Weekend photos", "content": "a walk", "source": "someone"},
+            {"title": "New agent framework", "content": "agent 框架 release", "source": "blog"},
+            {"title": "Agent 框架 thread", "content": "agent", "source": "Twitter @karpathy"},
+            {"title": "转发抽奖 agent 框架", "content": "", "source": "blog"},
+            {"title": "Prompt tricks", "content": "prompt prompt", "source": "blog"},
+        ]
+
+        ranked = ranker.rank(items)
+
+        assert ranked[-1]["title"] == "转发抽奖 agent 框架"
+        assert ranked[-1]["rank_score"] == 0
+        trusted = dict(items[2], source="Twitter @karpathy")
+        assert ranker.score(trusted) > ranker.score(dict(items[2], source="blog"))
+        assert items[4]["rank_score"] > items[0]["rank_score"]
+        assert ranked[0]["title"] in {"New agent framework", "Agent 框架 thread"}
+
+    def test_freshness_and_engagement(self):
+        now = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        ranker = PreRanker(PROFILE, now=now)
+        fresh = {"title": "x", "published_at": now.isoformat()}
+        stale = {"title": "x", "published_at": (now - timedelta(days=3)).isoformat()}
+        popular = {"title": "x", "published_at": now.isoformat(), "details": {"metadata": {"stars_today": 500}}}
+
+        assert ranker.score(popular) > ranker.score(fresh) > ranker.score(stale)
+
+    def test_select_within_budget(self):
+        ranker = PreRanker(PROFILE)
+        items = [
+            {"title": f"item {i}", "content": ("agent 框架 " if i % 2 else "") + "x" * 40}
+            for i in range(10)
+        ]
+
+        selected = ranker.select(items, max_items=3, token_budget=10 ** 6, count_tokens=len)
+        assert [item["title"] for item in selected] == ["item 1", "item 3", "item 5"]
+
+        # A budget of two items' text
+        cost = len(f"item 1\n{items[1]['content']}")
+        selected = ranker.select(items, max_items=10, token_budget=2 * cost, count_tokens=len)
+        assert len(selected) == 2
+
+
+class TestDeduplicator:
+    """Test deduplication against history."""
+
+    @staticmethod
+    def make_item(idx, title):
+        return {"title": title, "content": f"content {idx}", "url": f"https://example.com/{idx}"}
+
+    def test_similar_titles_across_runs(self, tmp_path):
+        """A reworded title from an earlier run is still detected."""
+        first = Deduplicator(storage_path=str(tmp_path))
+        kept = first.deduplicate([self.make_item(1, "英伟达发布新一代 Blackwell GPU 架构，训练性能提升四倍")])
+        assert len(kept) == 1
+
+        second = Deduplicator(storage_path=str(tmp_path))
+        kept = second.deduplicate([
+            self.make_item(2, "英伟达正式发布新一代 Blackwell GPU 架构：训练性能提升四倍"),
+            self.make_item(3, "字节跳动开源视频生成模型"),
+        ])
+        assert [item["url"] for item in kept] == ["https://example.com/3"]
+
+    def test_legacy_history_is_imported(self, tmp_path):
+        """A legacy JSON history is imported once, with titles indexed."""
+        history = {
+            "abc": {
+                "title": "Stanford releases open dataset for robot learning",
+                "url": "https://example.com/old",
+                "seen_at": datetime.now().isoformat(),
+            }
+        }
+        (tmp_path / "dedup_history.json").write_text(json.dumps(history))
+
+        deduper = Deduplicator(storage_path=str(tmp_path))
+        kept = deduper.deduplicate([
+            self.make_item(1, "Stanford releases open dataset for robot learning research")
+        ])
+
+        assert kept == []
+        assert not (tmp_path / "dedup_history.json").exists()
+        assert (tmp_path / "dedup_history.json.migrated").exists()
+
+    def test_expired_entries_are_pruned(self, tmp_path):
+        """Entries past the retention window are dropped and no longer match."""
+        deduper = Deduplicator(storage_path=str(tmp_path))
+        item = self.make_item(1, "Researchers publish survey of agent benchmarks")
+        assert len(deduper.deduplicate([item])) == 1
+        assert deduper.deduplicate([item]) == []
+
+        removed = deduper.store.prune(now=time.time() + 8 * 86400)
+
+        assert removed == 2
+        assert deduper.store.count() == 0
+
+
+class TestDedupStore:
+    """Test the SQLite dedup store."""
+
+    def test_entries_persist_across_connections(self, tmp_path):
+        path = str(tmp_path / "dedup.db")
+        store = DedupStore(path)
+        store.add("h1", CONTENT, title="t", url="u", band_keys=["0:ab", "1:cd"])
+        store.commit()
+        store.close()
+
+        reopened = DedupStore(path)
+        assert reopened.get_seen_at("h1", CONTENT) is not None
+        assert reopened.title_candidates(["1:cd", "2:ef"]) == [("h1", "t")]
+        assert reopened._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
@@ -226,9 +226,8 @@ class TestKVStorage:
         "CF_API_TOKEN": "test_token"
     })
     @pytest.mark.asyncio
-    @patch("daily_ai_insight.storage.backends.kv.aiohttp.ClientSession")
-    async def test_kv_save_raw(self, mock_session_cls):
-        """Test saving raw data to KV."""
+    async def test_kv_save_raw(self):
+        """Test saving raw data to KV through the shared session manager."""
         # Create mock response
         mock_response = Mock()
         mock_response.status = 200
@@ -239,19 +238,11 @@ class TestKVStorage:
         mock_resp_cm.__aenter__ = AsyncMock(return_value=mock_response)
         mock_resp_cm.__aexit__ = AsyncMock(return_value=None)
 
-        # Create mock session
-        mock_session = Mock()
-        mock_session.put = Mock(return_value=mock_resp_cm)
+        # Inject a mock session manager
+        mock_http = Mock()
+        mock_http.request = Mock(return_value=mock_resp_cm)
 
-        # Create async context manager for session
-        mock_session_cm = AsyncMock()
-        mock_session_cm.__aenter__ = AsyncMock(return_value=mock_session)
-        mock_session_cm.__aexit__ = AsyncMock(return_value=None)
-
-        # Set up ClientSession to return our mock
-        mock_session_cls.return_value = mock_session_cm
-
-        kv = KVStorage()
+        kv = KVStorage(session_manager=mock_http)
         items = [{"test": 1}]
 
         key = await kv.save_raw(items, source="test")
@@ -259,8 +250,9 @@ class TestKVStorage:
         assert "test-raw" in key
         assert datetime.now().strftime("%Y-%m-%d") in key
 
-        # Verify session.put was called
-        assert mock_session.put.called
+        # Verify a PUT was sent through the manager
+        assert mock_http.request.called
+        assert mock_http.request.call_args.args[0] == "PUT"
 
     @patch.dict("os.environ", {
         "CF_ACCOUNT_ID": "test_account",